@@ -0,0 +1,28 @@
+"""Console entry point for the music video generator.
+
+Handles ``--version`` before importing the Typer app, so scripted and
+shell-completion callers that only need the version skip the CLI's
+import cost. Only the long spelling is taken here; ``-v`` and everything
+else are dispatched to :mod:`mvg.cli`, so the app's own meaning of short
+flags always applies.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run the video-maker CLI."""
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+
+        # Same line typer.echo prints for the app's --version
+        sys.stdout.write(f"video-maker version {__version__}\n")
+        return
+
+    from .cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,11 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Generic, Iterator, TypeVar, Optional
 
 from ..services.anthropic import AnthropicClient
-from ..config import config
+from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,16 @@ InputT = TypeVar("InputT")
 OutputT = TypeVar("OutputT")
 
 
+@lru_cache(maxsize=4)
+def _shared_client(model: str) -> AnthropicClient:
+    """Return a process-wide AnthropicClient for the given model.
+
+    Agents share clients so repeated runs reuse the same pooled HTTPS
+    connections instead of opening a new one per agent.
+    """
+    return AnthropicClient(model=model)
+
+
 class BaseAgent(ABC, Generic[InputT, OutputT]):
     """Abstract base class for AI agents.
 
@@ -20,6 +31,13 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
     Subclasses must implement the `run` method and define their prompts.
     """
 
+    _logger: ClassVar[logging.Logger] = logger
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each agent class its own logger, created once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{__name__}.{cls.__name__}")
+
     def __init__(
         self,
         client: Optional[AnthropicClient] = None,
@@ -28,12 +46,12 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         """Initialize the agent.
 
         Args:
-            client: AnthropicClient instance. Created if not provided.
+            client: AnthropicClient instance. A shared client for the model
+                is used if not provided.
             model: Model to use. Defaults to config.default_model.
         """
-        self._model = model or config.default_model
-        self._client = client or AnthropicClient(model=self._model)
-        self._logger = logging.getLogger(f"{__name__}.{self.name}")
+        self._model = model or get_config().default_model
+        self._client = client or _shared_client(self._model)
 
     @property
     @abstractmethod
@@ -80,7 +98,7 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         Returns:
             The text content of Claude's response.
         """
-        self._logger.debug(f"Creating message with prompt length: {len(prompt)}")
+        self._logger.debug("Creating message with prompt length: %d", len(prompt))
 
         try:
             response = self._client.create_message(
@@ -89,9 +107,71 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
                 system=self.system_prompt,
                 temperature=temperature,
             )
-            self._logger.debug(f"Received response of length: {len(response)}")
+            self._logger.debug("Received response of length: %d", len(response))
             return response
 
         except Exception as e:
-            self._logger.error(f"Error creating message: {e}")
+            self._logger.error("Error creating message: %s", e)
+            raise
+
+    def _stream_message(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> Iterator[str]:
+        """Stream a message using the agent's client and system prompt.
+
+        Args:
+            prompt: The user prompt to send.
+            max_tokens: Maximum tokens in the response.
+            temperature: Sampling temperature.
+
+        Yields:
+            Text deltas of Claude's response.
+        """
+        self._logger.debug("Streaming message with prompt length: %d", len(prompt))
+
+        try:
+            yield from self._client.stream_message(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                system=self.system_prompt,
+                temperature=temperature,
+            )
+
+        except Exception as e:
+            self._logger.error("Error streaming message: %s", e)
+            raise
+
+    def _create_messages_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> list[str]:
+        """Create several messages in a single batch request.
+
+        Args:
+            prompts: The user prompts to send.
+            max_tokens: Maximum tokens in each response.
+            temperature: Sampling temperature.
+
+        Returns:
+            The text content of each response, in prompt order.
+        """
+        self._logger.debug("Creating message batch with %d prompts", len(prompts))
+
+        try:
+            responses = self._client.create_message_batch(
+                prompts=prompts,
+                max_tokens=max_tokens,
+                system=self.system_prompt,
+                temperature=temperature,
+            )
+            self._logger.debug("Received %d batch responses", len(responses))
+            return responses
+
+        except Exception as e:
+            self._logger.error("Error creating message batch: %s", e)
             raise
@@ -2,21 +2,208 @@
 
 import json
 import logging
+import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
 
 from ..models import Scene
 from .base import BaseAgent
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to catch the stdlib exception regardless of which parser is active.
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+# simdjson returns lazy Object/Array proxies rather than dict/list
+_JSON_OBJECT_TYPES: tuple[type, ...] = (dict,) if simdjson is None else (dict, simdjson.Object)
+_JSON_ARRAY_TYPES: tuple[type, ...] = (list,) if simdjson is None else (list, simdjson.Array)
+
+# Markers looked up while extracting JSON from a response
+_FENCE = b"```"
+_JSON_TAG = b"json"
+_OBJECT_OPEN = b"{"
+_ARRAY_OPEN = b"["
+_OPENERS = b"{["
+_BARE_OPENERS = (b"{", b"[")
+_BARE_CLOSERS = (b"}", b"]")
+_QUOTE = b'"'
+
+# Code fences and object openers, whichever appears first in a response
+_ANCHOR_RE = re.compile(rb"```|\{")
+# Brackets and string openers outside of JSON strings
+_STRUCTURAL_RE = re.compile(rb'[{}\[\]"]')
+# Remainder of a JSON string after its opening quote, honoring escapes
+_STRING_TAIL_RE = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+# One simdjson parser per thread, reused so its internal buffers are
+# allocated once instead of on every response.
+_parser_local = threading.local()
+
+
+def _parse_json(json_bytes: bytes) -> Any:
+    """Parse UTF-8 encoded JSON with the fastest available parser.
+
+    With simdjson the returned document is lazy: fields are only converted
+    to Python objects when accessed, and it stays valid until the next
+    parse on the same thread.
+
+    Raises:
+        ValueError: If the text is not valid JSON.
+    """
+    if simdjson is None:
+        return _loads(json_bytes)
+
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+
+    try:
+        return parser.parse(json_bytes)
+    except RuntimeError:
+        # A document from the previous parse is still referenced (e.g. by a
+        # traceback); simdjson refuses to reuse the parser in that case.
+        parser = _parser_local.parser = simdjson.Parser()
+        return parser.parse(json_bytes)
+
+
+def _find_json_end(buf: bytes, start: int) -> int:
+    """Find the end of the JSON object or array opening at ``buf[start]``.
+
+    Jumps between structural characters with compiled regexes instead of
+    walking every character in Python, and skips over string literals so
+    brackets inside strings are not counted.
+
+    Returns:
+        Index one past the closing bracket, or -1 if the value never closes.
+    """
+    depth = 0
+    pos = start
+    while True:
+        match = _STRUCTURAL_RE.search(buf, pos)
+        if match is None:
+            return -1
+        char = match.group()
+        if char == _QUOTE:
+            tail = _STRING_TAIL_RE.match(buf, match.end())
+            if tail is None:
+                return -1
+            pos = tail.end()
+            continue
+        if char in _OPENERS:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        pos = match.end()
+
+
+def _scale_durations(durations: np.ndarray, target: float) -> np.ndarray:
+    """Scale durations to sum to ``target``, rounded to 0.1s.
+
+    Any rounding residual is added to the last duration. Compiled with
+    Numba on the first call when it is installed.
+    """
+    total = durations.sum()
+
+    if total == 0:
+        # Distribute evenly if no durations set
+        return np.full(durations.shape[0], round(target / durations.shape[0], 1))
+
+    # Scale durations proportionally
+    scaled = np.round(durations * (target / total), 1)
+
+    # Adjust for rounding errors
+    scaled[-1] = round(scaled[-1] + (target - scaled.sum()), 1)
+    return scaled
+
+
+if numba is not None:
+    _scale_durations = numba.njit(cache=True)(_scale_durations)
+
+
+class _DeltaReader:
+    """File-like view over streamed text deltas for ijson.
+
+    Every delta read is also kept in ``chunks`` so the full response can
+    be re-parsed if incremental parsing has to be abandoned.
+    """
+
+    def __init__(self, deltas: Iterator[str]) -> None:
+        self._deltas = deltas
+        self._pending = b""
+        self.chunks: list[str] = []
+
+    def first_char(self) -> str:
+        """Return the first non-whitespace character of the stream, or ''."""
+        while True:
+            text = "".join(self.chunks).lstrip()
+            if text:
+                return text[0]
+            if not self._pull():
+                return ""
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes of the stream as UTF-8."""
+        if not self._pending:
+            self._pull()
+        if size < 0:
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def drain(self) -> str:
+        """Consume the rest of the stream and return the full text."""
+        while self._pull():
+            pass
+        return "".join(self.chunks)
+
+    def _pull(self) -> bool:
+        for delta in self._deltas:
+            if delta:
+                self.chunks.append(delta)
+                self._pending += delta.encode()
+                return True
+        return False
+
+
 # Load prompt template
-PROMPT_TEMPLATE_PATH = Path(__file__).parent.parent.parent.parent / "templates" / "prompts" / "research.txt"
+PROMPT_TEMPLATE_PATH = Path(__file__).resolve().parents[3] / "templates" / "prompts" / "research.txt"
 
 
+@lru_cache(maxsize=1)
 def _load_system_prompt() -> str:
-    """Load the system prompt from template file."""
+    """Load the system prompt from template file.
+
+    The template is read once per process; the result is cached.
+    """
     if PROMPT_TEMPLATE_PATH.exists():
         return PROMPT_TEMPLATE_PATH.read_text()
     # Fallback inline prompt if template not found
@@ -37,6 +224,40 @@ class ResearchInput:
     style: Optional[str] = None
 
 
+_PROMPT_HEAD = "Create a video scene breakdown for the following idea:\n\n"
+_PROMPT_TAIL = (
+    "\n"
+    "\n"
+    "Generate a JSON response with scene descriptions.\n"
+    "Each scene should have cinematic, visually detailed prompts suitable for AI video generation.\n"
+    "Ensure the scenes form a cohesive narrative with good pacing."
+)
+
+# One prebaked template per (has num_scenes, has style) combination, so
+# building a prompt is a single dict lookup and one f-string evaluation.
+# When no scene count is given, suggest one based on duration.
+_PROMPT_BUILDERS: dict[tuple[bool, bool], Callable[[ResearchInput], str]] = {
+    (True, True): lambda d: (
+        f"{_PROMPT_HEAD}IDEA: {d.idea}\nTOTAL DURATION: {d.duration} seconds\n"
+        f"NUMBER OF SCENES: {d.num_scenes}\nVISUAL STYLE: {d.style}{_PROMPT_TAIL}"
+    ),
+    (True, False): lambda d: (
+        f"{_PROMPT_HEAD}IDEA: {d.idea}\nTOTAL DURATION: {d.duration} seconds\n"
+        f"NUMBER OF SCENES: {d.num_scenes}{_PROMPT_TAIL}"
+    ),
+    (False, True): lambda d: (
+        f"{_PROMPT_HEAD}IDEA: {d.idea}\nTOTAL DURATION: {d.duration} seconds\n"
+        f"SUGGESTED SCENES: {max(3, d.duration // 10)} (adjust as needed for pacing)"
+        f"\nVISUAL STYLE: {d.style}{_PROMPT_TAIL}"
+    ),
+    (False, False): lambda d: (
+        f"{_PROMPT_HEAD}IDEA: {d.idea}\nTOTAL DURATION: {d.duration} seconds\n"
+        f"SUGGESTED SCENES: {max(3, d.duration // 10)} (adjust as needed for pacing)"
+        f"{_PROMPT_TAIL}"
+    ),
+}
+
+
 class ResearchAgent(BaseAgent[ResearchInput, list[Scene]]):
     """Agent for generating video scenes from an idea.
 
@@ -74,48 +295,109 @@ class ResearchAgent(BaseAgent[ResearchInput, list[Scene]]):
         # Build the user prompt
         prompt = self._build_prompt(input_data)
 
-        # Get response from Claude
-        response = self._create_message(
+        # Stream the response from Claude and parse it as it arrives
+        deltas = self._stream_message(
             prompt=prompt,
             max_tokens=4096,
             temperature=0.8,  # Higher temperature for creative output
         )
+        scenes = self._parse_stream(deltas, input_data.duration)
 
-        # Parse and validate the response
-        scenes = self._parse_response(response, input_data.duration)
-
-        self._logger.info(f"Generated {len(scenes)} scenes")
+        self._logger.info("Generated %d scenes", len(scenes))
         return scenes
 
+    def run_many(self, inputs: list[ResearchInput]) -> list[list[Scene]]:
+        """Generate scenes for several ideas with one batched request.
+
+        Uses the Message Batches API so all prompts share a single
+        submission instead of one round trip each. A single input is
+        sent through `run` directly, since batches are processed
+        asynchronously and only pay off for several requests.
+
+        Args:
+            inputs: Research inputs to generate scenes for.
+
+        Returns:
+            One list of scenes per input, in input order.
+
+        Raises:
+            ValueError: If any response cannot be parsed as valid scenes.
+        """
+        if len(inputs) <= 1:
+            return [self.run(input_data) for input_data in inputs]
+
+        self._logger.info("Generating scenes for %d ideas in one batch", len(inputs))
+
+        prompts = [self._build_prompt(input_data) for input_data in inputs]
+        responses = self._create_messages_batch(
+            prompts=prompts,
+            max_tokens=4096,
+            temperature=0.8,
+        )
+
+        return [
+            self._parse_response(response, input_data.duration)
+            for response, input_data in zip(responses, inputs)
+        ]
+
     def _build_prompt(self, input_data: ResearchInput) -> str:
         """Build the user prompt for scene generation."""
-        prompt_parts = [
-            f"Create a video scene breakdown for the following idea:",
-            f"",
-            f"IDEA: {input_data.idea}",
-            f"TOTAL DURATION: {input_data.duration} seconds",
-        ]
+        builder = _PROMPT_BUILDERS[bool(input_data.num_scenes), bool(input_data.style)]
+        return builder(input_data)
 
-        if input_data.num_scenes:
-            prompt_parts.append(f"NUMBER OF SCENES: {input_data.num_scenes}")
-        else:
-            # Suggest scene count based on duration
-            suggested = max(3, input_data.duration // 10)
-            prompt_parts.append(
-                f"SUGGESTED SCENES: {suggested} (adjust as needed for pacing)"
-            )
+    def _parse_stream(self, deltas: Iterator[str], target_duration: int) -> list[Scene]:
+        """Parse streamed response text into Scene objects.
 
-        if input_data.style:
-            prompt_parts.append(f"VISUAL STYLE: {input_data.style}")
+        When ijson is installed and the response is bare JSON, each scene is
+        built as soon as its object closes, so parsing overlaps with the
+        network transfer. Anything else (markdown fences, leading prose, a
+        missing scenes array, malformed JSON) falls back to `_parse_response`
+        on the buffered text.
 
-        prompt_parts.extend([
-            "",
-            "Generate a JSON response with scene descriptions.",
-            "Each scene should have cinematic, visually detailed prompts suitable for AI video generation.",
-            "Ensure the scenes form a cohesive narrative with good pacing.",
-        ])
+        Args:
+            deltas: Text deltas of Claude's response.
+            target_duration: Target total duration for adjusting scene times.
 
-        return "\n".join(prompt_parts)
+        Returns:
+            List of validated Scene objects.
+
+        Raises:
+            ValueError: If the response cannot be parsed as valid scenes.
+        """
+        if ijson is None:
+            return self._parse_response("".join(deltas), target_duration)
+
+        reader = _DeltaReader(deltas)
+        first = reader.first_char()
+        if first not in ("{", "["):
+            return self._parse_response(reader.drain(), target_duration)
+
+        array_prefix = "scenes" if first == "{" else ""
+        item_prefix = f"{array_prefix}.item" if array_prefix else "item"
+
+        scenes: list[Scene] = []
+        found_array = False
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(reader, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event in ("end_map", "end_array"):
+                        scenes.append(self._scene_from_data(len(scenes), builder.value))
+                        builder = None
+                elif prefix == item_prefix:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == array_prefix and event == "start_array":
+                    found_array = True
+        except ijson.JSONError as e:
+            self._logger.debug("Incremental parse failed, re-parsing buffered text: %s", e)
+            return self._parse_response(reader.drain(), target_duration)
+
+        if not found_array:
+            return self._parse_response(reader.drain(), target_duration)
+
+        return self._adjust_durations(scenes, target_duration)
 
     def _parse_response(self, response: str, target_duration: int) -> list[Scene]:
         """Parse Claude's response into Scene objects.
@@ -130,71 +412,99 @@ class ResearchAgent(BaseAgent[ResearchInput, list[Scene]]):
         Raises:
             ValueError: If response cannot be parsed as valid JSON with scenes.
         """
-        # Try to extract JSON from the response
-        json_str = self._extract_json(response)
+        # Encode once; extraction works on byte offsets so the JSON slice
+        # goes to the parser without a str round trip
+        buf = response.encode()
+        start, end = self._extract_json(buf)
 
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            self._logger.error(f"Failed to parse JSON: {e}")
-            self._logger.debug(f"Raw response: {response}")
+            data = _parse_json(buf[start:end])
+        except ValueError as e:
+            self._logger.error("Failed to parse JSON: %s", e)
+            self._logger.debug("Raw response: %s", response)
             raise ValueError(f"Invalid JSON in response: {e}")
 
         # Handle different response formats
-        scenes_data = data.get("scenes", data) if isinstance(data, dict) else data
+        scenes_data = data.get("scenes", data) if isinstance(data, _JSON_OBJECT_TYPES) else data
 
-        if not isinstance(scenes_data, list):
+        if not isinstance(scenes_data, _JSON_ARRAY_TYPES):
             raise ValueError("Response does not contain a scenes array")
 
-        # Convert to Scene objects
-        scenes: list[Scene] = []
-        for i, scene_data in enumerate(scenes_data):
-            scene = Scene(
-                id=scene_data.get("id", f"scene_{i + 1}"),
-                prompt=scene_data.get("prompt", ""),
-                duration=float(scene_data.get("duration", 5.0)),
-                source="generate",
-                overlay_text=scene_data.get("overlay_text"),
-                overlay_style=scene_data.get("overlay_style"),
-            )
-            scenes.append(scene)
+        # Convert to Scene objects, reading only the fields we use so a lazy
+        # document never materializes anything else
+        scenes = [
+            self._scene_from_data(i, scene_data) for i, scene_data in enumerate(scenes_data)
+        ]
 
         # Adjust durations to match target
         scenes = self._adjust_durations(scenes, target_duration)
 
         return scenes
 
-    def _extract_json(self, response: str) -> str:
-        """Extract JSON from a response that may contain markdown or other text."""
-        # Try to find JSON in code blocks
-        if "```json" in response:
-            start = response.find("```json") + 7
-            end = response.find("```", start)
-            if end > start:
-                return response[start:end].strip()
+    def _scene_from_data(self, index: int, scene_data: Any) -> Scene:
+        """Build a Scene from one parsed scene object.
+
+        Only the fields a Scene uses are read, and each is cast to a plain
+        Python value so nothing keeps a lazy document's buffer alive once
+        the parser is reused.
+        """
+        get = scene_data.get
+        scene_id = get("id")
+        prompt = get("prompt", "")
+        overlay_text = get("overlay_text")
+        overlay_style = get("overlay_style")
+        return Scene(
+            id=str(scene_id) if scene_id is not None else f"scene_{index + 1}",
+            prompt=str(prompt) if prompt is not None else None,
+            duration=float(get("duration", 5.0)),
+            source="generate",
+            overlay_text=str(overlay_text) if overlay_text is not None else None,
+            overlay_style=str(overlay_style) if overlay_style is not None else None,
+        )
 
-        if "```" in response:
-            start = response.find("```") + 3
-            end = response.find("```", start)
+    def _extract_json(self, buf: bytes) -> tuple[int, int]:
+        """Locate JSON in a response that may contain markdown or other text.
+
+        One regex scan finds whichever comes first, a code fence or an
+        opening brace, instead of separate passes for each marker.
+
+        Args:
+            buf: UTF-8 encoded response.
+
+        Returns:
+            ``(start, end)`` byte offsets of the JSON text in ``buf``. The
+            span may include surrounding whitespace.
+        """
+        # Fast path: the response is bare JSON, as the system prompt asks
+        stripped = buf.strip()
+        if stripped[:1] in _BARE_OPENERS and stripped[-1:] in _BARE_CLOSERS:
+            start = buf.find(stripped[:1])
+            return start, start + len(stripped)
+
+        for anchor in _ANCHOR_RE.finditer(buf):
+            if anchor.group() == _OBJECT_OPEN:
+                end = _find_json_end(buf, anchor.start())
+                if end != -1:
+                    return anchor.start(), end
+                break
+
+            # Code block, optionally tagged as json
+            start = anchor.end()
+            if buf.startswith(_JSON_TAG, start):
+                start += len(_JSON_TAG)
+            end = buf.find(_FENCE, start)
             if end > start:
-                return response[start:end].strip()
-
-        # Try to find raw JSON object or array
-        for start_char, end_char in [("{", "}"), ("[", "]")]:
-            start = response.find(start_char)
-            if start != -1:
-                # Find matching end bracket
-                depth = 0
-                for i, char in enumerate(response[start:], start):
-                    if char == start_char:
-                        depth += 1
-                    elif char == end_char:
-                        depth -= 1
-                        if depth == 0:
-                            return response[start:i + 1]
-
-        # Return as-is if no JSON structure found
-        return response.strip()
+                return start, end
+
+        # Try to find a raw JSON array
+        start = buf.find(_ARRAY_OPEN)
+        if start != -1:
+            end = _find_json_end(buf, start)
+            if end != -1:
+                return start, end
+
+        # Use the whole response if no JSON structure found
+        return 0, len(buf)
 
     def _adjust_durations(
         self, scenes: list[Scene], target_duration: int
@@ -211,25 +521,12 @@ class ResearchAgent(BaseAgent[ResearchInput, list[Scene]]):
         if not scenes:
             return scenes
 
-        current_total = sum(scene.duration for scene in scenes)
-
-        if current_total == 0:
-            # Distribute evenly if no durations set
-            per_scene = target_duration / len(scenes)
-            for scene in scenes:
-                scene.duration = round(per_scene, 1)
-            return scenes
-
-        # Scale durations proportionally
-        scale_factor = target_duration / current_total
-
-        for scene in scenes:
-            scene.duration = round(scene.duration * scale_factor, 1)
-
-        # Adjust for rounding errors
-        adjusted_total = sum(scene.duration for scene in scenes)
-        if adjusted_total != target_duration:
-            diff = target_duration - adjusted_total
-            scenes[-1].duration = round(scenes[-1].duration + diff, 1)
+        durations = np.fromiter(
+            (scene.duration for scene in scenes), dtype=np.float64, count=len(scenes)
+        )
+        durations = _scale_durations(durations, float(target_duration))
 
-        return scenes
+        return [
+            scene.model_copy(update={"duration": duration})
+            for scene, duration in zip(scenes, durations.tolist())
+        ]
@@ -1,14 +1,18 @@
 """CLI entry point for the music video generator."""
 
 import logging
+import os
 import typer
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from enum import Enum
 
 from . import __version__
-from .config import config
-from .models import Manifest, Project, ProjectState
+
+if TYPE_CHECKING:
+    from .models import Manifest, Scene
 
 app = typer.Typer(
     name="video-maker",
@@ -26,6 +30,28 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+@lru_cache(maxsize=1)
+def _validated_anthropic() -> str:
+    """Return the configured Anthropic API key, read once per process."""
+    from .config import get_config
+
+    return get_config().anthropic_api_key
+
+
+@lru_cache(maxsize=1)
+def _validated_veo() -> bool:
+    """Validate the Veo configuration once per process.
+
+    Raises:
+        ValueError: If required Veo configuration is missing. Failures are
+            not cached, so a later call validates again.
+    """
+    from .config import get_config
+
+    get_config().validate_veo_required()
+    return True
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -61,6 +87,8 @@ def status(
     )
 ) -> None:
     """Show project status."""
+    from .models import Manifest
+
     if not script.exists():
         typer.echo(f"❌ No project found at {script}")
         typer.echo("   Run 'video-maker research' to create a new project")
@@ -68,26 +96,32 @@ def status(
 
     try:
         manifest = Manifest.from_yaml(script)
-        typer.echo(f"📁 Project: {manifest.project_name}")
-        typer.echo(f"   Aspect ratio: {manifest.aspect_ratio}")
-        typer.echo(f"   Scenes: {len(manifest.scenes)}")
-        
+
+        # Build the report and write it in one go rather than line by line
+        lines = [
+            f"📁 Project: {manifest.project_name}",
+            f"   Aspect ratio: {manifest.aspect_ratio}",
+            f"   Scenes: {len(manifest.scenes)}",
+        ]
+
         if manifest.audio_file:
-            typer.echo(f"   Audio: {manifest.audio_file}")
-        
+            lines.append(f"   Audio: {manifest.audio_file}")
+
         # Calculate total duration
-        total_duration = sum(scene.duration for scene in manifest.scenes)
-        typer.echo(f"   Total duration: {total_duration:.1f}s")
-        
+        total_duration = sum(map(attrgetter("duration"), manifest.scenes))
+        lines.append(f"   Total duration: {total_duration:.1f}s")
+
         # Scene breakdown
-        typer.echo("\n📽️  Scenes:")
+        lines.append("\n📽️  Scenes:")
         for scene in manifest.scenes:
             status_icon = "✅" if scene.file else "⏳"
-            typer.echo(f"   {status_icon} {scene.id}: {scene.duration}s")
+            lines.append(f"   {status_icon} {scene.id}: {scene.duration}s")
             if scene.prompt:
                 prompt_preview = scene.prompt[:60] + "..." if len(scene.prompt) > 60 else scene.prompt
-                typer.echo(f"      → {prompt_preview}")
-        
+                lines.append(f"      → {prompt_preview}")
+
+        typer.echo("\n".join(lines))
+
     except Exception as e:
         typer.echo(f"❌ Error loading project: {e}")
         raise typer.Exit(1)
@@ -106,6 +140,26 @@ class OutputFormat(str, Enum):
     MOV = "mov"
 
 
+# Encoder settings per quality preset, keyed by OutputQuality value
+_QUALITY_PARAMS: dict[str, dict[str, str]] = {
+    "final": {"preset": "medium", "bitrate": "8000k"},
+    "draft": {"preset": "ultrafast", "bitrate": "3000k"},
+}
+
+# (video codec, audio codec) per output container, keyed by OutputFormat value
+_CODEC_MAP: dict[str, tuple[str, str]] = {
+    "mp4": ("libx264", "aac"),
+    "webm": ("libvpx", "libvorbis"),
+    "mov": ("libx264", "aac"),
+}
+
+# Stream codec names (as ffmpeg reports them) produced by each encoder
+_STREAM_CODEC_NAMES: dict[str, str] = {
+    "libx264": "h264",
+    "libvpx": "vp8",
+}
+
+
 @app.command()
 def research(
     idea: str = typer.Argument(
@@ -141,6 +195,7 @@ def research(
     """Generate scene descriptions from a creative idea using AI."""
     from .agents import ResearchAgent
     from .agents.research import ResearchInput
+    from .models import Manifest
 
     typer.echo(f"🎬 Researching: {idea}")
     typer.echo(f"   Target duration: {duration}s")
@@ -149,7 +204,7 @@ def research(
         typer.echo(f"   Style: {style}")
 
     # Validate API key
-    if not config.anthropic_api_key:
+    if not _validated_anthropic():
         typer.echo("❌ ANTHROPIC_API_KEY environment variable not set")
         raise typer.Exit(1)
 
@@ -174,8 +229,9 @@ def research(
 
     # Create manifest with generated scenes
     # Generate project name from idea (first few words)
-    project_name = " ".join(idea.split()[:5])
-    if len(idea.split()) > 5:
+    words = idea.split()
+    project_name = " ".join(words[:5])
+    if len(words) > 5:
         project_name += "..."
 
     manifest = Manifest(
@@ -195,16 +251,18 @@ def research(
         raise typer.Exit(1)
 
     # Show summary
-    total_duration = sum(scene.duration for scene in generated_scenes)
-    typer.echo(f"\n📋 Summary:")
-    typer.echo(f"   Scenes: {len(generated_scenes)}")
-    typer.echo(f"   Total duration: {total_duration:.1f}s")
-
-    typer.echo(f"\n📽️  Scene breakdown:")
+    total_duration = sum(map(attrgetter("duration"), generated_scenes))
+    lines = [
+        "\n📋 Summary:",
+        f"   Scenes: {len(generated_scenes)}",
+        f"   Total duration: {total_duration:.1f}s",
+        "\n📽️  Scene breakdown:",
+    ]
     for scene in generated_scenes:
-        typer.echo(f"   • {scene.id}: {scene.duration}s")
+        lines.append(f"   • {scene.id}: {scene.duration}s")
         prompt_preview = scene.prompt[:70] + "..." if len(scene.prompt) > 70 else scene.prompt
-        typer.echo(f"     {prompt_preview}")
+        lines.append(f"     {prompt_preview}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -280,19 +338,13 @@ def assemble(
         Path("script.yaml"),
         "--script",
         "-s",
-        help="Path to scenes YAML file",
-        exists=True,
-        file_okay=True,
-        dir_okay=False
+        help="Path to scenes YAML file"
     ),
     clips_dir: Path = typer.Option(
         Path("./clips"),
         "--clips",
         "-c",
-        help="Directory containing video clips",
-        exists=True,
-        file_okay=False,
-        dir_okay=True
+        help="Directory containing video clips"
     ),
     music_file: Optional[Path] = typer.Option(
         None,
@@ -328,10 +380,16 @@ def assemble(
         2.0,
         "--fade-audio",
         help="Audio fade out duration at end (seconds)"
+    ),
+    hardware: bool = typer.Option(
+        True,
+        "--hw/--no-hw",
+        help="Use a hardware H.264 encoder when one is available"
     )
 ) -> None:
     """Assemble video clips into final video with music and overlays."""
     from .editor import stitch_clips, sync_audio, export, add_text_overlay
+    from .models import Manifest
 
     typer.echo(f"📼 Assembling video from {script}")
 
@@ -342,22 +400,48 @@ def assemble(
         typer.echo(f"❌ Error loading manifest: {e}")
         raise typer.Exit(1)
 
-    # Collect clip paths in scene order
+    # Collect clip paths and overlays in scene order, in a single pass
     clip_paths: list[Path] = []
     missing_clips: list[str] = []
+    overlays: list[tuple[int, str, str, str]] = []
+
+    # List the clips directory once instead of stat-ing each scene's clip
+    clips_root = os.fspath(clips_dir)
+    try:
+        with os.scandir(clips_root) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        # Scenes with explicit files don't need it; any others are
+        # reported as missing below
+        existing = set()
+    except OSError as e:
+        typer.echo(f"❌ Cannot read clips directory: {e}")
+        raise typer.Exit(1)
 
     for scene in manifest.scenes:
-        if scene.file:
+        scene_id = scene.id
+        scene_file = scene.file
+        if scene_file:
             # Use explicit file path
-            clip_path = Path(scene.file)
+            clip_file = scene_file
+            found = os.path.isfile(scene_file)
         else:
             # Look for clip in clips directory
-            clip_path = clips_dir / f"{scene.id}.mp4"
+            clip_name = f"{scene_id}.mp4"
+            clip_file = os.path.join(clips_root, clip_name)
+            found = clip_name in existing
 
-        if not clip_path.exists():
-            missing_clips.append(f"{scene.id}: {clip_path}")
+        # Only clips that are actually stitched need a Path object
+        if not found:
+            missing_clips.append(f"{scene_id}: {clip_file}")
         else:
-            clip_paths.append(clip_path)
+            clip_paths.append(Path(clip_file))
+
+        overlay_text = scene.overlay_text
+        if overlay_text:
+            overlays.append(
+                (len(clip_paths) - 1, scene_id, overlay_text, scene.overlay_style or "default")
+            )
 
     if missing_clips:
         typer.echo("❌ Missing clips:")
@@ -371,6 +455,97 @@ def assemble(
 
     typer.echo(f"   Found {len(clip_paths)} clips")
 
+    audio_path = music_file or (Path(manifest.audio_file) if manifest.audio_file else None)
+    video_codec, audio_codec = _CODEC_MAP[output_format.value]
+
+    # Ensure output has correct extension
+    output = output.with_suffix(f".{output_format.value}")
+
+    if audio_path and not audio_path.exists():
+        typer.echo(f"⚠️  Audio file not found: {audio_path}")
+        audio_path = None
+
+    # Clips sharing stream parameters are joined by ffmpeg directly: remuxed
+    # as-is when nothing needs drawing, otherwise encoded once with xfade
+    # crossfades and pre-rendered overlay images. Any music is looped and
+    # encoded by ffmpeg too. This skips MoviePy's per-frame decode, blend
+    # and re-encode entirely.
+    from .editor import (
+        STYLES,
+        can_concat_copy,
+        clip_starts,
+        concat_copy,
+        pick_h264_encoder,
+        probe,
+        rasterize_text,
+        render_clips,
+    )
+    from .editor.ffmpeg import encoder_preset
+
+    ignore_audio = audio_path is not None
+    stream_codec = _STREAM_CODEC_NAMES.get(video_codec, video_codec)
+    if (overlays or transition > 0) and can_concat_copy(clip_paths, None, ignore_audio=ignore_audio):
+        infos = [probe(clip_path) for clip_path in clip_paths]
+        starts = clip_starts([info.duration for info in infos])
+        frame_size = (infos[0].width, infos[0].height)
+
+        # Resolve each distinct style once rather than per scene
+        styles = {
+            style_name: STYLES.get(style_name, STYLES["default"])
+            for _, _, _, style_name in overlays
+        }
+        overlay_images = []
+        for clip_index, scene_id, overlay_text, style_name in overlays:
+            typer.echo(f"   Adding overlay to {scene_id}: '{overlay_text}'")
+            image = rasterize_text(overlay_text, frame_size, styles[style_name])
+            overlay_images.append((image, starts[clip_index], starts[clip_index + 1]))
+
+        codec = video_codec
+        preset = _QUALITY_PARAMS[quality.value]["preset"]
+        if hardware and codec == "libx264":
+            codec = pick_h264_encoder()
+            preset = encoder_preset(codec, preset)
+
+        typer.echo(f"   Rendering to {output} ({quality.value} quality)...")
+        if audio_path:
+            typer.echo(f"   Adding audio: {audio_path}")
+        try:
+            render_clips(
+                clip_paths,
+                output,
+                overlay_images,
+                transition=transition,
+                codec=codec,
+                preset=preset,
+                bitrate=_QUALITY_PARAMS[quality.value]["bitrate"],
+                audio_path=audio_path,
+                audio_codec=audio_codec,
+                fade_out=fade_audio_out,
+            )
+        except Exception as e:
+            typer.echo(f"⚠️  ffmpeg render failed, falling back to MoviePy: {e}")
+        else:
+            typer.echo(f"✅ Video assembled: {output}")
+            return
+
+    elif not overlays and transition == 0 and can_concat_copy(clip_paths, stream_codec, ignore_audio=ignore_audio):
+        typer.echo(f"   Joining clips without re-encoding to {output}...")
+        if audio_path:
+            typer.echo(f"   Adding audio: {audio_path}")
+        try:
+            concat_copy(
+                clip_paths,
+                output,
+                audio_path=audio_path,
+                audio_codec=audio_codec,
+                fade_out=fade_audio_out,
+            )
+        except Exception as e:
+            typer.echo(f"⚠️  Stream copy failed, re-encoding instead: {e}")
+        else:
+            typer.echo(f"✅ Video assembled: {output}")
+            return
+
     # Stitch clips together
     try:
         typer.echo("   Stitching clips...")
@@ -379,49 +554,38 @@ def assemble(
         typer.echo(f"❌ Error stitching clips: {e}")
         raise typer.Exit(1)
 
-    # Add text overlays if defined in scenes
-    for i, scene in enumerate(manifest.scenes):
-        if scene.overlay_text:
-            style_name = scene.overlay_style or "default"
-            typer.echo(f"   Adding overlay to {scene.id}: '{scene.overlay_text}'")
-            # Note: For complex multi-scene overlays with timing, we'd need
-            # to track cumulative start times. This is a simplified version.
+    # Add text overlays if defined in scenes, each over its own clip
+    if overlays:
+        starts = clip_starts([probe(clip_path).duration for clip_path in clip_paths])
+    for clip_index, scene_id, overlay_text, style_name in overlays:
+        typer.echo(f"   Adding overlay to {scene_id}: '{overlay_text}'")
+        start = starts[clip_index]
+        try:
+            video = add_text_overlay(
+                video,
+                overlay_text,
+                style_name=style_name,
+                start_time=start,
+                duration=starts[clip_index + 1] - start,
+            )
+        except Exception as e:
+            typer.echo(f"⚠️  Skipping overlay for {scene_id}: {e}")
 
     # Add audio if provided
-    audio_path = music_file or (Path(manifest.audio_file) if manifest.audio_file else None)
     if audio_path:
-        if not audio_path.exists():
-            typer.echo(f"⚠️  Audio file not found: {audio_path}")
-        else:
-            typer.echo(f"   Adding audio: {audio_path}")
-            try:
-                video = sync_audio(video, audio_path, loop=True, fade_out=fade_audio_out)
-            except Exception as e:
-                typer.echo(f"⚠️  Error adding audio: {e}")
+        typer.echo(f"   Adding audio: {audio_path}")
+        try:
+            video = sync_audio(video, audio_path, loop=True, fade_out=fade_audio_out)
+        except Exception as e:
+            typer.echo(f"⚠️  Error adding audio: {e}")
 
     # Configure encoding based on quality
-    encoding_params = {
-        "fps": 30,
-        "preset": "medium" if quality == OutputQuality.FINAL else "ultrafast",
-    }
-
-    if quality == OutputQuality.FINAL:
-        encoding_params["bitrate"] = "8000k"
-    else:
-        encoding_params["bitrate"] = "3000k"
+    encoding_params = {"fps": 30, **_QUALITY_PARAMS[quality.value]}
 
     # Adjust codec based on format
-    codec_map = {
-        OutputFormat.MP4: ("libx264", "aac"),
-        OutputFormat.WEBM: ("libvpx", "libvorbis"),
-        OutputFormat.MOV: ("libx264", "aac"),
-    }
-    video_codec, audio_codec = codec_map[output_format]
     encoding_params["codec"] = video_codec
     encoding_params["audio_codec"] = audio_codec
-
-    # Ensure output has correct extension
-    output = output.with_suffix(f".{output_format.value}")
+    encoding_params["hardware"] = hardware
 
     # Export final video
     typer.echo(f"   Rendering to {output} ({quality.value} quality)...")
@@ -447,10 +611,7 @@ def veo(
         Path("script.yaml"),
         "--script",
         "-s",
-        help="Path to scenes YAML manifest file",
-        exists=True,
-        file_okay=True,
-        dir_okay=False
+        help="Path to scenes YAML manifest file"
     ),
     output: Path = typer.Option(
         Path("./clips"),
@@ -496,6 +657,17 @@ def veo(
         "-l",
         help="Limit number of scenes to generate (for testing)"
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Regenerate clips even if an identical request was cached"
+    ),
+    remote_cache: bool = typer.Option(
+        False,
+        "--remote-cache/--no-remote-cache",
+        help="Also cache clips under cache/ in the output bucket (stores each clip twice)"
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -508,9 +680,17 @@ def veo(
     Reads a YAML manifest with scene descriptions and generates video clips
     for each scene using the Veo 3 API via Vertex AI.
     """
-    import json as json_module
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from .services.veo import VeoClient, GenerationStatus, save_generation_metadata, GenerationResult
+    import dataclasses
+    import shutil
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from .models import Manifest
+    from .services.veo import (
+        VeoClient,
+        GenerationStatus,
+        GenerationResult,
+        encode_reference_image,
+        save_generation_metadata,
+    )
 
     setup_logging(verbose)
     typer.echo(f"🎬 Veo Generation: {script}")
@@ -518,7 +698,7 @@ def veo(
     # Validate Veo configuration (unless dry run)
     if not dry_run:
         try:
-            config.validate_veo_required()
+            _validated_veo()
         except ValueError as e:
             typer.echo(f"❌ Configuration error: {e}")
             raise typer.Exit(1)
@@ -545,24 +725,28 @@ def veo(
     typer.echo(f"   Output directory: {output}")
 
     # Filter scenes that need generation
-    scenes_to_generate: list[tuple[int, object]] = []
-    skipped_scenes: list[str] = []
+    scenes_to_generate: list[tuple[int, "Scene"]] = []
+    skipped_scenes: list[tuple[str, str]] = []
+
+    existing: set[str] = set()
+    if skip_existing:
+        with os.scandir(output) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
 
     for i, scene in enumerate(manifest.scenes):
         # Skip scenes with explicit file source
         if scene.source == "file" and scene.file:
-            skipped_scenes.append(f"{scene.id} (has explicit file)")
+            skipped_scenes.append((scene.id, "has explicit file"))
             continue
 
         # Skip if no prompt
         if not scene.prompt:
-            skipped_scenes.append(f"{scene.id} (no prompt)")
+            skipped_scenes.append((scene.id, "no prompt"))
             continue
 
         # Check if clip already exists
-        clip_path = output / f"{scene.id}.mp4"
-        if skip_existing and clip_path.exists():
-            skipped_scenes.append(f"{scene.id} (exists)")
+        if skip_existing and f"{scene.id}.mp4" in existing:
+            skipped_scenes.append((scene.id, "exists"))
             continue
 
         scenes_to_generate.append((i, scene))
@@ -572,13 +756,15 @@ def veo(
         scenes_to_generate = scenes_to_generate[:limit]
 
     # Show summary
-    typer.echo(f"\n📋 Generation Plan:")
-    typer.echo(f"   To generate: {len(scenes_to_generate)}")
-    typer.echo(f"   Skipped: {len(skipped_scenes)}")
+    lines = [
+        "\n📋 Generation Plan:",
+        f"   To generate: {len(scenes_to_generate)}",
+        f"   Skipped: {len(skipped_scenes)}",
+    ]
 
     if skipped_scenes and len(skipped_scenes) <= 10:
-        for s in skipped_scenes:
-            typer.echo(f"     - {s}")
+        lines.extend(f"     - {scene_id} ({reason})" for scene_id, reason in skipped_scenes)
+    typer.echo("\n".join(lines))
 
     if not scenes_to_generate:
         typer.echo("\n✅ No scenes to generate")
@@ -586,16 +772,28 @@ def veo(
 
     # Dry run mode - show what would be generated
     if dry_run:
-        typer.echo(f"\n🔍 Dry run - would generate {len(scenes_to_generate)} clips:")
+        lines = [f"\n🔍 Dry run - would generate {len(scenes_to_generate)} clips:"]
         for idx, scene in scenes_to_generate:
             prompt_preview = scene.prompt[:70] + "..." if len(scene.prompt) > 70 else scene.prompt
-            typer.echo(f"   [{idx + 1}] {scene.id}: {scene.duration}s")
-            typer.echo(f"       → {prompt_preview}")
+            lines.append(f"   [{idx + 1}] {scene.id}: {scene.duration}s")
+            lines.append(f"       → {prompt_preview}")
+        typer.echo("\n".join(lines))
         raise typer.Exit(0)
 
+    # Validate reference image if provided
+    if reference and not reference.exists():
+        typer.echo(f"❌ Reference image not found: {reference}")
+        raise typer.Exit(1)
+
+    # Encode the reference image once rather than in every worker
+    reference_b64: Optional[str] = None
+    if reference:
+        typer.echo(f"   Using reference image: {reference}")
+        reference_b64 = encode_reference_image(reference)
+
     # Initialize Veo client
     try:
-        client = VeoClient()
+        client = VeoClient(remote_cache=remote_cache)
         typer.echo(f"\n🔌 Connected to Veo 3 (project: {client.project_id})")
     except Exception as e:
         typer.echo(f"❌ Failed to initialize Veo client: {e}")
@@ -608,15 +806,42 @@ def veo(
 
     typer.echo(f"\n⏳ Generating {len(scenes_to_generate)} clips (max {parallel} concurrent)...\n")
 
-    # Validate reference image if provided
-    if reference and not reference.exists():
-        typer.echo(f"❌ Reference image not found: {reference}")
-        raise typer.Exit(1)
+    # Scenes with the same prompt and clamped duration would produce the same
+    # request (ratio and reference are fixed per run), so only the first one
+    # is generated and the others get a copy of its clip
+    unique_scenes: list[tuple[int, "Scene"]] = []
+    duplicates: dict[str, list["Scene"]] = {}
+    primary_by_key: dict[tuple[str, float], "Scene"] = {}
+    for scene_data in scenes_to_generate:
+        scene = scene_data[1]
+        key = (scene.prompt, max(5.0, min(8.0, scene.duration)))
+        primary = primary_by_key.setdefault(key, scene)
+        if primary is scene:
+            unique_scenes.append(scene_data)
+        else:
+            duplicates.setdefault(primary.id, []).append(scene)
 
-    if reference:
-        typer.echo(f"   Using reference image: {reference}")
+    if duplicates:
+        reused = sum(map(len, duplicates.values()))
+        typer.echo(f"   Reusing clips for {reused} scene(s) with duplicate prompts")
 
-    def generate_scene(scene_data: tuple[int, object]) -> GenerationResult:
+    def copy_result(result: GenerationResult, scene: "Scene") -> GenerationResult:
+        """Give a duplicate scene its own copy of a generated clip."""
+        copied = dataclasses.replace(
+            result,
+            metadata={**result.metadata, "scene_id": scene.id, "copied_from": result.metadata.get("scene_id")},
+        )
+        if result.status == GenerationStatus.COMPLETED and result.local_path:
+            clip_path = output / f"{scene.id}.mp4"
+            try:
+                shutil.copyfile(result.local_path, clip_path)
+                copied.local_path = clip_path
+            except OSError as e:
+                copied.status = GenerationStatus.FAILED
+                copied.error_message = f"Failed to copy clip: {e}"
+        return copied
+
+    def generate_scene(scene_data: tuple[int, "Scene"]) -> GenerationResult:
         """Generate a single scene clip."""
         idx, scene = scene_data
         clip_path = output / f"{scene.id}.mp4"
@@ -630,41 +855,55 @@ def veo(
             aspect_ratio=ratio,
             output_path=clip_path,
             scene_id=scene.id,
-            reference_image=reference,
+            reference_image_b64=reference_b64,
+            force=force,
         )
 
-    # Process scenes with thread pool for concurrent generation
-    with ThreadPoolExecutor(max_workers=parallel) as executor:
-        # Submit all jobs
-        future_to_scene = {
-            executor.submit(generate_scene, scene_data): scene_data
-            for scene_data in scenes_to_generate
-        }
-
-        # Process completions
-        for future in as_completed(future_to_scene):
-            idx, scene = future_to_scene[future]
-            try:
-                result = future.result()
-                results.append(result)
-
-                if result.status == GenerationStatus.COMPLETED:
-                    successful += 1
-                    typer.echo(f"   ✅ {scene.id}: Generated → {result.local_path}")
-                else:
-                    failed += 1
-                    error_msg = result.error_message or "Unknown error"
-                    typer.echo(f"   ❌ {scene.id}: Failed - {error_msg}")
-
-            except Exception as e:
-                failed += 1
-                typer.echo(f"   ❌ {scene.id}: Error - {e}")
-                results.append(GenerationResult(
-                    operation_id=f"error-{scene.id}",
-                    status=GenerationStatus.FAILED,
-                    error_message=str(e),
-                    metadata={"scene_id": scene.id},
-                ))
+    # Process scenes with thread pool, keeping a bounded window of jobs in
+    # flight so memory does not grow with the number of scenes. The client's
+    # session is closed however the loop ends.
+    scene_iter = iter(unique_scenes)
+    with client, ThreadPoolExecutor(max_workers=parallel) as executor:
+        future_to_scene = {}
+
+        def submit_next() -> None:
+            scene_data = next(scene_iter, None)
+            if scene_data is not None:
+                future_to_scene[executor.submit(generate_scene, scene_data)] = scene_data
+
+        for _ in range(parallel * 2):
+            submit_next()
+
+        # Process completions, topping the window back up as jobs finish
+        while future_to_scene:
+            done, _ = wait(future_to_scene, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, scene = future_to_scene.pop(future)
+                submit_next()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = GenerationResult(
+                        operation_id=f"error-{scene.id}",
+                        status=GenerationStatus.FAILED,
+                        error_message=str(e),
+                        metadata={"scene_id": scene.id},
+                    )
+
+                outcomes = [(scene, result)]
+                outcomes.extend(
+                    (dup, copy_result(result, dup)) for dup in duplicates.pop(scene.id, ())
+                )
+                for scene, result in outcomes:
+                    results.append(result)
+
+                    if result.status == GenerationStatus.COMPLETED:
+                        successful += 1
+                        typer.echo(f"   ✅ {scene.id}: Generated → {result.local_path}")
+                    else:
+                        failed += 1
+                        error_msg = result.error_message or "Unknown error"
+                        typer.echo(f"   ❌ {scene.id}: Failed - {error_msg}")
 
     # Save generation metadata
     metadata_path = output / "generation_metadata.json"
@@ -675,11 +914,13 @@ def veo(
         typer.echo(f"⚠️  Failed to save metadata: {e}")
 
     # Final summary
-    typer.echo(f"\n📊 Summary:")
-    typer.echo(f"   Total scenes: {len(manifest.scenes)}")
-    typer.echo(f"   Generated: {successful}")
-    typer.echo(f"   Failed: {failed}")
-    typer.echo(f"   Skipped: {len(skipped_scenes)}")
+    typer.echo(
+        f"\n📊 Summary:\n"
+        f"   Total scenes: {len(manifest.scenes)}\n"
+        f"   Generated: {successful}\n"
+        f"   Failed: {failed}\n"
+        f"   Skipped: {len(skipped_scenes)}"
+    )
 
     if failed > 0:
         typer.echo(f"\n⚠️  {failed} scene(s) failed to generate")
@@ -689,4 +930,6 @@ def veo(
 
 
 if __name__ == "__main__":
-    app()
+    from .__main__ import main
+
+    main()
@@ -1,59 +1,47 @@
 """Configuration management."""
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application configuration.
+
+    Build it with :func:`get_config`, which reads the environment once per
+    process.
+    """
 
-class Config(BaseModel):
-    """Application configuration."""
-    
     # API Keys
-    anthropic_api_key: str = Field(
-        default_factory=lambda: os.getenv("ANTHROPIC_API_KEY", ""),
-        description="Anthropic API key"
-    )
-    openai_api_key: str = Field(
-        default_factory=lambda: os.getenv("OPENAI_API_KEY", ""),
-        description="OpenAI API key (for Whisper)"
-    )
-    google_application_credentials: str = Field(
-        default_factory=lambda: os.getenv("GOOGLE_APPLICATION_CREDENTIALS", ""),
-        description="Path to Google Cloud service account JSON"
-    )
-    google_cloud_project: str = Field(
-        default_factory=lambda: os.getenv("GOOGLE_CLOUD_PROJECT", ""),
-        description="Google Cloud project ID"
-    )
-    veo_output_bucket: str = Field(
-        default_factory=lambda: os.getenv("VEO_OUTPUT_BUCKET", ""),
-        description="GCS bucket for Veo output"
-    )
-    veo_model: str = Field(
-        default_factory=lambda: os.getenv("VEO_MODEL", "veo-3.1-fast-generate-001"),
-        description="Veo model name"
-    )
-    
+    anthropic_api_key: str = ""  # Anthropic API key
+    openai_api_key: str = ""  # OpenAI API key (for Whisper)
+    google_application_credentials: str = ""  # Path to Google Cloud service account JSON
+    google_cloud_project: str = ""  # Google Cloud project ID
+    veo_output_bucket: str = ""  # GCS bucket for Veo output
+    veo_model: str = "veo-3.1-fast-generate-001"  # Veo model name
+
     # Paths
-    workspace: Path = Field(
-        default_factory=lambda: Path(os.getenv("MVG_WORKSPACE", ".")),
-        description="Workspace directory"
-    )
-    
+    workspace: Path = Path(".")  # Workspace directory
+
     # Model settings
-    default_model: str = Field(
-        default="claude-sonnet-4-20250514",
-        description="Default Claude model"
-    )
-    
-    class Config:
-        """Pydantic config."""
-        frozen = False
-    
+    default_model: str = "claude-sonnet-4-20250514"  # Default Claude model
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a configuration from environment variables."""
+        getenv = os.getenv
+        return cls(
+            anthropic_api_key=getenv("ANTHROPIC_API_KEY", ""),
+            openai_api_key=getenv("OPENAI_API_KEY", ""),
+            google_application_credentials=getenv("GOOGLE_APPLICATION_CREDENTIALS", ""),
+            google_cloud_project=getenv("GOOGLE_CLOUD_PROJECT", ""),
+            veo_output_bucket=getenv("VEO_OUTPUT_BUCKET", ""),
+            veo_model=getenv("VEO_MODEL", "veo-3.1-fast-generate-001"),
+            workspace=Path(getenv("MVG_WORKSPACE", ".")),
+        )
+
     def validate_required(self) -> None:
         """Validate that required credentials are set."""
         if not self.anthropic_api_key:
@@ -86,5 +74,28 @@ class Config(BaseModel):
             )
 
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load variables from a .env file, at most once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide configuration, reading the environment once.
+
+    The .env file is only read here, so commands that never need
+    configuration do no .env I/O.
+    """
+    _load_dotenv()
+    return Config.from_env()
+
+
+def __getattr__(name: str) -> Config:
+    # Keep ``from .config import config`` working without building the
+    # configuration at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
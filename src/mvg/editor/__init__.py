@@ -16,6 +16,18 @@ from .overlays import (
     add_text_overlay,
     get_style,
     register_style,
+    rasterize_text,
+)
+from .probe import (
+    ClipInfo,
+    probe,
+)
+from .ffmpeg import (
+    can_concat_copy,
+    clip_starts,
+    concat_copy,
+    pick_h264_encoder,
+    render_clips,
 )
 from .audio import (
     load_audio,
@@ -44,6 +56,16 @@ __all__ = [
     "add_text_overlay",
     "get_style",
     "register_style",
+    "rasterize_text",
+    # Probe
+    "ClipInfo",
+    "probe",
+    # ffmpeg
+    "can_concat_copy",
+    "clip_starts",
+    "concat_copy",
+    "pick_h264_encoder",
+    "render_clips",
     # Audio
     "load_audio",
     "sync_audio",
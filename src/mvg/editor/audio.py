@@ -3,8 +3,10 @@
 from pathlib import Path
 from typing import Optional
 
-from moviepy import AudioFileClip, VideoClip, CompositeAudioClip
-from moviepy.audio.fx import AudioFadeIn, AudioFadeOut
+from moviepy import AudioClip, AudioFileClip, VideoClip, CompositeAudioClip
+from moviepy.audio.fx import AudioFadeIn, AudioFadeOut, AudioLoop
+
+from .probe import probe
 
 
 def load_audio(audio_path: Path) -> AudioFileClip:
@@ -63,7 +65,7 @@ def sync_audio(
 def loop_audio(
     audio: AudioFileClip,
     target_duration: float
-) -> CompositeAudioClip:
+) -> AudioClip:
     """Loop audio to match a target duration.
 
     Args:
@@ -76,18 +78,9 @@ def loop_audio(
     if audio.duration >= target_duration:
         return audio.subclipped(0, target_duration)
 
-    # Calculate how many loops we need
-    loops_needed = int(target_duration / audio.duration) + 1
-
-    # Create multiple copies with appropriate start times
-    clips = []
-    for i in range(loops_needed):
-        clip = audio.with_start(i * audio.duration)
-        clips.append(clip)
-
-    # Composite and trim to exact duration
-    composite = CompositeAudioClip(clips)
-    return composite.subclipped(0, target_duration)
+    # AudioLoop maps each output time back into the source clip, so only
+    # one track is read at a time instead of mixing N offset copies
+    return audio.with_effects([AudioLoop(duration=target_duration)])
 
 
 def fade_audio(
@@ -180,8 +173,12 @@ def get_audio_duration(audio_path: Path) -> float:
 
     Returns:
         Duration in seconds.
+
+    Raises:
+        FileNotFoundError: If audio file doesn't exist.
     """
-    audio = load_audio(audio_path)
-    duration = audio.duration
-    audio.close()
-    return duration
+    if not audio_path.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    # Header probe, cached per file version; no decoder clip is opened
+    return probe(audio_path).duration
@@ -1,11 +1,19 @@
 """Video compositor for stitching clips and adding transitions."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from moviepy import VideoFileClip, concatenate_videoclips, CompositeVideoClip
 from moviepy.video.fx import CrossFadeIn, CrossFadeOut
 
+from .ffmpeg import encoder_preset, pick_h264_encoder
+
+# Upper bound on clips opened concurrently
+MAX_LOAD_WORKERS = 8
+
 
 def stitch_clips(
     clip_paths: List[Path],
@@ -28,12 +36,16 @@ def stitch_clips(
     if not clip_paths:
         raise ValueError("No clips provided")
 
-    # Load all clips
-    clips: List[VideoFileClip] = []
     for clip_path in clip_paths:
         if not clip_path.exists():
             raise FileNotFoundError(f"Clip not found: {clip_path}")
-        clips.append(VideoFileClip(str(clip_path)))
+
+    # Load all clips; each open runs ffmpeg to read the file header, so
+    # overlap them rather than waiting on one at a time
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(clip_paths))) as executor:
+        clips: List[VideoFileClip] = list(
+            executor.map(lambda clip_path: VideoFileClip(str(clip_path)), clip_paths)
+        )
 
     # Apply transitions if requested
     if transition_duration > 0 and len(clips) > 1:
@@ -85,7 +97,9 @@ def export(
     codec: str = "libx264",
     audio_codec: str = "aac",
     bitrate: Optional[str] = None,
-    preset: str = "medium"
+    preset: str = "medium",
+    threads: Optional[int] = 0,
+    hardware: bool = False
 ) -> Path:
     """Export video to file with proper encoding.
 
@@ -97,6 +111,11 @@ def export(
         audio_codec: Audio codec (default aac).
         bitrate: Video bitrate (e.g., "5000k"). None for auto.
         preset: Encoding preset (ultrafast, fast, medium, slow, slower).
+        threads: ffmpeg encoder threads. 0 (default) lets ffmpeg use all
+            cores, None leaves ffmpeg's own default.
+        hardware: If True and codec is libx264, use a hardware H.264 encoder
+            (NVENC, VideoToolbox or Quick Sync) when one is available,
+            translating the preset to its equivalent.
 
     Returns:
         Path to the exported video file.
@@ -104,12 +123,17 @@ def export(
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if hardware and codec == "libx264":
+        codec = pick_h264_encoder()
+        preset = encoder_preset(codec, preset)
+
     # Build export parameters
     export_params = {
         "fps": fps,
         "codec": codec,
         "audio_codec": audio_codec,
         "preset": preset,
+        "threads": threads,
     }
 
     if bitrate:
@@ -157,30 +181,44 @@ def crop_to_aspect(
     Returns:
         Cropped video clip.
     """
-    # Parse aspect ratio
-    parts = aspect_ratio.split(":")
-    target_w = int(parts[0])
-    target_h = int(parts[1])
-    target_ratio = target_w / target_h
-
-    # Get current dimensions
-    current_w = clip.w
-    current_h = clip.h
-    current_ratio = current_w / current_h
-
-    if abs(current_ratio - target_ratio) < 0.01:
+    crop_box = _crop_box(clip.w, clip.h, _parse_aspect(aspect_ratio))
+    if crop_box is None:
         # Already at target ratio
         return clip
 
+    x1, y1, x2, y2 = crop_box
+    return clip.cropped(x1=x1, y1=y1, x2=x2, y2=y2)
+
+
+@lru_cache(maxsize=32)
+def _parse_aspect(aspect_ratio: str) -> float:
+    """Parse an aspect ratio string like "9:16" into width / height."""
+    target_w, target_h = aspect_ratio.split(":", 1)
+    return int(target_w) / int(target_h)
+
+
+@lru_cache(maxsize=256)
+def _crop_box(
+    current_w: int,
+    current_h: int,
+    target_ratio: float
+) -> Optional[Tuple[int, int, int, int]]:
+    """Compute the centered (x1, y1, x2, y2) crop for a target ratio.
+
+    Returns None if the frame is already at the target ratio.
+    """
+    current_ratio = current_w / current_h
+
+    if math.isclose(current_ratio, target_ratio, abs_tol=0.01):
+        return None
+
     if current_ratio > target_ratio:
         # Too wide - crop horizontally
         new_w = int(current_h * target_ratio)
-        x_center = current_w // 2
-        x1 = x_center - new_w // 2
-        return clip.cropped(x1=x1, x2=x1 + new_w)
+        x1 = current_w // 2 - new_w // 2
+        return (x1, 0, x1 + new_w, current_h)
     else:
         # Too tall - crop vertically
         new_h = int(current_w / target_ratio)
-        y_center = current_h // 2
-        y1 = y_center - new_h // 2
-        return clip.cropped(y1=y1, y2=y1 + new_h)
+        y1 = current_h // 2 - new_h // 2
+        return (0, y1, current_w, y1 + new_h)
@@ -0,0 +1,392 @@
+"""Direct ffmpeg operations that avoid decoding video through MoviePy."""
+
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from moviepy.config import FFMPEG_BINARY
+from PIL import Image
+
+from .probe import probe
+
+# Upper bound on clips probed concurrently
+MAX_PROBE_WORKERS = 8
+
+# Hardware H.264 encoders, in order of preference
+HW_H264_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+
+# x264 preset names translated for encoders that use their own scale;
+# names missing from a table are passed through unchanged
+_HW_PRESETS = {
+    "h264_nvenc": {
+        "ultrafast": "p1",
+        "superfast": "p1",
+        "veryfast": "p2",
+        "faster": "p3",
+        "fast": "p3",
+        "medium": "p4",
+        "slow": "p5",
+        "slower": "p6",
+        "veryslow": "p7",
+    },
+    "h264_qsv": {
+        "ultrafast": "veryfast",
+        "superfast": "veryfast",
+    },
+}
+
+
+def _stream_signature(clip_path: Path, include_audio: bool = True) -> Tuple:
+    """Return the stream properties that must match for a stream copy."""
+    info = probe(clip_path)
+    signature = (info.video_codec, info.width, info.height, info.fps)
+    if include_audio:
+        signature += (info.has_audio, info.audio_fps)
+    return signature
+
+
+def _encoder_works(encoder: str) -> bool:
+    """Encode a few blank frames to check an encoder is usable here.
+
+    Builds often list hardware encoders whose device or driver is missing,
+    so being listed by ``ffmpeg -encoders`` is not enough.
+    """
+    try:
+        proc = subprocess.run(
+            [
+                FFMPEG_BINARY, "-v", "error",
+                "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return proc.returncode == 0
+
+
+@lru_cache(maxsize=1)
+def pick_h264_encoder() -> str:
+    """Return the preferred working H.264 encoder.
+
+    Checked once per process. Falls back to ``libx264`` when no hardware
+    encoder is available.
+    """
+    try:
+        listing = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+        ).stdout
+    except OSError:
+        return "libx264"
+
+    available = {line.split()[1] for line in listing.splitlines() if len(line.split()) > 1}
+    for encoder in HW_H264_ENCODERS:
+        if encoder in available and _encoder_works(encoder):
+            return encoder
+    return "libx264"
+
+
+def encoder_preset(encoder: str, preset: str) -> str:
+    """Translate an x264 preset name for the given encoder."""
+    return _HW_PRESETS.get(encoder, {}).get(preset, preset)
+
+
+def can_concat_copy(
+    clip_paths: List[Path],
+    video_codec: Optional[str] = "h264",
+    ignore_audio: bool = False
+) -> bool:
+    """Check whether clips can be joined without re-encoding.
+
+    Args:
+        clip_paths: List of paths to video clip files.
+        video_codec: Codec name (as reported by ffmpeg) the clips must use,
+            or None to accept any codec they share (when re-encoding).
+        ignore_audio: Skip comparing the clips' audio, for when it will be
+            replaced by a music track anyway.
+
+    Returns:
+        True if every clip uses ``video_codec`` and all clips share the same
+        resolution, frame rate and (unless ignored) audio layout.
+    """
+    if not clip_paths:
+        return False
+
+    def signature(clip_path: Path) -> Tuple:
+        return _stream_signature(clip_path, include_audio=not ignore_audio)
+
+    # Probing is dominated by waiting on ffmpeg, so probe clips concurrently
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(clip_paths))) as executor:
+            first, *rest = executor.map(signature, clip_paths)
+    except OSError:
+        return False
+
+    if video_codec is not None and first[0] != video_codec:
+        return False
+    return all(other == first for other in rest)
+
+
+def clip_starts(durations: List[float]) -> List[float]:
+    """Return where each clip starts on the joined timeline, plus its end.
+
+    Crossfades in :func:`render_clips` don't overlap the clips, so this
+    holds with or without a transition.
+    """
+    starts = [0.0]
+    for duration in durations:
+        starts.append(starts[-1] + duration)
+    return starts
+
+
+def _write_concat_list(clip_paths: List[Path]) -> str:
+    """Write a concat demuxer list file and return its path."""
+    # Quote each path per ffmpeg's escaping rules
+    lines = []
+    for clip_path in clip_paths:
+        escaped = os.path.abspath(clip_path).replace("'", r"'\''")
+        lines.append(f"file '{escaped}'\n")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as list_file:
+        list_file.writelines(lines)
+    return list_file.name
+
+
+def _music_args(
+    input_index: int,
+    duration: float,
+    audio_codec: str,
+    fade_out: float
+) -> List[str]:
+    """Build output arguments that loop, trim and fade a music input."""
+    args = [
+        "-map", f"{input_index}:a", "-c:a", audio_codec,
+        "-t", f"{duration:.3f}",
+    ]
+    if fade_out > 0:
+        fade_start = max(0.0, duration - fade_out)
+        args += ["-af", f"afade=t=out:st={fade_start:.3f}:d={fade_out:.3f}"]
+    return args
+
+
+def _run_ffmpeg(cmd: List[str], list_file: Optional[str], what: str) -> None:
+    """Run ffmpeg, remove the concat list file (if any) and raise on failure."""
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    finally:
+        if list_file is not None:
+            os.unlink(list_file)
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg {what} failed: {proc.stderr.strip()}")
+
+
+def concat_copy(
+    clip_paths: List[Path],
+    output_path: Path,
+    audio_path: Optional[Path] = None,
+    audio_codec: str = "aac",
+    fade_out: float = 0.0
+) -> Path:
+    """Concatenate clips with the ffmpeg concat demuxer and stream copy.
+
+    The clips are remuxed into the output container without being decoded,
+    so they must share codecs and stream parameters (see
+    :func:`can_concat_copy`).
+
+    Args:
+        clip_paths: List of paths to video clip files, in order.
+        output_path: Path for output file.
+        audio_path: Optional music track that replaces the clips' audio. It
+            is looped by ffmpeg (``-stream_loop``) and trimmed to the video
+            length; only the audio is encoded.
+        audio_codec: Codec for the music track.
+        fade_out: Duration of a fade out at the end of the music (seconds).
+
+    Returns:
+        Path to the output file.
+
+    Raises:
+        ValueError: If clip_paths is empty.
+        RuntimeError: If ffmpeg fails.
+    """
+    if not clip_paths:
+        raise ValueError("No clips provided")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    list_file = _write_concat_list(clip_paths)
+
+    cmd = [
+        FFMPEG_BINARY, "-v", "error", "-y",
+        "-f", "concat", "-safe", "0", "-i", list_file,
+    ]
+    if audio_path is None:
+        cmd += ["-c", "copy"]
+    else:
+        duration = sum(probe(clip_path).duration for clip_path in clip_paths)
+        cmd += ["-stream_loop", "-1", "-i", str(audio_path), "-map", "0:v", "-c:v", "copy"]
+        cmd += _music_args(1, duration, audio_codec, fade_out)
+    cmd.append(str(output_path))
+
+    _run_ffmpeg(cmd, list_file, "concat")
+    return output_path
+
+
+def _crossfade_filters(
+    durations: List[float],
+    transition: float,
+    with_audio: bool
+) -> Tuple[List[str], str, Optional[str], float]:
+    """Build an xfade/acrossfade chain over inputs ``0..len(durations)-1``.
+
+    Every clip but the last is padded by ``transition`` seconds (its last
+    frame held, its audio followed by silence) and the next clip fades in
+    over that padding, so each clip keeps its start time and the result is
+    as long as the clips laid end to end.
+
+    Returns the filters, the output video and audio labels, and the length
+    of the result.
+    """
+    filters = []
+    last = len(durations) - 1
+    for i in range(last):
+        filters.append(
+            f"[{i}:v]tpad=stop_mode=clone:stop_duration={transition:.3f}[p{i}]"
+        )
+        if with_audio:
+            filters.append(f"[{i}:a]apad=pad_dur={transition:.3f}[q{i}]")
+
+    video_label = "p0"
+    audio_label = "q0" if with_audio else None
+    offset = 0.0
+    for i in range(1, len(durations)):
+        # Each fade starts where the previous clip's own frames end
+        offset += durations[i - 1]
+        next_video = f"p{i}" if i < last else f"{i}:v"
+        filters.append(
+            f"[{video_label}][{next_video}]xfade=transition=fade:"
+            f"duration={transition:.3f}:offset={offset:.3f}[x{i}]"
+        )
+        video_label = f"x{i}"
+        if with_audio:
+            next_audio = f"q{i}" if i < last else f"{i}:a"
+            filters.append(
+                f"[{audio_label}][{next_audio}]acrossfade=d={transition:.3f}[a{i}]"
+            )
+            audio_label = f"a{i}"
+    return filters, video_label, audio_label, offset + durations[-1]
+
+
+def render_clips(
+    clip_paths: List[Path],
+    output_path: Path,
+    overlays: Sequence[Tuple[Image.Image, float, float]] = (),
+    transition: float = 0.0,
+    codec: str = "libx264",
+    preset: str = "medium",
+    bitrate: Optional[str] = None,
+    audio_path: Optional[Path] = None,
+    audio_codec: str = "aac",
+    fade_out: float = 0.0
+) -> Path:
+    """Join clips, crossfade them and burn in overlays in one ffmpeg run.
+
+    Without a transition the clips are read through the concat demuxer.
+    With one, each clip is a separate input and consecutive clips are
+    blended by ffmpeg's ``xfade`` (and their audio by ``acrossfade``). Each
+    fade runs over a held last frame of the outgoing clip rather than its
+    final seconds, so the result is as long as the clips themselves, as
+    with MoviePy's :func:`~mvg.editor.compositor.add_transitions`.
+
+    Each overlay is a full-frame RGBA image (see
+    :func:`~mvg.editor.overlays.rasterize_text`) shown between its start and
+    end time by ffmpeg's ``overlay`` filter. The video is decoded and encoded
+    once by ffmpeg with no per-frame Python work. The clips must share
+    stream parameters (see :func:`can_concat_copy`).
+
+    Args:
+        clip_paths: List of paths to video clip files, in order.
+        output_path: Path for output file.
+        overlays: ``(image, start, end)`` tuples, times in seconds on the
+            output timeline (see :func:`clip_starts`).
+        transition: Crossfade duration in seconds (0 for hard cuts).
+        codec: Video encoder.
+        preset: Encoding preset.
+        bitrate: Video bitrate (e.g., "5000k"). None for auto.
+        audio_path: Optional music track that replaces the clips' audio.
+        audio_codec: Codec for the music track.
+        fade_out: Duration of a fade out at the end of the music (seconds).
+
+    Returns:
+        Path to the output file.
+
+    Raises:
+        ValueError: If clip_paths is empty.
+        RuntimeError: If ffmpeg fails.
+    """
+    if not clip_paths:
+        raise ValueError("No clips provided")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    infos = [probe(clip_path) for clip_path in clip_paths]
+    crossfade = transition > 0 and len(clip_paths) > 1
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filters = []
+        audio_label = None
+        if crossfade:
+            list_file = None
+            inputs = []
+            for clip_path in clip_paths:
+                inputs += ["-i", str(clip_path)]
+            filters, label, audio_label, duration = _crossfade_filters(
+                [info.duration for info in infos],
+                transition,
+                with_audio=audio_path is None and infos[0].has_audio,
+            )
+        else:
+            list_file = _write_concat_list(clip_paths)
+            inputs = ["-f", "concat", "-safe", "0", "-i", list_file]
+            label = "0:v"
+            duration = sum(info.duration for info in infos)
+
+        # Chain one overlay filter per image: [0:v][1:v]overlay...[v1];[v1][2:v]...
+        first_image = len(clip_paths) if crossfade else 1
+        for i, (image, start, end) in enumerate(overlays, start=first_image):
+            image_path = os.path.join(tmp_dir, f"overlay_{i}.png")
+            image.save(image_path)
+            inputs += ["-i", image_path]
+            filters.append(
+                f"[{label}][{i}:v]overlay=enable='between(t,{start:.3f},{end:.3f})'[v{i}]"
+            )
+            label = f"v{i}"
+
+        outputs = []
+        if filters:
+            outputs += ["-filter_complex", ";".join(filters), "-map", f"[{label}]"]
+        else:
+            outputs += ["-map", "0:v"]
+        outputs += ["-c:v", codec, "-preset", preset, "-pix_fmt", "yuv420p"]
+        if bitrate:
+            outputs += ["-b:v", bitrate]
+
+        if audio_path is not None:
+            music_index = first_image + len(overlays)
+            inputs += ["-stream_loop", "-1", "-i", str(audio_path)]
+            outputs += _music_args(music_index, duration, audio_codec, fade_out)
+        elif audio_label is not None:
+            outputs += ["-map", f"[{audio_label}]", "-c:a", audio_codec]
+        elif not crossfade:
+            outputs += ["-map", "0:a?", "-c:a", "copy"]
+
+        cmd = [FFMPEG_BINARY, "-v", "error", "-y", *inputs, *outputs, str(output_path)]
+        _run_ffmpeg(cmd, list_file, "render")
+
+    return output_path
@@ -1,14 +1,21 @@
 """Text overlay rendering for video clips."""
 
-from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from moviepy import TextClip, VideoClip, CompositeVideoClip
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextStyle:
-    """Configuration for text overlay styling."""
+    """Configuration for text overlay styling.
+
+    Styles are immutable and hashable; derive variants with
+    ``dataclasses.replace``.
+    """
 
     font: str = "Arial"
     font_size: int = 48
@@ -16,11 +23,11 @@ class TextStyle:
     stroke_color: Optional[str] = "black"
     stroke_width: int = 2
     background_color: Optional[str] = None
-    background_padding: Tuple[int, int] = field(default_factory=lambda: (10, 5))
+    background_padding: Tuple[int, int] = (10, 5)
 
 
-# Preset styles
-STYLES = {
+# Preset styles; extend with register_style()
+_STYLES: Dict[str, TextStyle] = {
     "default": TextStyle(),
     "title": TextStyle(font_size=72, stroke_width=3),
     "subtitle": TextStyle(font_size=36, stroke_width=1),
@@ -37,28 +44,20 @@ STYLES = {
     ),
 }
 
+# Read-only view of the registered styles
+STYLES: Mapping[str, TextStyle] = MappingProxyType(_STYLES)
 
-def render_text(
-    text: str,
-    style: Optional[TextStyle] = None,
-    duration: Optional[float] = None
-) -> TextClip:
-    """Create a text clip with the given style.
+_DEFAULT_STYLE = _STYLES["default"]
 
-    Args:
-        text: Text content to render.
-        style: TextStyle configuration. Uses default if None.
-        duration: Duration of the text clip in seconds.
 
-    Returns:
-        TextClip with the styled text.
-    """
-    if style is None:
-        style = STYLES["default"]
+@lru_cache(maxsize=64)
+def _style_params(style: TextStyle) -> Mapping[str, object]:
+    """Translate a style into TextClip keyword arguments, once per style.
 
-    # Build TextClip parameters
+    Keyed by the (frozen) style itself, so styles added with
+    :func:`register_style` need no cache invalidation.
+    """
     params = {
-        "text": text,
         "font": style.font,
         "font_size": style.font_size,
         "color": style.color,
@@ -69,14 +68,42 @@ def render_text(
         params["stroke_width"] = style.stroke_width
 
     if style.background_color:
-        params["bg_color"] = style.background_color
+        # PIL (and so TextClip) rejects CSS rgba() with a fractional alpha
+        params["bg_color"] = _pil_color(style.background_color)
 
-    text_clip = TextClip(**params)
+    return MappingProxyType(params)
+
+
+@lru_cache(maxsize=256)
+def _render_cached(text: str, style: TextStyle) -> TextClip:
+    """Rasterize a text clip once per (text, style); callers get copies."""
+    return TextClip(text=text, **_style_params(style))
 
-    if duration is not None:
-        text_clip = text_clip.with_duration(duration)
 
-    return text_clip
+def render_text(
+    text: str,
+    style: TextStyle = _DEFAULT_STYLE,
+    duration: Optional[float] = None
+) -> TextClip:
+    """Create a text clip with the given style.
+
+    Rendered glyphs are cached per text and style, so repeated captions
+    are rasterized only once.
+
+    Args:
+        text: Text content to render.
+        style: TextStyle configuration. Uses the default preset if omitted.
+        duration: Duration of the text clip in seconds.
+
+    Returns:
+        TextClip with the styled text.
+    """
+    text_clip = _render_cached(text, style)
+
+    # Both branches return a copy, so the cached clip is never handed out
+    if duration is not None:
+        return text_clip.with_duration(duration)
+    return text_clip.copy()
 
 
 def apply_style(text_clip: TextClip, style_name: str) -> TextClip:
@@ -92,22 +119,52 @@ def apply_style(text_clip: TextClip, style_name: str) -> TextClip:
     Raises:
         ValueError: If style_name is not found.
     """
-    if style_name not in STYLES:
-        raise ValueError(f"Unknown style: {style_name}. Available: {list(STYLES.keys())}")
+    style = get_style(style_name)
 
     # Get the text content and duration
     # Note: We need to recreate the clip with new style
     return render_text(
         text=text_clip.text if hasattr(text_clip, 'text') else "",
-        style=STYLES[style_name],
+        style=style,
         duration=text_clip.duration
     )
 
 
+# Position name -> (horizontal, vertical) anchor, shared by the MoviePy and
+# Pillow renderers
+_ANCHORS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "center": ("center", "center"),
+    "top": ("center", "top"),
+    "bottom": ("center", "bottom"),
+    "top-left": ("left", "top"),
+    "top-right": ("right", "top"),
+    "bottom-left": ("left", "bottom"),
+    "bottom-right": ("right", "bottom"),
+})
+
+
+def _anchors(position: str) -> Tuple[str, str]:
+    """Look up a position name, raising ValueError for unknown names."""
+    try:
+        return _ANCHORS[position]
+    except KeyError:
+        raise ValueError(f"Unknown position: {position}. Available: {list(_ANCHORS)}") from None
+
+
+def _anchor_offset(anchor: str, extent: int, size: int, margin: int) -> int:
+    """Return the pixel offset of a ``size``-long item anchored in ``extent``."""
+    if anchor == "center":
+        return (extent - size) // 2
+    if anchor in ("left", "top"):
+        return margin
+    return extent - size - margin
+
+
 def position_overlay(
     text_clip: TextClip,
     position: str = "center",
-    margin: int = 50
+    margin: int = 50,
+    frame_size: Optional[Tuple[int, int]] = None
 ) -> TextClip:
     """Position a text overlay on the screen.
 
@@ -120,34 +177,32 @@ def position_overlay(
             - "top-left", "top-right"
             - "bottom-left", "bottom-right"
         margin: Margin from edges in pixels.
+        frame_size: ``(width, height)`` of the video the text goes on.
+            Needed to keep the margin from the bottom and right edges;
+            without it those positions sit flush against the edge.
 
     Returns:
         Text clip with position set.
     """
-    position_map = {
-        "center": ("center", "center"),
-        "top": ("center", margin),
-        "bottom": ("center", -margin),
-        "top-left": (margin, margin),
-        "top-right": (-margin, margin),
-        "bottom-left": (margin, -margin),
-        "bottom-right": (-margin, -margin),
-    }
+    # Allow tuple positions like (100, 200)
+    if isinstance(position, tuple):
+        return text_clip.with_position(position)
 
-    if position not in position_map:
-        # Allow tuple positions like (100, 200)
-        if isinstance(position, tuple):
-            return text_clip.with_position(position)
-        raise ValueError(f"Unknown position: {position}. Available: {list(position_map.keys())}")
+    horizontal, vertical = _anchors(position)
 
-    pos = position_map[position]
+    if frame_size is None:
+        # MoviePy resolves edge names against the final frame itself
+        return text_clip.with_position((
+            margin if horizontal == "left" else horizontal,
+            margin if vertical == "top" else vertical,
+        ))
 
-    # Handle negative margins for bottom/right positioning
-    if isinstance(pos[1], int) and pos[1] < 0:
-        # Bottom positioning
-        return text_clip.with_position((pos[0], lambda t: ("center", pos[1])))
-
-    return text_clip.with_position(pos)
+    width, height = frame_size
+    text_w, text_h = text_clip.size
+    return text_clip.with_position((
+        _anchor_offset(horizontal, width, text_w, margin),
+        _anchor_offset(vertical, height, text_h, margin),
+    ))
 
 
 def add_text_overlay(
@@ -171,10 +226,7 @@ def add_text_overlay(
     Returns:
         Composite video clip with text overlay.
     """
-    if style_name not in STYLES:
-        style_name = "default"
-
-    style = STYLES[style_name]
+    style = STYLES.get(style_name, _DEFAULT_STYLE)
 
     # Calculate duration
     if duration is None:
@@ -182,7 +234,7 @@ def add_text_overlay(
 
     # Create and position text
     text_clip = render_text(text, style, duration)
-    text_clip = position_overlay(text_clip, position)
+    text_clip = position_overlay(text_clip, position, frame_size=video.size)
 
     # Set start time
     if start_time > 0:
@@ -203,9 +255,10 @@ def get_style(name: str) -> TextStyle:
     Raises:
         ValueError: If style not found.
     """
-    if name not in STYLES:
-        raise ValueError(f"Unknown style: {name}. Available: {list(STYLES.keys())}")
-    return STYLES[name]
+    try:
+        return STYLES[name]
+    except KeyError:
+        raise ValueError(f"Unknown style: {name}. Available: {list(STYLES.keys())}") from None
 
 
 def register_style(name: str, style: TextStyle) -> None:
@@ -215,4 +268,78 @@ def register_style(name: str, style: TextStyle) -> None:
         name: Name for the style.
         style: TextStyle configuration.
     """
-    STYLES[name] = style
+    _STYLES[name] = style
+
+
+def _pil_color(color: str) -> Tuple[int, ...]:
+    """Convert a color name or CSS color (including float alpha) for Pillow."""
+    if color.startswith("rgba(") and color.endswith(")"):
+        r, g, b, a = (part.strip() for part in color[5:-1].split(","))
+        alpha = float(a)
+        return (int(r), int(g), int(b), round(alpha * 255) if alpha <= 1 else int(alpha))
+    return ImageColor.getrgb(color)
+
+
+@lru_cache(maxsize=32)
+def _load_font(font: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font once per (font, size), falling back to Pillow's bundled font."""
+    try:
+        return ImageFont.truetype(font, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+def rasterize_text(
+    text: str,
+    frame_size: Tuple[int, int],
+    style: TextStyle = _DEFAULT_STYLE,
+    position: str = "bottom",
+    margin: int = 50
+) -> Image.Image:
+    """Render a text overlay once into a transparent full-frame image.
+
+    The image can be composited by ffmpeg's overlay filter, so no frames
+    pass through Python while encoding.
+
+    Args:
+        text: Text content to render.
+        frame_size: ``(width, height)`` of the video.
+        style: TextStyle configuration. Uses the default preset if omitted.
+        position: Position name, as for :func:`position_overlay`.
+        margin: Margin from edges in pixels.
+
+    Returns:
+        RGBA image the size of the frame with the text drawn on it.
+
+    Raises:
+        ValueError: If position is not a known position name.
+    """
+    width, height = frame_size
+    image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    font = _load_font(style.font, style.font_size)
+
+    stroke_width = style.stroke_width if style.stroke_color else 0
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font, stroke_width=stroke_width)
+    text_w, text_h = right - left, bottom - top
+
+    horizontal, vertical = _anchors(position)
+    x = _anchor_offset(horizontal, width, text_w, margin)
+    y = _anchor_offset(vertical, height, text_h, margin)
+
+    if style.background_color:
+        pad_x, pad_y = style.background_padding
+        draw.rectangle(
+            (x - pad_x, y - pad_y, x + text_w + pad_x, y + text_h + pad_y),
+            fill=_pil_color(style.background_color),
+        )
+
+    draw.text(
+        (x - left, y - top),
+        text,
+        font=font,
+        fill=_pil_color(style.color),
+        stroke_width=stroke_width,
+        stroke_fill=_pil_color(style.stroke_color) if stroke_width else None,
+    )
+    return image
@@ -0,0 +1,57 @@
+"""Cached media metadata lookups."""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+
+@dataclass(frozen=True)
+class ClipInfo:
+    """Stream properties of a media file."""
+
+    width: int
+    height: int
+    duration: float
+    video_codec: Optional[str] = None
+    fps: Optional[float] = None
+    has_audio: bool = False
+    audio_fps: Optional[int] = None
+
+
+@lru_cache(maxsize=1024)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> ClipInfo:
+    """Probe a file; mtime and size only key the cache."""
+    infos = ffmpeg_parse_infos(path)
+    width, height = infos.get("video_size") or (0, 0)
+    return ClipInfo(
+        width=width,
+        height=height,
+        duration=infos.get("duration") or 0.0,
+        video_codec=infos.get("video_codec_name"),
+        fps=infos.get("video_fps"),
+        has_audio=infos.get("audio_found", False),
+        audio_fps=infos.get("audio_fps"),
+    )
+
+
+def probe(clip_path: Path) -> ClipInfo:
+    """Read stream properties of a media file without opening a clip.
+
+    Results are cached per path and invalidated when the file's
+    modification time or size changes.
+
+    Args:
+        clip_path: Path to the media file.
+
+    Returns:
+        ClipInfo for the file.
+
+    Raises:
+        OSError: If the file doesn't exist or can't be read.
+    """
+    st = os.stat(clip_path)
+    return _probe_cached(os.fspath(clip_path), st.st_mtime_ns, st.st_size)
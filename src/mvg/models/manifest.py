@@ -1,12 +1,37 @@
 """Manifest data model."""
 
+import hashlib
+import json
+import logging
+import os
 from typing import List, Optional
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import yaml
 
 from .scene import Scene
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader/dumper; the pure-Python ones are much slower
+try:
+    _YamlLoader = yaml.CSafeLoader
+    _YamlDumper = yaml.CSafeDumper
+except AttributeError:
+    logger.warning(
+        "PyYAML was built without libyaml; manifests will load with the slower "
+        "pure-Python parser"
+    )
+    _YamlLoader = yaml.SafeLoader
+    _YamlDumper = yaml.SafeDumper
+
+# Parsed manifests are cached here as JSON, keyed by a hash of the YAML bytes
+_CACHE_DIR = Path("~/.cache/mvg").expanduser()
+
+# Mixed into cache keys; bump whenever Manifest or Scene fields change, since
+# cached files are loaded without validation
+_CACHE_FORMAT = b"1"
+
 
 class Manifest(BaseModel):
     """Video project manifest."""
@@ -17,18 +42,67 @@ class Manifest(BaseModel):
     aspect_ratio: str = Field(default="9:16", description="Output aspect ratio")
     output_format: str = Field(default="mp4", description="Output video format")
     
-    class Config:
-        """Pydantic config."""
-        frozen = False
+    model_config = ConfigDict(frozen=False, extra="ignore", validate_assignment=False)
     
     @classmethod
     def from_yaml(cls, path: Path) -> "Manifest":
-        """Load manifest from YAML file."""
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        """Load manifest from YAML file.
+
+        The validated manifest is cached as JSON under ``~/.cache/mvg``,
+        keyed by a hash of the file's contents, and read back from there
+        while the YAML is unchanged. The YAML file stays the source of truth.
+        """
+        raw = Path(path).read_bytes()
+        key = hashlib.blake2b(raw, digest_size=16, salt=_CACHE_FORMAT).hexdigest()
+        cache = _CACHE_DIR / f"{key}.json"
+
+        try:
+            return cls.from_json_cache(cache)
+        except (OSError, ValueError, TypeError):
+            # Missing or unreadable cache: rebuild it from YAML
+            pass
+
+        logger.debug("Loading manifest %s with %s", path, _YamlLoader.__name__)
+        manifest = cls.model_validate(yaml.load(raw, Loader=_YamlLoader))
+
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(manifest.model_dump_json())
+            os.replace(tmp, cache)
+        except OSError:
+            # Caching is best effort; a read-only home directory is fine.
+            # Cleanup can fail the same way when the directory is unusable.
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return manifest
+
+    @classmethod
+    def from_json_cache(cls, path: Path) -> "Manifest":
+        """Load a manifest from JSON written by ``model_dump_json``.
+
+        The data is trusted and skips validation entirely (``model_construct``
+        for the manifest and each scene), so only use this for files this
+        package wrote itself, such as the :meth:`from_yaml` cache.
+        """
+        data = json.loads(Path(path).read_bytes())
+        scenes = [Scene.model_construct(**scene) for scene in data.pop("scenes", ())]
+        return cls.model_construct(scenes=scenes, **data)
     
     def to_yaml(self, path: Path) -> None:
-        """Save manifest to YAML file."""
+        """Save manifest to YAML file.
+
+        Keys are written in field order, which skips the dumper's sort and
+        keeps ``id`` first in each scene.
+        """
         with open(path, "w") as f:
-            yaml.safe_dump(self.model_dump(), f, default_flow_style=False)
+            yaml.dump(
+                self.model_dump(mode="python"),
+                f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
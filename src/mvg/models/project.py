@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .manifest import Manifest
 
@@ -25,6 +25,4 @@ class Project(BaseModel):
     clips_generated: List[str] = Field(default_factory=list, description="Generated clip paths")
     errors: List[str] = Field(default_factory=list, description="Error messages")
     
-    class Config:
-        """Pydantic config."""
-        frozen = False
+    model_config = ConfigDict(frozen=False, extra="ignore", validate_assignment=False)
@@ -1,11 +1,14 @@
 """Scene data model."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Scene(BaseModel):
-    """Represents a single scene in the video."""
+    """Represents a single scene in the video.
+
+    Scenes are immutable; derive changed copies with ``model_copy(update=...)``.
+    """
     
     id: str = Field(..., description="Unique scene identifier")
     prompt: Optional[str] = Field(None, description="Veo generation prompt")
@@ -15,6 +18,4 @@ class Scene(BaseModel):
     overlay_text: Optional[str] = Field(None, description="Text to overlay on scene")
     overlay_style: Optional[str] = Field(None, description="Text overlay style name")
     
-    class Config:
-        """Pydantic config."""
-        frozen = False
+    model_config = ConfigDict(frozen=True, validate_default=False, extra="ignore")
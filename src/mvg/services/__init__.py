@@ -1,7 +1,34 @@
-"""External service integrations."""
+"""External service integrations.
 
-from .anthropic import AnthropicClient
-from .veo import VeoClient, GenerationStatus, GenerationResult, save_generation_metadata
+Each client lives in its own submodule and pulls in a large SDK, so names
+here are imported on first access; using one service doesn't load the
+others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicClient
+    from .veo import (
+        VeoClient,
+        GenerationStatus,
+        GenerationResult,
+        asave_generation_metadata,
+        encode_reference_image,
+        save_generation_metadata,
+    )
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "AnthropicClient": ".anthropic",
+    "VeoClient": ".veo",
+    "GenerationStatus": ".veo",
+    "GenerationResult": ".veo",
+    "save_generation_metadata": ".veo",
+    "asave_generation_metadata": ".veo",
+    "encode_reference_image": ".veo",
+}
 
 __all__ = [
     "AnthropicClient",
@@ -9,4 +36,14 @@ __all__ = [
     "GenerationStatus",
     "GenerationResult",
     "save_generation_metadata",
+    "asave_generation_metadata",
+    "encode_reference_image",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(import_module(module, __name__), name)
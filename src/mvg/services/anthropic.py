@@ -1,18 +1,57 @@
 """Anthropic Claude API client wrapper."""
 
+import asyncio
 import logging
+import random
 import time
-from typing import Optional
+import weakref
+from functools import lru_cache
+from typing import Iterator, Optional
 
-from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIError,
+    APIConnectionError,
+    APIStatusError,
+    RateLimitError,
+)
 
-from ..config import config
+from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_anthropic(api_key: str) -> Anthropic:
+    """Return a process-wide SDK client (and connection pool) per API key.
+
+    The SDK's own retries are off; AnthropicClient retries with backoff.
+    """
+    return Anthropic(api_key=api_key, max_retries=0)
+
+
+def _is_retryable(error: APIError) -> bool:
+    """Return whether ``error`` is worth retrying.
+
+    Covers what the SDK's own retries would: rate limits, connection
+    failures, and 5xx responses including 529 overloaded.
+    """
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
 class AnthropicClient:
-    """Client wrapper for Anthropic Claude API with retry logic."""
+    """Client wrapper for Anthropic Claude API with retry logic.
+
+    The underlying SDK client keeps an httpx connection pool and is shared
+    by all instances using the same API key, so connections (and their TLS
+    sessions) are reused across calls and instances.
+    """
+
+    # Upper bound on a single backoff, before jitter
+    MAX_RETRY_DELAY = 60.0
 
     def __init__(
         self,
@@ -29,14 +68,20 @@ class AnthropicClient:
             max_retries: Maximum number of retry attempts for failed requests.
             retry_delay: Base delay between retries in seconds (exponential backoff).
         """
-        self._api_key = api_key or config.anthropic_api_key
+        self._api_key = api_key or get_config().anthropic_api_key
         if not self._api_key:
             raise ValueError(
                 "Anthropic API key not provided. Set ANTHROPIC_API_KEY env var."
             )
 
-        self._client = Anthropic(api_key=self._api_key)
-        self._model = model or config.default_model
+        self._client = _get_anthropic(self._api_key)
+        # Async SDK clients, one per event loop: each one's connection pool
+        # is bound to the loop it was first used on, and instances are shared
+        # by callers that may each run their own loop
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncAnthropic
+        ] = weakref.WeakKeyDictionary()
+        self._model = model or get_config().default_model
         self._max_retries = max_retries
         self._retry_delay = retry_delay
 
@@ -45,6 +90,33 @@ class AnthropicClient:
         """Return the model being used."""
         return self._model
 
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Return how long to wait before retrying after ``error``.
+
+        Exponential backoff with full jitter, so workers rate limited at the
+        same moment don't retry in lockstep; a server ``retry-after`` header
+        sets the minimum.
+        """
+        delay = random.uniform(0, min(self.MAX_RETRY_DELAY, self._retry_delay * (2**attempt)))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                # An HTTP date rather than seconds; keep the backoff
+                pass
+        return delay
+
+    def _async_client(self) -> AsyncAnthropic:
+        """Return the async SDK client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncAnthropic(api_key=self._api_key, max_retries=0)
+            self._async_clients[loop] = client
+        return client
+
     def create_message(
         self,
         prompt: str,
@@ -66,7 +138,14 @@ class AnthropicClient:
         Raises:
             APIError: If the API request fails after all retries.
         """
-        messages = [{"role": "user", "content": prompt}]
+        kwargs = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if system:
+            kwargs["system"] = system
 
         for attempt in range(self._max_retries):
             try:
@@ -74,15 +153,6 @@ class AnthropicClient:
                     f"Sending request to Claude (attempt {attempt + 1}/{self._max_retries})"
                 )
 
-                kwargs = {
-                    "model": self._model,
-                    "max_tokens": max_tokens,
-                    "messages": messages,
-                    "temperature": temperature,
-                }
-                if system:
-                    kwargs["system"] = system
-
                 response = self._client.messages.create(**kwargs)
 
                 # Extract text content from response
@@ -91,22 +161,207 @@ class AnthropicClient:
                     return content.text
                 return str(content)
 
-            except RateLimitError as e:
-                delay = self._retry_delay * (2**attempt)
-                logger.warning(f"Rate limited. Retrying in {delay:.1f}s...")
-                time.sleep(delay)
+            except APIError as e:
+                if not _is_retryable(e):
+                    logger.error(f"API error: {e}")
+                    raise
                 if attempt == self._max_retries - 1:
                     raise
-
-            except APIConnectionError as e:
-                delay = self._retry_delay * (2**attempt)
-                logger.warning(f"Connection error: {e}. Retrying in {delay:.1f}s...")
+                delay = self._backoff(attempt, e)
+                logger.warning(f"{type(e).__name__}: {e}. Retrying in {delay:.1f}s...")
                 time.sleep(delay)
+
+        raise APIError("Max retries exceeded")
+
+    async def acreate_message(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> str:
+        """Create a message using Claude without blocking the event loop.
+
+        Same as :meth:`create_message`, so several requests can be awaited
+        concurrently (e.g. with ``asyncio.gather``).
+
+        Args:
+            prompt: The user prompt to send.
+            max_tokens: Maximum tokens in the response.
+            system: Optional system prompt.
+            temperature: Sampling temperature (0.0-1.0).
+
+        Returns:
+            The text content of Claude's response.
+
+        Raises:
+            APIError: If the API request fails after all retries.
+        """
+        client = self._async_client()
+
+        kwargs = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if system:
+            kwargs["system"] = system
+
+        for attempt in range(self._max_retries):
+            try:
+                logger.debug(
+                    f"Sending async request to Claude (attempt {attempt + 1}/{self._max_retries})"
+                )
+                response = await client.messages.create(**kwargs)
+
+                content = response.content[0]
+                if hasattr(content, "text"):
+                    return content.text
+                return str(content)
+
+            except APIError as e:
+                if not _is_retryable(e):
+                    logger.error(f"API error: {e}")
+                    raise
                 if attempt == self._max_retries - 1:
                     raise
+                delay = self._backoff(attempt, e)
+                logger.warning(f"{type(e).__name__}: {e}. Retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+        raise APIError("Max retries exceeded")
+
+    def stream_message(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Iterator[str]:
+        """Stream a message from Claude as text deltas.
+
+        Rate-limit, connection and 5xx errors are retried only until the
+        first delta arrives; after that a failure is raised to the caller,
+        since the partial text has already been consumed.
+
+        Args:
+            prompt: The user prompt to send.
+            max_tokens: Maximum tokens in the response.
+            system: Optional system prompt.
+            temperature: Sampling temperature (0.0-1.0).
+
+        Yields:
+            Text deltas of Claude's response, in order.
+
+        Raises:
+            APIError: If the API request fails after all retries.
+        """
+        kwargs = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if system:
+            kwargs["system"] = system
+
+        for attempt in range(self._max_retries):
+            started = False
+            try:
+                logger.debug(
+                    f"Streaming request to Claude (attempt {attempt + 1}/{self._max_retries})"
+                )
+                with self._client.messages.stream(**kwargs) as stream:
+                    for text in stream.text_stream:
+                        started = True
+                        yield text
+                return
 
             except APIError as e:
-                logger.error(f"API error: {e}")
-                raise
+                if not _is_retryable(e) or started or attempt == self._max_retries - 1:
+                    raise
+                delay = self._backoff(attempt, e)
+                logger.warning(f"{type(e).__name__}: {e}. Retrying in {delay:.1f}s...")
+                time.sleep(delay)
 
-        raise APIError("Max retries exceeded")
+    def create_message_batch(
+        self,
+        prompts: list[str],
+        max_tokens: int = 4096,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        poll_interval: float = 10.0,
+        timeout: float = 3600.0,
+    ) -> list[str]:
+        """Create several messages in one Message Batches request.
+
+        All prompts share the same model, system prompt and sampling
+        settings. The batch is submitted once and polled until it ends. If
+        it hasn't ended within ``timeout`` seconds, or polling it fails, the
+        batch is cancelled so its requests aren't left running.
+
+        Args:
+            prompts: User prompts to send, one message per prompt.
+            max_tokens: Maximum tokens in each response.
+            system: Optional system prompt shared by all requests.
+            temperature: Sampling temperature (0.0-1.0).
+            poll_interval: Seconds between batch status checks.
+            timeout: Seconds to wait for the batch to end.
+
+        Returns:
+            Text content of each response, in the same order as ``prompts``.
+
+        Raises:
+            ValueError: If any request in the batch did not succeed.
+            TimeoutError: If the batch didn't end within ``timeout``.
+        """
+        params: dict = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if system:
+            params["system"] = system
+
+        requests = [
+            {
+                "custom_id": f"request-{i}",
+                "params": {**params, "messages": [{"role": "user", "content": prompt}]},
+            }
+            for i, prompt in enumerate(prompts)
+        ]
+
+        # Batch calls have no retry loop here, so let the SDK retry them
+        batches = self._client.with_options(max_retries=2).messages.batches
+        batch = batches.create(requests=requests)
+        logger.info(f"Submitted message batch {batch.id} with {len(prompts)} requests")
+
+        deadline = time.monotonic() + timeout
+        try:
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Message batch {batch.id} did not end within {timeout:.0f}s"
+                    )
+                time.sleep(poll_interval)
+                batch = batches.retrieve(batch.id)
+                logger.debug(f"Batch {batch.id} status: {batch.processing_status}")
+        except (TimeoutError, APIError) as e:
+            logger.warning(f"Cancelling message batch {batch.id}: {e}")
+            try:
+                batches.cancel(batch.id)
+            except APIError as cancel_error:
+                logger.warning(f"Could not cancel batch {batch.id}: {cancel_error}")
+            raise
+
+        texts: dict[str, str] = {}
+        for entry in batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                raise ValueError(
+                    f"Batch request {entry.custom_id} did not succeed: {entry.result.type}"
+                )
+            content = entry.result.message.content[0]
+            texts[entry.custom_id] = content.text if hasattr(content, "text") else str(content)
+
+        return [texts[f"request-{i}"] for i in range(len(prompts))]
@@ -1,25 +1,92 @@
 """Google Imagen API client wrapper via Vertex AI."""
 
+import asyncio
 import base64
 import json
 import logging
+import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Sequence, Tuple
 
 import google.auth
 import google.auth.transport.requests
+import httpx
 import requests
-from google.api_core import exceptions as google_exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..config import config
+from ..config import get_config
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Parse response bodies straight from bytes; orjson skips the str decode
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Read size for streamed responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _Base64Streamer:
+    """Decode the first ``bytesBase64Encoded`` value of a JSON body as it arrives.
+
+    Raw response chunks are fed in; the scanner skips ahead to the key and
+    then decodes the string value in 4-character-aligned pieces straight
+    into ``out``, so neither the body nor the image is held whole in memory.
+    """
+
+    _MARKER = b'"bytesBase64Encoded"'
+
+    def __init__(self, out: BinaryIO) -> None:
+        self._out = out
+        self._pending = b""
+        self._in_value = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+
+        if not self._in_value:
+            buf = self._pending + chunk
+            start = buf.find(self._MARKER)
+            if start < 0:
+                # Keep enough to match a marker split across chunks
+                self._pending = buf[-len(self._MARKER):]
+                return
+            quote = buf.find(b'"', start + len(self._MARKER))
+            if quote < 0:
+                self._pending = buf[start:]
+                return
+            self._in_value = True
+            self._pending = b""
+            chunk = buf[quote + 1:]
+
+        # Base64 never contains a quote or backslash, so the first quote
+        # ends the value and any backslash is a JSON escape (as in "\/")
+        end = chunk.find(b'"')
+        data = self._pending + (chunk if end < 0 else chunk[:end]).replace(b"\\", b"")
+        if end >= 0:
+            self._out.write(base64.b64decode(data))
+            self._pending = b""
+            self.done = True
+            return
+
+        usable = len(data) - len(data) % 4
+        self._out.write(base64.b64decode(data[:usable]))
+        self._pending = data[usable:]
+
+
+@dataclass(slots=True)
 class ImageResult:
     """Result of an Imagen generation operation."""
 
@@ -35,6 +102,8 @@ class ImagenClient:
 
     DEFAULT_LOCATION = "us-central1"
     DEFAULT_MODEL = "imagen-3.0-generate-001"
+    # (connect, read) timeouts in seconds; generation can take a while
+    REQUEST_TIMEOUT = (5, 120)
 
     def __init__(
         self,
@@ -49,13 +118,27 @@ class ImagenClient:
             location: GCP region for Vertex AI.
             model: Imagen model name.
         """
-        self._project_id = project_id or config.google_cloud_project
+        self._project_id = project_id or get_config().google_cloud_project
         self._location = location
-        self._model = model or getattr(config, 'imagen_model', None) or self.DEFAULT_MODEL
+        self._model = model or getattr(get_config(), 'imagen_model', None) or self.DEFAULT_MODEL
 
         if not self._project_id:
             raise ValueError("GOOGLE_CLOUD_PROJECT not set")
 
+        # Credentials are resolved on first use and shared by sync and
+        # async calls; the lock keeps concurrent callers from refreshing
+        # the same token at once
+        self._credentials = None
+        self._auth_req = None
+        self._auth_lock = threading.Lock()
+
+        # Reuse connections (and their TLS sessions) across generations
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=0)),
+        )
+
     @property
     def project_id(self) -> str:
         return self._project_id
@@ -64,6 +147,128 @@ class ImagenClient:
     def model(self) -> str:
         return self._model
 
+    def _token(self) -> str:
+        """Return an access token, refreshing it only when it has expired."""
+        with self._auth_lock:
+            if self._credentials is None:
+                scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+                self._credentials, _ = google.auth.default(scopes=scopes)
+                self._auth_req = google.auth.transport.requests.Request()
+            if not self._credentials.valid:
+                self._credentials.refresh(self._auth_req)
+            return self._credentials.token
+
+    def _endpoint(self) -> str:
+        """Return the Imagen predict URL for this client's model."""
+        return (
+            f"https://{self._location}-aiplatform.googleapis.com/v1/"
+            f"projects/{self._project_id}/locations/{self._location}/"
+            f"publishers/google/models/{self._model}:predict"
+        )
+
+    def _new_result(self, prompt: str, aspect_ratio: str) -> ImageResult:
+        """Start an ImageResult for one generation."""
+        return ImageResult(
+            prompt=prompt,
+            created_at=datetime.now(),
+            metadata={
+                "aspect_ratio": aspect_ratio,
+                "model": self._model,
+            },
+        )
+
+    @staticmethod
+    def _request_body(
+        prompt: str,
+        aspect_ratio: str,
+        negative_prompt: Optional[str],
+        num_images: int,
+    ) -> dict:
+        """Build the predict request body."""
+        request_body = {
+            "instances": [
+                {"prompt": prompt}
+            ],
+            "parameters": {
+                "sampleCount": num_images,
+                "aspectRatio": aspect_ratio,
+            },
+        }
+
+        if negative_prompt:
+            request_body["parameters"]["negativePrompt"] = negative_prompt
+
+        return request_body
+
+    @staticmethod
+    def _save_image(result: ImageResult, data: dict, output_path: Path) -> ImageResult:
+        """Decode the first predicted image in ``data`` into ``output_path``."""
+        # Save the raw response only when debugging; it holds the whole
+        # base64 image and can be several MB
+        if logger.isEnabledFor(logging.DEBUG):
+            debug_file = Path(f"imagen_response_{int(time.time())}.json")
+            if orjson is not None:
+                debug_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                debug_file.write_text(json.dumps(data, indent=2))
+            logger.debug(f"Saved response to {debug_file}")
+
+        # Extract image from response
+        predictions = data.get("predictions", [])
+        if not predictions:
+            result.error_message = "No predictions in response"
+            return result
+
+        # Get first image
+        image_data = predictions[0].get("bytesBase64Encoded")
+        if not image_data:
+            result.error_message = "No image data in response"
+            return result
+
+        # Decode and save; write the bytes with one unbuffered os.write
+        # rather than copying them through a file object's buffer, to a
+        # temporary name first so a crash never leaves a truncated image
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        image_bytes = base64.b64decode(image_data)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
+
+        result.local_path = output_path
+        logger.info(f"Saved image to {output_path}")
+
+        return result
+
+    @staticmethod
+    def _stream_target(output_path: Path) -> Path:
+        """Prepare to stream an image to ``output_path``; returns the temp path."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return output_path.with_name(output_path.name + ".tmp")
+
+    @staticmethod
+    def _finish_stream(
+        result: ImageResult,
+        streamer: _Base64Streamer,
+        tmp_path: Path,
+        output_path: Path,
+    ) -> ImageResult:
+        """Move a fully streamed image into place, or record why it wasn't."""
+        if not streamer.done:
+            tmp_path.unlink(missing_ok=True)
+            result.error_message = "No image data in response"
+            return result
+
+        os.replace(tmp_path, output_path)
+        result.local_path = output_path
+        logger.info(f"Saved image to {output_path}")
+        return result
+
     def generate_image(
         self,
         prompt: str,
@@ -84,88 +289,164 @@ class ImagenClient:
         Returns:
             ImageResult with generation details.
         """
-        result = ImageResult(
-            prompt=prompt,
-            created_at=datetime.now(),
-            metadata={
-                "aspect_ratio": aspect_ratio,
-                "model": self._model,
-            },
-        )
+        result = self._new_result(prompt, aspect_ratio)
 
         try:
-            # Get credentials
-            scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-            credentials, _ = google.auth.default(scopes=scopes)
-            auth_req = google.auth.transport.requests.Request()
-            credentials.refresh(auth_req)
-
-            # Imagen API endpoint
-            url = (
-                f"https://{self._location}-aiplatform.googleapis.com/v1/"
-                f"projects/{self._project_id}/locations/{self._location}/"
-                f"publishers/google/models/{self._model}:predict"
-            )
-
-            # Build request
-            request_body = {
-                "instances": [
-                    {"prompt": prompt}
-                ],
-                "parameters": {
-                    "sampleCount": num_images,
-                    "aspectRatio": aspect_ratio,
-                },
-            }
-
-            if negative_prompt:
-                request_body["parameters"]["negativePrompt"] = negative_prompt
-
             headers = {
-                "Authorization": f"Bearer {credentials.token}",
+                "Authorization": f"Bearer {self._token()}",
                 "Content-Type": "application/json",
             }
 
+            # Stream the image to disk unless the whole response is wanted
+            # for the debug dump
+            stream = not logger.isEnabledFor(logging.DEBUG)
+
             logger.info(f"Generating image with Imagen: {prompt[:50]}...")
-            response = requests.post(url, json=request_body, headers=headers)
+            with self._session.post(
+                self._endpoint(),
+                json=self._request_body(prompt, aspect_ratio, negative_prompt, num_images),
+                headers=headers,
+                timeout=self.REQUEST_TIMEOUT,
+                stream=stream,
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = f"{response.status_code}: {response.text[:500]}"
+                    logger.error(f"Imagen API error: {error_msg}")
+                    result.error_message = error_msg
+                    return result
+
+                if not stream:
+                    return self._save_image(result, _loads(response.content), output_path)
+
+                tmp_path = self._stream_target(output_path)
+                try:
+                    with open(tmp_path, "wb") as f:
+                        streamer = _Base64Streamer(f)
+                        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+                            streamer.feed(chunk)
+                            if streamer.done:
+                                break
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+                return self._finish_stream(result, streamer, tmp_path, output_path)
 
-            if response.status_code != 200:
-                error_msg = f"{response.status_code}: {response.text[:500]}"
-                logger.error(f"Imagen API error: {error_msg}")
-                result.error_message = error_msg
-                return result
+        except Exception as e:
+            logger.error(f"Image generation failed: {e}")
+            result.error_message = str(e)
+            return result
 
-            data = response.json()
+    async def agenerate_image(
+        self,
+        prompt: str,
+        output_path: Path,
+        aspect_ratio: str = "1:1",
+        negative_prompt: Optional[str] = None,
+        num_images: int = 1,
+        http: Optional[httpx.AsyncClient] = None,
+    ) -> ImageResult:
+        """Generate an image from a text prompt without blocking the event loop.
 
-            # Save debug response
-            debug_file = Path(f"imagen_response_{int(time.time())}.json")
-            with open(debug_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-            logger.debug(f"Saved response to {debug_file}")
+        Same as :meth:`generate_image`, but the request is sent with httpx so
+        several generations can be in flight at once (see
+        :func:`generate_images`).
 
-            # Extract image from response
-            predictions = data.get("predictions", [])
-            if not predictions:
-                result.error_message = "No predictions in response"
-                return result
+        Args:
+            prompt: Text description of the image to generate.
+            output_path: Local path to save the generated image.
+            aspect_ratio: Image aspect ratio ('1:1', '16:9', '9:16', '4:3', '3:4').
+            negative_prompt: Things to avoid in the image.
+            num_images: Number of images to generate (saves first one).
+            http: Shared async HTTP client. A temporary one is used if None.
 
-            # Get first image
-            image_data = predictions[0].get("bytesBase64Encoded")
-            if not image_data:
-                result.error_message = "No image data in response"
-                return result
+        Returns:
+            ImageResult with generation details.
+        """
+        if http is None:
+            async with httpx.AsyncClient() as http:
+                return await self.agenerate_image(
+                    prompt, output_path, aspect_ratio, negative_prompt, num_images, http
+                )
 
-            # Decode and save
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "wb") as f:
-                f.write(base64.b64decode(image_data))
+        result = self._new_result(prompt, aspect_ratio)
 
-            result.local_path = output_path
-            logger.info(f"Saved image to {output_path}")
+        try:
+            # A refresh is a blocking request; keep it off the event loop
+            token = await asyncio.to_thread(self._token)
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
 
-            return result
+            logger.info(f"Generating image with Imagen: {prompt[:50]}...")
+            connect, read = self.REQUEST_TIMEOUT
+            async with http.stream(
+                "POST",
+                self._endpoint(),
+                json=self._request_body(prompt, aspect_ratio, negative_prompt, num_images),
+                headers=headers,
+                timeout=httpx.Timeout(read, connect=connect),
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    error_msg = f"{response.status_code}: {response.text[:500]}"
+                    logger.error(f"Imagen API error: {error_msg}")
+                    result.error_message = error_msg
+                    return result
+
+                # Keep the whole response for the debug dump
+                if logger.isEnabledFor(logging.DEBUG):
+                    body = await response.aread()
+                    return self._save_image(result, _loads(body), output_path)
+
+                tmp_path = self._stream_target(output_path)
+                try:
+                    with open(tmp_path, "wb") as f:
+                        streamer = _Base64Streamer(f)
+                        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                            streamer.feed(chunk)
+                            if streamer.done:
+                                break
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+                return self._finish_stream(result, streamer, tmp_path, output_path)
 
         except Exception as e:
             logger.error(f"Image generation failed: {e}")
             result.error_message = str(e)
             return result
+
+
+async def generate_images(
+    client: ImagenClient,
+    prompts_and_paths: Sequence[Tuple[str, Path]],
+    concurrency: int = 8,
+    **kwargs,
+) -> list[ImageResult]:
+    """Generate several images concurrently.
+
+    Requests share one connection pool and at most ``concurrency`` are in
+    flight at a time.
+
+    Args:
+        client: Imagen client to generate with.
+        prompts_and_paths: ``(prompt, output_path)`` pairs.
+        concurrency: Maximum number of requests in flight.
+        **kwargs: Extra arguments for :meth:`ImagenClient.agenerate_image`.
+
+    Returns:
+        One ImageResult per pair, in the same order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits) as http:
+
+        async def generate(prompt: str, output_path: Path) -> ImageResult:
+            async with semaphore:
+                return await client.agenerate_image(prompt, output_path, http=http, **kwargs)
+
+        return await asyncio.gather(
+            *(generate(prompt, output_path) for prompt, output_path in prompts_and_paths)
+        )
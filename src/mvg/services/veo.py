@@ -1,24 +1,158 @@
 """Google Veo 3 API client wrapper via Vertex AI."""
 
 import asyncio
+import base64
+import hashlib
 import json
 import logging
+import os
+import random
+import re
+import shutil
+import threading
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
+from urllib.parse import quote
 
-from google.cloud import aiplatform
-from google.cloud import storage
+import httpx
 from google.api_core import exceptions as google_exceptions
-from google.protobuf import json_format
 
-from ..config import config
+from ..config import get_config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Parse response bodies straight from bytes; finished operations carry the
+# whole video as base64, which orjson decodes much faster than json
+_loads = orjson.loads if orjson is not None else json.loads
+_PROGRESS_RE = re.compile(rb'"progressPercent"\s*:\s*(\d+)')
+_DONE_FALSE_RE = re.compile(rb'"done"\s*:\s*false')
+_dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+
+# Base64 works on 3-byte groups in and 4-character groups out, so blocks
+# sized in those multiples can be encoded or decoded independently
+_B64_READ_CHUNK = 3 * 87381
+_B64_WRITE_CHUNK = 4 * 65536
+
+_GCS_URI_RE = re.compile(r"gs://([^/]+)/(.+)")
+
+
+def _split_gcs_uri(gcs_uri: str) -> tuple[str, str]:
+    """Split a gs:// URI into bucket and object names."""
+    match = _GCS_URI_RE.fullmatch(gcs_uri)
+    if match is None:
+        raise ValueError(f"Invalid GCS URI: {gcs_uri}")
+    return match.group(1), match.group(2)
+
+
+def _gcs_media_url(gcs_uri: str) -> str:
+    """Return the JSON API download URL for a gs:// URI."""
+    bucket_name, blob_name = _split_gcs_uri(gcs_uri)
+    return (
+        f"https://storage.googleapis.com/storage/v1/b/{bucket_name}"
+        f"/o/{quote(blob_name, safe='')}?alt=media"
+    )
+
+
+def _elide_video_data(value):
+    """Return ``value`` with base64 video payloads replaced by their size."""
+    if isinstance(value, dict):
+        return {
+            key: f"<{len(item)} bytes elided>"
+            if key == "bytesBase64Encoded" and isinstance(item, str)
+            else _elide_video_data(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_elide_video_data(item) for item in value]
+    return value
+
+
+# Finished clips are indexed here by a hash of the request that produced them
+_CACHE_DIR = Path("~/.cache/mvg/veo").expanduser()
+
+
+# Objects above 8 MiB are fetched as parallel 8 MiB ranges; streamed
+# downloads are written in 1 MiB blocks
+_GCS_CHUNK_SIZE = 8 * 1024 * 1024
+_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+
+def encode_reference_image(path: Path, chunk: int = _B64_READ_CHUNK) -> str:
+    """Base64-encode a reference image, reading it in fixed-size blocks.
+
+    Pass the result as ``reference_image_b64`` to encode an image once for
+    many :meth:`VeoClient.generate_clip` calls.
+
+    Args:
+        path: Image file to encode.
+        chunk: Read size in bytes; must be a multiple of 3.
+
+    Returns:
+        The base64 text of the whole file.
+    """
+    out = bytearray()
+    with open(path, "rb") as f:
+        while block := f.read(chunk):
+            out += base64.b64encode(block)
+    return out.decode("ascii")
+
+
+def _write_b64(data: str, path: Path, chunk: int = _B64_WRITE_CHUNK) -> None:
+    """Decode base64 text into ``path`` block by block.
+
+    Avoids materialising the whole decoded video before writing it.
+    ``chunk`` must be a multiple of 4.
+    """
+    with open(path, "wb") as f:
+        for i in range(0, len(data), chunk):
+            f.write(base64.b64decode(data[i:i + chunk]))
+
+
+# Storage errors that another attempt cannot fix. The HTTP-flavoured
+# exceptions (Forbidden, Unauthorized, BadRequest) are what the JSON API
+# client raises; the gRPC ones cover other transports
+_UNRECOVERABLE_DOWNLOAD_ERRORS = (
+    google_exceptions.Forbidden,
+    google_exceptions.PermissionDenied,
+    google_exceptions.Unauthorized,
+    google_exceptions.Unauthenticated,
+    google_exceptions.BadRequest,
+    google_exceptions.InvalidArgument,
+)
+
+
+@lru_cache(maxsize=4)
+def _get_operations_client(location: str):
+    """Return a process-wide long-running operations client per region.
+
+    gRPC multiplexes calls over one HTTP/2 connection, so every VeoClient in
+    the process shares a single channel (with application default
+    credentials) instead of opening its own.
+    """
+    from google.api_core import grpc_helpers, operations_v1
+
+    channel = grpc_helpers.create_channel(
+        f"{location}-aiplatform.googleapis.com:443",
+        scopes=["https://www.googleapis.com/auth/cloud-platform"],
+    )
+    return operations_v1.OperationsClient(channel)
+
+
+class _OperationRunning(Exception):
+    """Raised while polling to signal an operation has not finished."""
+
 
 class GenerationStatus(str, Enum):
     """Status of a Veo generation operation."""
@@ -31,7 +165,7 @@ class GenerationStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of a Veo generation operation."""
 
@@ -43,6 +177,8 @@ class GenerationResult:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     metadata: dict = field(default_factory=dict)
+    # Base64 video returned inline, held only until it is written to disk
+    _video_b64: Optional[str] = field(default=None, repr=False, compare=False)
 
 
 class VeoClient:
@@ -58,10 +194,29 @@ class VeoClient:
     # Default configuration
     DEFAULT_LOCATION = "us-central1"
     DEFAULT_MODEL = "veo-3.1-fast-generate-001"
-    DEFAULT_POLL_INTERVAL = 10.0  # seconds
+    DEFAULT_POLL_INTERVAL = 2.0  # seconds
+    DEFAULT_INITIAL_POLL_INTERVAL = 2.0  # seconds
+    DEFAULT_MAX_POLL_INTERVAL = 20.0  # seconds
+    POLL_INTERVAL_GROWTH = 1.5
     DEFAULT_MAX_POLL_TIME = 600.0  # 10 minutes
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_DELAY = 2.0
+    DEFAULT_MAX_CONCURRENCY = 4
+    TOKEN_REFRESH_MARGIN = 60.0  # seconds before expiry to refresh the token
+    REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+    MAX_RETRY_DELAY = 60.0  # cap on a single backoff sleep
+    PARAM_CACHE_SIZE = 8
+    RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    # Map aspect ratio to Veo API format
+    # Veo uses "16:9" or "9:16" directly, not "16x9"
+    ASPECT_RATIOS = MappingProxyType({
+        "16:9": "16:9",
+        "9:16": "9:16",
+        "16x9": "16:9",
+        "9x16": "9:16",
+        "1:1": "1:1",
+    })
 
     def __init__(
         self,
@@ -74,6 +229,11 @@ class VeoClient:
         max_poll_time: float = DEFAULT_MAX_POLL_TIME,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        initial_poll_interval: float = DEFAULT_INITIAL_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        debug_save_responses: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        remote_cache: bool = False,
     ) -> None:
         """Initialize the Veo client.
 
@@ -84,11 +244,27 @@ class VeoClient:
             output_bucket: GCS bucket for output videos. Defaults to VEO_OUTPUT_BUCKET env var.
             credentials_path: Path to service account JSON. Defaults to
                 GOOGLE_APPLICATION_CREDENTIALS env var.
-            poll_interval: Seconds between polling checks.
+            poll_interval: Base delay of the SDK operation poller; doubles
+                after each check (with jitter) up to max_poll_interval.
             max_poll_time: Maximum seconds to wait for generation.
             max_retries: Maximum retry attempts for transient errors.
             retry_delay: Base delay between retries (exponential backoff).
+            initial_poll_interval: Seconds before the first REST status poll.
+                The interval grows by half after each unfinished poll.
+            max_poll_interval: Upper bound on the poll interval.
+            debug_save_responses: Write each finished operation to
+                veo_response_<id>.json, with video data elided.
+            max_concurrency: Most async generations in flight at once; extra
+                calls to :meth:`agenerate_clip` wait their turn. A generation
+                holds its slot from submit to download, so by Little's law
+                a good value is about requests-per-minute quota x average
+                generation time in minutes (e.g. 4 RPM x ~1 min = 4).
+            remote_cache: Also cache finished clips under ``cache/`` in the
+                output bucket, so reruns on any machine can skip the API.
+                Off by default: each generated clip is then stored twice in
+                the bucket, and writing the prefix may need extra IAM rights.
         """
+        config = get_config()
         self._project_id = project_id or config.google_cloud_project
         self._location = location
         self._model = model or config.veo_model or self.DEFAULT_MODEL
@@ -98,10 +274,31 @@ class VeoClient:
         self._max_poll_time = max_poll_time
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._initial_poll_interval = initial_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._debug_save_responses = debug_save_responses
+        self._max_concurrency = max_concurrency
+        self._remote_cache = remote_cache
+        self._async_gate: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+        # Encoded request parameters keyed by (aspect ratio, duration, reference)
+        self._param_cache: dict[tuple[str, int, Optional[str]], bytes] = {}
+
+        # Endpoints only depend on configuration, so build them once
+        self._api_base = f"https://{self._location}-aiplatform.googleapis.com/v1/"
+        self._predict_url = (
+            f"{self._api_base}projects/{self._project_id}/locations/{self._location}/"
+            f"publishers/google/models/{self._model}:predictLongRunning"
+        )
 
         # Validate required configuration
         self._validate_config()
 
+        # Output locations are derived from the bucket URI once; it may carry
+        # a path prefix (gs://bucket/prefix)
+        self._output_base = self._output_bucket.rstrip("/")
+        self._bucket_name = self._output_base[len("gs://"):].split("/", 1)[0]
+
         # Initialize Vertex AI
         self._initialize_client()
 
@@ -128,12 +325,31 @@ class VeoClient:
 
     def _initialize_client(self) -> None:
         """Initialize the Vertex AI client."""
+        # The Vertex AI SDK takes over a second to import; only pay for it
+        # once a client is actually created
+        import google.auth
+        import google.auth.transport.requests
+        import requests
+        from google.cloud import aiplatform, storage
+        from requests.adapters import HTTPAdapter
+
         try:
             aiplatform.init(
                 project=self._project_id,
                 location=self._location,
             )
             self._storage_client = storage.Client(project=self._project_id)
+            # Credentials are resolved once and refreshed only near expiry
+            scopes = ["https://www.googleapis.com/auth/cloud-platform"]
+            self._credentials, _ = google.auth.default(scopes=scopes)
+            self._auth_req = google.auth.transport.requests.Request()
+            self._auth_lock = threading.Lock()
+            # One pooled session keeps the TLS connection alive across the
+            # submit and every poll
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             logger.info(
                 f"Initialized Veo client for project {self._project_id} "
                 f"in {self._location}"
@@ -142,6 +358,35 @@ class VeoClient:
             logger.error(f"Failed to initialize Vertex AI client: {e}")
             raise
 
+        self._preflight()
+
+    def _preflight(self) -> None:
+        """Fetch a token and check the output bucket up front.
+
+        Otherwise the first clip of a batch pays for both. Failures are only
+        logged; the real requests surface them properly.
+        """
+        try:
+            self._token()
+        except Exception as e:
+            logger.debug(f"Token preflight failed: {e}")
+
+        try:
+            if not self._storage_client.bucket(self._bucket_name).exists():
+                logger.warning(f"Output bucket gs://{self._bucket_name} does not exist")
+        except Exception as e:
+            logger.debug(f"Bucket preflight failed: {e}")
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> "VeoClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @property
     def project_id(self) -> str:
         """Return the Google Cloud project ID."""
@@ -152,6 +397,72 @@ class VeoClient:
         """Return the output GCS bucket."""
         return self._output_bucket
 
+    def _token(self) -> str:
+        """Return an access token, refreshing it only when it is about to expire."""
+        with self._auth_lock:
+            credentials = self._credentials
+            if not credentials.valid or (
+                credentials.expiry
+                and (credentials.expiry - datetime.utcnow()).total_seconds() < self.TOKEN_REFRESH_MARGIN
+            ):
+                credentials.refresh(self._auth_req)
+            return credentials.token
+
+    def _new_result(
+        self,
+        prompt: str,
+        duration: float,
+        aspect_ratio: str,
+        scene_id: Optional[str],
+        has_reference_image: bool,
+    ) -> GenerationResult:
+        """Start a GenerationResult for one clip."""
+        operation_id = f"veo-{scene_id or 'clip'}-{int(time.time())}"
+        return GenerationResult(
+            operation_id=operation_id,
+            status=GenerationStatus.PENDING,
+            started_at=datetime.now(),
+            metadata={
+                "prompt": prompt,
+                "duration": duration,
+                "aspect_ratio": aspect_ratio,
+                "scene_id": scene_id,
+                "has_reference_image": has_reference_image,
+            },
+        )
+
+    @staticmethod
+    def _check_clip_args(prompt: str, aspect_ratio: str) -> None:
+        """Validate generate_clip arguments."""
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        if aspect_ratio not in ("16:9", "9:16"):
+            raise ValueError(f"Invalid aspect_ratio: {aspect_ratio}. Must be '16:9' or '9:16'")
+
+    @staticmethod
+    def _finalize_error(result: GenerationResult, message: str) -> GenerationResult:
+        """Mark ``result`` as failed with ``message``."""
+        result.status = GenerationStatus.FAILED
+        result.error_message = message
+        result.completed_at = datetime.now()
+        return result
+
+    @classmethod
+    def _record_failure(cls, result: GenerationResult, error: Exception) -> GenerationResult:
+        """Mark a generation as failed because of ``error``."""
+        if isinstance(error, google_exceptions.ResourceExhausted):
+            logger.error(f"Quota exceeded: {error}")
+            return cls._finalize_error(result, f"Quota exceeded: {error}")
+        if isinstance(error, google_exceptions.DeadlineExceeded):
+            logger.error(f"Request timed out: {error}")
+            return cls._finalize_error(result, f"Timeout: {error}")
+        if isinstance(error, google_exceptions.GoogleAPICallError):
+            logger.error(f"API error: {error}")
+        else:
+            logger.error(f"Unexpected error: {error}")
+        return cls._finalize_error(result, str(error))
+
     def generate_clip(
         self,
         prompt: str,
@@ -160,9 +471,19 @@ class VeoClient:
         output_path: Optional[Path] = None,
         scene_id: Optional[str] = None,
         reference_image: Optional[Path] = None,
+        reference_image_b64: Optional[str] = None,
+        force: bool = False,
     ) -> GenerationResult:
         """Generate a video clip from a text prompt.
 
+        When ``output_path`` is given, finished clips are recorded in a cache
+        under ``~/.cache/mvg/veo`` keyed by the request (model, prompt,
+        duration, aspect ratio and reference image). A later identical
+        request reuses that clip instead of calling the API, as long as the
+        file is unchanged since it was recorded. With ``remote_cache``
+        enabled the clip is also kept under ``cache/`` in the output bucket
+        and downloaded from there when the local copy is missing or changed.
+
         Args:
             prompt: Text description of the video to generate.
             duration: Desired duration in seconds (Veo supports 5-8s typically).
@@ -170,6 +491,10 @@ class VeoClient:
             output_path: Local path to save the generated video.
             scene_id: Optional identifier for tracking.
             reference_image: Optional path to a reference image for character consistency.
+            reference_image_b64: Optional pre-encoded reference image; takes
+                precedence over ``reference_image`` so callers generating many
+                clips can read and encode the image once.
+            force: Call the API even if a cached clip exists.
 
         Returns:
             GenerationResult with operation details and status.
@@ -178,185 +503,296 @@ class VeoClient:
             ValueError: If prompt is empty or invalid parameters.
             google_exceptions.GoogleAPICallError: If API call fails.
         """
-        import base64
-
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-
-        if aspect_ratio not in ("16:9", "9:16"):
-            raise ValueError(f"Invalid aspect_ratio: {aspect_ratio}. Must be '16:9' or '9:16'")
+        self._check_clip_args(prompt, aspect_ratio)
 
         # Clamp duration to Veo's supported range
         duration = max(5.0, min(8.0, duration))
 
         # Load reference image if provided
-        reference_image_b64 = None
-        if reference_image and reference_image.exists():
-            with open(reference_image, "rb") as f:
-                reference_image_b64 = base64.b64encode(f.read()).decode("utf-8")
+        if reference_image_b64 is None and reference_image and reference_image.exists():
+            reference_image_b64 = encode_reference_image(reference_image)
             logger.info(f"Using reference image: {reference_image}")
 
-        operation_id = f"veo-{scene_id or 'clip'}-{int(time.time())}"
-        result = GenerationResult(
-            operation_id=operation_id,
-            status=GenerationStatus.PENDING,
-            started_at=datetime.now(),
-            metadata={
-                "prompt": prompt,
-                "duration": duration,
-                "aspect_ratio": aspect_ratio,
-                "scene_id": scene_id,
-                "has_reference_image": reference_image_b64 is not None,
-            },
+        cache_key = self._cache_key(prompt, duration, aspect_ratio, reference_image_b64)
+        if output_path and not force:
+            cached = self._cached_result(cache_key, output_path, scene_id)
+            if cached is not None:
+                return cached
+
+        result = self._new_result(
+            prompt, duration, aspect_ratio, scene_id, reference_image_b64 is not None
         )
 
         try:
-            logger.info(f"Starting Veo generation: {operation_id}")
+            logger.info(f"Starting Veo generation: {result.operation_id}")
             logger.debug(f"Prompt: {prompt[:100]}...")
 
             # Submit generation request to Veo 3 via Vertex AI
-            # Using the imagen/video generation endpoint
             result.status = GenerationStatus.STARTED
-
-            # Construct the output URI
-            bucket_name = self._output_bucket.replace("gs://", "").rstrip("/")
-            output_uri = f"gs://{bucket_name}/{operation_id}.mp4"
-
-            # Call Veo 3 API via Vertex AI
-            # Note: This uses the video generation preview API
             response = self._submit_generation_request(
                 prompt=prompt,
                 duration=duration,
                 aspect_ratio=aspect_ratio,
-                output_uri=output_uri,
+                output_uri=self._output_uri(result.operation_id),
                 reference_image_b64=reference_image_b64,
             )
-
             result.status = GenerationStatus.PROCESSING
 
-            # Response contains operation name for polling
-            logger.info(f"Veo API response: {response}")
-            operation_name = response.get("name")
-            if not operation_name:
-                raise ValueError(f"No operation name in response: {response}")
-
             # Poll for completion
             final_result = self._poll_rest_operation(
-                operation_name=operation_name,
+                operation_name=self._operation_name(response),
                 result=result,
             )
 
-            # Save video if completed and output_path specified
-            if final_result.status == GenerationStatus.COMPLETED and output_path:
-                # Check if video was returned as base64
-                if "video_base64" in final_result.metadata:
-                    import base64
-                    video_data = base64.b64decode(final_result.metadata["video_base64"])
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_path, "wb") as f:
-                        f.write(video_data)
-                    final_result.local_path = output_path
-                    logger.info(f"Saved generated video to {output_path}")
-                    # Clean up base64 data from metadata to save memory
-                    del final_result.metadata["video_base64"]
-                # Otherwise try to download from GCS
-                elif final_result.output_uri:
-                    try:
-                        self._download_from_gcs(final_result.output_uri, output_path)
-                        final_result.local_path = output_path
-                        logger.info(f"Downloaded generated video to {output_path}")
-                    except google_exceptions.NotFound:
-                        logger.error(f"Output file not found at {final_result.output_uri}")
-                        final_result.error_message = f"Output file not found at {final_result.output_uri}"
-                else:
-                    logger.warning("No video data or URI found in response")
-
+            if output_path:
+                self._save_output(final_result, output_path)
+                self._store_cached_result(cache_key, final_result)
             return final_result
 
-        except google_exceptions.ResourceExhausted as e:
-            logger.error(f"Quota exceeded: {e}")
-            result.status = GenerationStatus.FAILED
-            result.error_message = f"Quota exceeded: {e}"
-            result.completed_at = datetime.now()
-            return result
-
-        except google_exceptions.DeadlineExceeded as e:
-            logger.error(f"Request timed out: {e}")
-            result.status = GenerationStatus.FAILED
-            result.error_message = f"Timeout: {e}"
-            result.completed_at = datetime.now()
-            return result
-
-        except google_exceptions.GoogleAPICallError as e:
-            logger.error(f"API error: {e}")
-            result.status = GenerationStatus.FAILED
-            result.error_message = str(e)
-            result.completed_at = datetime.now()
-            return result
-
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            result.status = GenerationStatus.FAILED
-            result.error_message = str(e)
-            result.completed_at = datetime.now()
-            return result
+            return self._record_failure(result, e)
 
-    def _submit_generation_request(
+    def _cache_key(
         self,
         prompt: str,
         duration: float,
         aspect_ratio: str,
-        output_uri: str,
-        reference_image_b64: Optional[str] = None,
-    ):
-        """Submit a video generation request to Veo via REST API.
-
-        This method interfaces with the Vertex AI video generation API.
-
-        Args:
-            prompt: Text description of the video.
-            duration: Duration in seconds.
-            aspect_ratio: Video aspect ratio.
-            output_uri: GCS URI for output (may not be used by Veo).
-            reference_image_b64: Optional base64-encoded reference image for
-                image-to-video generation with character consistency.
+        reference_image_b64: Optional[str],
+    ) -> str:
+        """Return the cache key for a generation request."""
+        key = hashlib.blake2b(digest_size=16)
+        for part in (self._model, prompt.strip(), f"{duration:g}", aspect_ratio):
+            key.update(part.encode())
+            key.update(b"\0")
+        if reference_image_b64:
+            key.update(reference_image_b64.encode("ascii"))
+        return key.hexdigest()
+
+    def _cached_result(
+        self, key: str, output_path: Path, scene_id: Optional[str]
+    ) -> Optional[GenerationResult]:
+        """Return a COMPLETED result for a cached clip, or None on a miss.
+
+        The local index is checked first, then (if enabled) the bucket's
+        ``cache/`` prefix. A local entry only counts if its file still has
+        the size and modification time recorded with it; the file is a
+        user output path that a later run may have overwritten.
         """
-        import requests
-        import google.auth
-        import google.auth.transport.requests
+        try:
+            entry = _loads((_CACHE_DIR / f"{key}.json").read_bytes())
+            cached_path = Path(entry["local_path"])
+            stat = cached_path.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+                return self._remote_cached_result(key, output_path, scene_id)
+            if cached_path.resolve() != output_path.resolve():
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cached_path, output_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return self._remote_cached_result(key, output_path, scene_id)
+
+        logger.info(f"Reusing cached clip {cached_path} (operation {entry.get('operation_id')})")
+        now = datetime.now()
+        return GenerationResult(
+            operation_id=entry.get("operation_id", f"cached-{key}"),
+            status=GenerationStatus.COMPLETED,
+            local_path=output_path,
+            started_at=now,
+            completed_at=now,
+            metadata={"scene_id": scene_id, "cache_hit": True},
+        )
 
-        # Get credentials with Vertex AI scopes
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        credentials, project = google.auth.default(scopes=scopes)
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+    def _remote_cache_uri(self, key: str) -> str:
+        """Return the GCS URI a clip is cached under."""
+        return f"{self._output_base}/cache/{key}.mp4"
+
+    def _remote_cached_result(
+        self, key: str, output_path: Path, scene_id: Optional[str]
+    ) -> Optional[GenerationResult]:
+        """Download a clip cached in GCS, or return None on a miss."""
+        if not self._remote_cache:
+            return None
+        uri = self._remote_cache_uri(key)
+        bucket_name, blob_name = _split_gcs_uri(uri)
+        try:
+            if not self._storage_client.bucket(bucket_name).blob(blob_name).exists():
+                return None
+            self._download_from_gcs_direct(uri, output_path)
+        except Exception as e:
+            logger.warning(f"Could not read cached clip {uri}: {e}")
+            return None
 
-        # Vertex AI endpoint for Veo - predictLongRunning
-        url = (
-            f"https://{self._location}-aiplatform.googleapis.com/v1/"
-            f"projects/{self._project_id}/locations/{self._location}/"
-            f"publishers/google/models/{self._model}:predictLongRunning"
+        logger.info(f"Reusing cached clip {uri}")
+        now = datetime.now()
+        result = GenerationResult(
+            operation_id=f"cached-{key}",
+            status=GenerationStatus.COMPLETED,
+            output_uri=uri,
+            local_path=output_path,
+            started_at=now,
+            completed_at=now,
+            metadata={"scene_id": scene_id, "cache_hit": True},
         )
+        self._store_local_cache(key, result)
+        return result
+
+    def _store_cached_result(self, key: str, result: GenerationResult) -> None:
+        """Record a finished clip in the local and (if enabled) GCS caches."""
+        if result.status != GenerationStatus.COMPLETED or result.local_path is None:
+            return
+        self._store_local_cache(key, result)
+        if not self._remote_cache:
+            return
+
+        uri = self._remote_cache_uri(key)
+        bucket_name, blob_name = _split_gcs_uri(uri)
+        try:
+            bucket = self._storage_client.bucket(bucket_name)
+            if result.output_uri:
+                # Already in GCS: a server-side copy moves no video data
+                src_bucket, src_blob = _split_gcs_uri(result.output_uri)
+                source = self._storage_client.bucket(src_bucket)
+                source.copy_blob(source.blob(src_blob), bucket, blob_name)
+            else:
+                bucket.blob(blob_name).upload_from_filename(
+                    str(result.local_path), content_type="video/mp4"
+                )
+            logger.debug(f"Cached clip at {uri}")
+        except Exception as e:
+            logger.warning(f"Could not cache clip at {uri}: {e}")
 
-        # Map aspect ratio to Veo API format
-        # Veo uses "16:9" or "9:16" directly, not "16x9"
-        aspect_ratio_map = {
-            "16:9": "16:9",
-            "9:16": "9:16",
-            "16x9": "16:9",
-            "9x16": "9:16",
-            "1:1": "1:1",
+    @staticmethod
+    def _store_local_cache(key: str, result: GenerationResult) -> None:
+        """Write the local cache entry for a finished clip."""
+        try:
+            stat = result.local_path.stat()
+        except OSError:
+            return
+        entry = {
+            "local_path": str(result.local_path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "operation_id": result.operation_id,
+            "completed_at": result.completed_at.isoformat() if result.completed_at else None,
         }
-        veo_aspect_ratio = aspect_ratio_map.get(aspect_ratio, "9:16")
+        cache = _CACHE_DIR / f"{key}.json"
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_dumps(entry))
+            os.replace(tmp, cache)
+        except OSError:
+            # Caching is best effort; a read-only home directory is fine.
+            # Cleanup can fail the same way when the directory is unusable.
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _output_uri(self, operation_id: str) -> str:
+        """Return the GCS URI a clip would be written to."""
+        return f"{self._output_base}/{operation_id}.mp4"
+
+    @staticmethod
+    def _operation_name(response: dict) -> str:
+        """Extract the long-running operation name from a submit response."""
+        # Response contains operation name for polling
+        logger.info(f"Veo API response: {response}")
+        operation_name = response.get("name")
+        if not operation_name:
+            raise ValueError(f"No operation name in response: {response}")
+        return operation_name
+
+    async def _asave_output(
+        self, result: GenerationResult, output_path: Path, http: httpx.AsyncClient
+    ) -> None:
+        """Async counterpart of :meth:`_save_output`."""
+        if (
+            result.status != GenerationStatus.COMPLETED
+            or result._video_b64 is not None
+            or not result.output_uri
+        ):
+            # Inline video (or nothing to save): decoding is CPU and disk bound
+            await asyncio.to_thread(self._save_output, result, output_path)
+            return
+
+        try:
+            await self._adownload_from_gcs(result.output_uri, output_path, http)
+            result.local_path = output_path
+            logger.info(f"Downloaded generated video to {output_path}")
+        except google_exceptions.NotFound:
+            logger.error(f"Output file not found at {result.output_uri}")
+            result.error_message = f"Output file not found at {result.output_uri}"
+
+    def _save_output(self, result: GenerationResult, output_path: Path) -> None:
+        """Write a completed generation's video to ``output_path``."""
+        if result.status != GenerationStatus.COMPLETED:
+            return
+
+        # Check if video was returned as base64
+        if result._video_b64 is not None:
+            # Release the payload as soon as it is on disk
+            video_b64, result._video_b64 = result._video_b64, None
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_b64(video_b64, output_path)
+            result.local_path = output_path
+            logger.info(f"Saved generated video to {output_path}")
+        # Otherwise try to download from GCS
+        elif result.output_uri:
+            try:
+                self._download_from_gcs_direct(result.output_uri, output_path)
+                result.local_path = output_path
+                logger.info(f"Downloaded generated video to {output_path}")
+            except google_exceptions.NotFound:
+                logger.error(f"Output file not found at {result.output_uri}")
+                result.error_message = f"Output file not found at {result.output_uri}"
+        else:
+            logger.warning("No video data or URI found in response")
+
+    def _generation_request(
+        self,
+        prompt: str,
+        duration: float,
+        aspect_ratio: str,
+        reference_image_b64: Optional[str] = None,
+    ) -> tuple[str, bytes]:
+        """Build the predictLongRunning URL and encoded JSON request body."""
+        url = self._predict_url
+        veo_aspect_ratio = self.ASPECT_RATIOS.get(aspect_ratio, "9:16")
+
+        # Only the prompt differs between clips of a batch, so the encoded
+        # parameters are spliced in rather than serialised again
+        body = b"".join((
+            b'{"instances":[',
+            _dumps({"prompt": prompt}),
+            b'],"parameters":',
+            self._encoded_parameters(veo_aspect_ratio, int(duration), reference_image_b64),
+            b"}",
+        ))
+
+        logger.debug(f"Request URL: {url}")
+        return url, body
 
-        # Construct the instance
-        instance = {"prompt": prompt}
+    def _encoded_parameters(
+        self,
+        veo_aspect_ratio: str,
+        duration_seconds: int,
+        reference_image_b64: Optional[str],
+    ) -> bytes:
+        """Return the JSON-encoded request parameters, cached per shape.
+
+        A batch passes the same reference string to every clip; ``str``
+        caches its hash, so looking it up again costs nothing.
+        """
+        key = (veo_aspect_ratio, duration_seconds, reference_image_b64)
+        encoded = self._param_cache.get(key)
+        if encoded is not None:
+            return encoded
 
         # Construct the generation request per Veo API spec
         parameters = {
             "aspectRatio": veo_aspect_ratio,
             "sampleCount": 1,
-            "durationSeconds": int(duration),
+            "durationSeconds": duration_seconds,
             "generateAudio": False,  # Audio will be added during assembly
         }
 
@@ -373,26 +809,162 @@ class VeoClient:
             ]
             logger.info("Including reference image for style consistency")
 
-        request_body = {
-            "instances": [instance],
-            "parameters": parameters,
-        }
+        encoded = _dumps(parameters)
+        if len(self._param_cache) >= self.PARAM_CACHE_SIZE:
+            # Entries may hold a whole reference image; keep only a few
+            self._param_cache.clear()
+        self._param_cache[key] = encoded
+        return encoded
 
+    def _submit_generation_request(
+        self,
+        prompt: str,
+        duration: float,
+        aspect_ratio: str,
+        output_uri: str,
+        reference_image_b64: Optional[str] = None,
+    ):
+        """Submit a video generation request to Veo via REST API.
+
+        This method interfaces with the Vertex AI video generation API.
+
+        Args:
+            prompt: Text description of the video.
+            duration: Duration in seconds.
+            aspect_ratio: Video aspect ratio.
+            output_uri: GCS URI for output (may not be used by Veo).
+            reference_image_b64: Optional base64-encoded reference image for
+                image-to-video generation with character consistency.
+        """
+        url, data = self._generation_request(
+            prompt, duration, aspect_ratio, reference_image_b64
+        )
         headers = {
-            "Authorization": f"Bearer {credentials.token}",
+            "Authorization": f"Bearer {self._token()}",
             "Content-Type": "application/json",
         }
-
-        logger.debug(f"Request URL: {url}")
-        logger.debug(f"Request body keys: {list(request_body.keys())}")
-        response = requests.post(url, json=request_body, headers=headers)
+        for attempt in range(self._max_retries):
+            response = self._session.post(
+                url, data=data, headers=headers, timeout=self.REQUEST_TIMEOUT
+            )
+            if (
+                response.status_code not in self.RETRYABLE_STATUS
+                or attempt == self._max_retries - 1
+            ):
+                break
+            delay = self._backoff(attempt, response)
+            logger.warning(
+                f"Submit failed with {response.status_code} (attempt {attempt + 1}). "
+                f"Retrying in {delay:.1f}s..."
+            )
+            time.sleep(delay)
 
         if response.status_code != 200:
             raise google_exceptions.GoogleAPICallError(
                 f"{response.status_code} {response.text}"
             )
 
-        return response.json()
+        return _loads(response.content)
+
+    def _poll_request(self, operation_name: str) -> tuple[str, str, Optional[bytes]]:
+        """Return the HTTP method, URL and encoded JSON body for status polls."""
+        # For publisher model operations, use fetchPredictOperation
+        # Operation name format: projects/{project}/locations/{location}/publishers/google/models/{model}/operations/{op_id}
+        if "/publishers/google/models/" in operation_name:
+            model_path = operation_name.rsplit("/operations/", 1)[0]
+            url = f"{self._api_base}{model_path}:fetchPredictOperation"
+            # POST request with operation name in body
+            return "POST", url, _dumps({"operationName": operation_name})
+
+        url = f"{self._api_base}{operation_name}"
+        return "GET", url, None
+
+    def _apply_poll_response(
+        self,
+        raw: bytes,
+        operation_name: str,
+        result: GenerationResult,
+    ) -> bool:
+        """Update ``result`` from a raw poll response; True once it is done.
+
+        Running operations are recognised without parsing the body, which
+        only matters once it is finished and carries the video. The shortcut
+        is only taken when the body can't be a finished operation: it has no
+        ``"done"`` key (which running operations omit), or its only one is
+        ``"done": false``. Anything else is parsed in full.
+        """
+        done_keys = raw.count(b'"done"')
+        if done_keys == 0 or (done_keys == 1 and _DONE_FALSE_RE.search(raw)):
+            result.status = GenerationStatus.PROCESSING
+            progress = _PROGRESS_RE.search(raw)
+            if progress:
+                result.metadata["progress_percent"] = int(progress.group(1))
+            return False
+        return self._apply_operation_status(_loads(raw), operation_name, result)
+
+    def _apply_operation_status(
+        self,
+        op_status: dict,
+        operation_name: str,
+        result: GenerationResult,
+    ) -> bool:
+        """Update ``result`` from a polled operation; True once it is done."""
+        if not op_status.get("done"):
+            # Still processing
+            result.status = GenerationStatus.PROCESSING
+            return False
+
+        if self._debug_save_responses:
+            # Save the response (minus the video payload) for debugging
+            debug_file = Path(f"veo_response_{result.operation_id}.json")
+            try:
+                with open(debug_file, "w") as f:
+                    json.dump(_elide_video_data(op_status), f, default=str)
+                logger.info(f"Saved response to {debug_file}")
+            except Exception as e:
+                logger.warning(f"Failed to save debug response: {e}")
+
+        if "error" in op_status:
+            error = op_status["error"]
+            error_msg = error.get("message", str(error))
+            logger.error(f"Operation {operation_name} failed: {error_msg}")
+            self._finalize_error(result, error_msg)
+            return True
+
+        logger.info(f"Operation {operation_name} completed successfully")
+        result.status = GenerationStatus.COMPLETED
+        result.completed_at = datetime.now()
+        # Extract video data from response
+        if "response" in op_status:
+            resp = op_status["response"]
+            # Veo returns video as base64-encoded data in response.videos[]
+            if "videos" in resp and resp["videos"]:
+                video = resp["videos"][0]
+                if "bytesBase64Encoded" in video:
+                    result._video_b64 = video.pop("bytesBase64Encoded")
+                    result.metadata["mime_type"] = video.get("mimeType", "video/mp4")
+                    logger.info("Video data received as base64")
+                elif "uri" in video or "gcsUri" in video:
+                    result.output_uri = video.get("uri") or video.get("gcsUri")
+                    logger.info(f"Output URI: {result.output_uri}")
+            # Fallback: check other possible structures
+            elif "generateVideoResponse" in resp:
+                gen_resp = resp["generateVideoResponse"]
+                if "generatedSamples" in gen_resp and gen_resp["generatedSamples"]:
+                    video = gen_resp["generatedSamples"][0].get("video", {})
+                    if "bytesBase64Encoded" in video:
+                        result._video_b64 = video.pop("bytesBase64Encoded")
+                        result.metadata["mime_type"] = video.get("mimeType", "video/mp4")
+                        logger.info("Video data received as base64")
+        return True
+
+    def _poll_timed_out(self, operation_name: str, elapsed: float, result: GenerationResult) -> bool:
+        """Mark ``result`` failed if polling has run past max_poll_time."""
+        if elapsed <= self._max_poll_time:
+            return False
+        logger.warning(f"Operation {operation_name} timed out after {elapsed:.1f}s")
+        self._finalize_error(result, f"Operation timed out after {self._max_poll_time}s")
+        return True
 
     def _poll_rest_operation(
         self,
@@ -408,208 +980,433 @@ class VeoClient:
         Returns:
             Updated GenerationResult with final status.
         """
-        import requests
-        import google.auth
-        import google.auth.transport.requests
-
-        start_time = time.time()
+        start_time = time.monotonic()
         poll_count = 0
+        failures = 0
+        interval = self._initial_poll_interval
+        method, url, body = self._poll_request(operation_name)
+        content_type = {"Content-Type": "application/json"} if body else {}
 
-        # Get credentials with Vertex AI scopes
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        credentials, _ = google.auth.default(scopes=scopes)
-        auth_req = google.auth.transport.requests.Request()
-
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > self._max_poll_time:
-                logger.warning(f"Operation {operation_name} timed out after {elapsed:.1f}s")
-                result.status = GenerationStatus.FAILED
-                result.error_message = f"Operation timed out after {self._max_poll_time}s"
-                result.completed_at = datetime.now()
-                return result
-
+        while not self._poll_timed_out(operation_name, time.monotonic() - start_time, result):
             poll_count += 1
             logger.debug(f"Polling operation (attempt {poll_count}): {operation_name}")
 
+            response = None
             try:
-                # Refresh credentials if needed
-                credentials.refresh(auth_req)
-
-                # For publisher model operations, use fetchPredictOperation
-                # Operation name format: projects/{project}/locations/{location}/publishers/google/models/{model}/operations/{op_id}
-                if "/publishers/google/models/" in operation_name:
-                    # Extract model path and operation ID
-                    parts = operation_name.rsplit("/operations/", 1)
-                    model_path = parts[0]
-                    op_id = parts[1] if len(parts) > 1 else ""
-                    url = (
-                        f"https://{self._location}-aiplatform.googleapis.com/v1/"
-                        f"{model_path}:fetchPredictOperation"
-                    )
-                    # POST request with operation name in body
-                    headers = {
-                        "Authorization": f"Bearer {credentials.token}",
-                        "Content-Type": "application/json",
-                    }
-                    body = {"operationName": operation_name}
-                    logger.debug(f"Polling URL: {url}")
-                    response = requests.post(url, json=body, headers=headers)
-                else:
-                    url = f"https://{self._location}-aiplatform.googleapis.com/v1/{operation_name}"
-                    headers = {
-                        "Authorization": f"Bearer {credentials.token}",
-                    }
-                    logger.debug(f"Polling URL: {url}")
-                    response = requests.get(url, headers=headers)
+                headers = {"Authorization": f"Bearer {self._token()}", **content_type}
+                logger.debug(f"Polling URL: {url}")
+                response = self._session.request(
+                    method, url, data=body, headers=headers, timeout=self.REQUEST_TIMEOUT
+                )
 
                 if response.status_code != 200:
+                    failures += 1
                     logger.warning(f"Poll request failed: {response.status_code}")
                     logger.debug(f"Response: {response.text[:500]}")
-                    time.sleep(self._poll_interval)
-                    continue
-
-                op_status = response.json()
-
-                if op_status.get("done"):
-                    # Save full response to file for debugging
-                    debug_file = Path(f"veo_response_{result.operation_id}.json")
-                    try:
-                        with open(debug_file, "w") as f:
-                            json.dump(op_status, f, indent=2, default=str)
-                        logger.info(f"Saved full response to {debug_file}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save debug response: {e}")
-
-                    if "error" in op_status:
-                        error = op_status["error"]
-                        error_msg = error.get("message", str(error))
-                        logger.error(f"Operation {operation_name} failed: {error_msg}")
-                        result.status = GenerationStatus.FAILED
-                        result.error_message = error_msg
-                        result.completed_at = datetime.now()
-                        return result
-                    else:
-                        logger.info(f"Operation {operation_name} completed successfully")
-                        result.status = GenerationStatus.COMPLETED
-                        result.completed_at = datetime.now()
-                        # Extract video data from response
-                        if "response" in op_status:
-                            resp = op_status["response"]
-                            # Veo returns video as base64-encoded data in response.videos[]
-                            if "videos" in resp and resp["videos"]:
-                                video = resp["videos"][0]
-                                if "bytesBase64Encoded" in video:
-                                    result.metadata["video_base64"] = video["bytesBase64Encoded"]
-                                    result.metadata["mime_type"] = video.get("mimeType", "video/mp4")
-                                    logger.info("Video data received as base64")
-                                elif "uri" in video or "gcsUri" in video:
-                                    result.output_uri = video.get("uri") or video.get("gcsUri")
-                                    logger.info(f"Output URI: {result.output_uri}")
-                            # Fallback: check other possible structures
-                            elif "generateVideoResponse" in resp:
-                                gen_resp = resp["generateVideoResponse"]
-                                if "generatedSamples" in gen_resp and gen_resp["generatedSamples"]:
-                                    video = gen_resp["generatedSamples"][0].get("video", {})
-                                    if "bytesBase64Encoded" in video:
-                                        result.metadata["video_base64"] = video["bytesBase64Encoded"]
-                                        result.metadata["mime_type"] = video.get("mimeType", "video/mp4")
-                                        logger.info("Video data received as base64")
+                else:
+                    failures = 0
+                    if self._apply_poll_response(response.content, operation_name, result):
                         return result
 
-                # Still processing
-                result.status = GenerationStatus.PROCESSING
-
             except Exception as e:
+                failures += 1
                 logger.warning(f"Error checking operation status: {e}")
 
-            time.sleep(self._poll_interval)
+            time.sleep(
+                self._poll_delay(
+                    interval, failures, response, result.metadata.get("progress_percent")
+                )
+            )
+            interval = self._next_poll_interval(interval, failures)
 
-    def _poll_operation(
+        return result
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        """Return how long to wait before retrying a failed request.
+
+        Exponential backoff with full jitter; a ``Retry-After`` header on
+        ``response`` sets the minimum.
+        """
+        delay = random.uniform(0, min(self.MAX_RETRY_DELAY, self._retry_delay * (2**attempt)))
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                # An HTTP date rather than seconds; keep the backoff
+                pass
+        return delay
+
+    def _next_poll_interval(self, interval: float, failures: int) -> float:
+        """Grow the poll interval after an unfinished poll.
+
+        Most clips finish within a minute, so polling starts fast and backs
+        off for long-running jobs. Errors reset it; the backoff in
+        :meth:`_poll_delay` spaces those polls out instead.
+        """
+        if failures:
+            return self._initial_poll_interval
+        return min(self._max_poll_interval, interval * self.POLL_INTERVAL_GROWTH)
+
+    def _poll_delay(
         self,
-        operation_name: str,
-        result: GenerationResult,
-    ) -> GenerationResult:
-        """Poll an operation by name until completion or timeout (legacy).
+        interval: float,
+        failures: int,
+        response=None,
+        progress: Optional[int] = None,
+    ) -> float:
+        """Return the wait before the next poll.
 
         Args:
-            operation_name: The operation resource name to poll.
-            result: The GenerationResult to update.
+            interval: Current adaptive poll interval.
+            failures: Number of failed polls in a row.
+            response: The last poll response, for its Retry-After header.
+            progress: Server-reported progressPercent, if any. Operations
+                close to done are polled sooner.
+        """
+        if failures:
+            # Errors only ever slow polling down
+            return max(interval, self._backoff(failures, response))
+        if progress is not None and progress >= 80:
+            return min(interval, 2.0)
+        if progress is not None and progress >= 50:
+            return min(interval, 5.0)
+        return interval
+
+    def _httpx_timeout(self) -> httpx.Timeout:
+        """Return REQUEST_TIMEOUT in httpx form."""
+        connect, read = self.REQUEST_TIMEOUT
+        return httpx.Timeout(read, connect=connect)
+
+    def batch_generate(
+        self,
+        specs: list[dict],
+        max_in_flight: int = 4,
+    ) -> list[GenerationResult]:
+        """Generate several clips on a thread pool.
+
+        Each worker runs :meth:`generate_clip`, so one clip's download
+        overlaps the others' polling. At most ``max_in_flight`` clips are
+        submitted at once; the next spec starts as soon as one finishes.
+
+        Args:
+            specs: Keyword arguments for :meth:`generate_clip`, one dict per
+                clip.
+            max_in_flight: Maximum number of concurrent generations.
 
         Returns:
-            Updated GenerationResult with final status.
+            One GenerationResult per spec, in the same order. Specs that
+            raise (e.g. an empty prompt) come back as FAILED results.
         """
-        start_time = time.time()
-        poll_count = 0
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > self._max_poll_time:
-                logger.warning(f"Operation {operation_name} timed out after {elapsed:.1f}s")
-                result.status = GenerationStatus.FAILED
-                result.error_message = f"Operation timed out after {self._max_poll_time}s"
-                result.completed_at = datetime.now()
-                return result
+        results: list[Optional[GenerationResult]] = [None] * len(specs)
+        pending = iter(enumerate(specs))
 
-            poll_count += 1
-            logger.debug(f"Polling operation (attempt {poll_count}): {operation_name}")
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            in_flight = {}
 
-            try:
-                status = self._check_operation_status(operation_name)
-
-                if status == "SUCCEEDED":
-                    logger.info(f"Operation {operation_name} completed successfully")
-                    result.status = GenerationStatus.COMPLETED
-                    result.completed_at = datetime.now()
-                    return result
-
-                elif status in ("FAILED", "CANCELLED"):
-                    logger.error(f"Operation {operation_name} {status.lower()}")
-                    result.status = (
-                        GenerationStatus.CANCELLED
-                        if status == "CANCELLED"
-                        else GenerationStatus.FAILED
-                    )
-                    result.completed_at = datetime.now()
-                    return result
+            def submit_next() -> None:
+                item = next(pending, None)
+                if item is not None:
+                    in_flight[executor.submit(self.generate_clip, **item[1])] = item
 
-                # Still processing, continue polling
-                result.status = GenerationStatus.PROCESSING
+            for _ in range(max_in_flight):
+                submit_next()
 
-            except Exception as e:
-                logger.warning(f"Error checking operation status: {e}")
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, spec = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        scene_id = spec.get("scene_id")
+                        results[idx] = GenerationResult(
+                            operation_id=f"error-{scene_id or 'clip'}",
+                            status=GenerationStatus.FAILED,
+                            error_message=str(e),
+                            metadata={"scene_id": scene_id},
+                        )
 
-            time.sleep(self._poll_interval)
+        return results
 
-    def _check_operation_status(self, operation_name: str) -> str:
-        """Check the status of an operation.
+    async def agenerate_clip(
+        self,
+        prompt: str,
+        duration: float = 8.0,
+        aspect_ratio: str = "9:16",
+        output_path: Optional[Path] = None,
+        scene_id: Optional[str] = None,
+        reference_image_b64: Optional[str] = None,
+        force: bool = False,
+        http: Optional[httpx.AsyncClient] = None,
+    ) -> GenerationResult:
+        """Generate a video clip without blocking the event loop.
+
+        Same as :meth:`generate_clip`, but the submit and poll requests go
+        through httpx and polling waits with ``asyncio.sleep``, so many
+        clips can be in flight on one thread (see :meth:`generate_clips`).
+        Token refreshes and the final save run in a worker thread.
 
         Args:
-            operation_name: The operation resource name.
+            prompt: Text description of the video to generate.
+            duration: Desired duration in seconds (Veo supports 5-8s typically).
+            aspect_ratio: Video aspect ratio ('16:9' or '9:16').
+            output_path: Local path to save the generated video.
+            scene_id: Optional identifier for tracking.
+            reference_image_b64: Optional base64-encoded reference image.
+            force: Call the API even if a cached clip exists.
+            http: Shared async HTTP client. A temporary one is used if None.
 
         Returns:
-            Status string: RUNNING, SUCCEEDED, FAILED, or CANCELLED.
+            GenerationResult with operation details and status.
+
+        Raises:
+            ValueError: If prompt is empty or invalid parameters.
+        """
+        if http is None:
+            async with httpx.AsyncClient(timeout=self._httpx_timeout()) as http:
+                return await self.agenerate_clip(
+                    prompt, duration, aspect_ratio, output_path, scene_id,
+                    reference_image_b64, force, http,
+                )
+
+        # Queue behind the client-wide limit rather than bursting into quota
+        async with self._semaphore():
+            return await self._agenerate_clip(
+                prompt, duration, aspect_ratio, output_path, scene_id,
+                reference_image_b64, force, http,
+            )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency gate for the running event loop.
+
+        Semaphores belong to one loop, and :meth:`generate_clips` starts a
+        new loop per call, so the gate is recreated when the loop changes.
         """
-        from google.longrunning import operations_pb2_grpc
-        from google.longrunning.operations_pb2 import GetOperationRequest
-        import grpc
+        loop = asyncio.get_running_loop()
+        if self._async_gate is None or self._async_gate[0] is not loop:
+            self._async_gate = (loop, asyncio.Semaphore(self._max_concurrency))
+        return self._async_gate[1]
+
+    async def _agenerate_clip(
+        self,
+        prompt: str,
+        duration: float,
+        aspect_ratio: str,
+        output_path: Optional[Path],
+        scene_id: Optional[str],
+        reference_image_b64: Optional[str],
+        force: bool,
+        http: httpx.AsyncClient,
+    ) -> GenerationResult:
+        """Body of :meth:`agenerate_clip`, run while holding the semaphore."""
+        self._check_clip_args(prompt, aspect_ratio)
+        duration = max(5.0, min(8.0, duration))
+        cache_key = self._cache_key(prompt, duration, aspect_ratio, reference_image_b64)
+        if output_path and not force:
+            cached = await asyncio.to_thread(
+                self._cached_result, cache_key, output_path, scene_id
+            )
+            if cached is not None:
+                return cached
+
+        result = self._new_result(
+            prompt, duration, aspect_ratio, scene_id, reference_image_b64 is not None
+        )
 
-        # For Vertex AI operations, check via the operations API
-        # This is a simplified check - real implementation depends on
-        # how Veo 3 surfaces operation status
         try:
-            from google.cloud.aiplatform_v1 import JobServiceClient
+            logger.info(f"Starting Veo generation: {result.operation_id}")
+            result.status = GenerationStatus.STARTED
+            url, data = self._generation_request(
+                prompt, duration, aspect_ratio, reference_image_b64
+            )
+            token = await asyncio.to_thread(self._token)
+            for attempt in range(self._max_retries):
+                response = await http.post(
+                    url,
+                    content=data,
+                    headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+                )
+                if (
+                    response.status_code not in self.RETRYABLE_STATUS
+                    or attempt == self._max_retries - 1
+                ):
+                    break
+                await asyncio.sleep(self._backoff(attempt, response))
+            if response.status_code != 200:
+                raise google_exceptions.GoogleAPICallError(
+                    f"{response.status_code} {response.text}"
+                )
+            result.status = GenerationStatus.PROCESSING
+            operation_name = self._operation_name(_loads(response.content))
+
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            method, poll_url, body = self._poll_request(operation_name)
+            content_type = {"Content-Type": "application/json"} if body else {}
+            failures = 0
+            interval = self._initial_poll_interval
+            while not self._poll_timed_out(operation_name, loop.time() - start_time, result):
+                response = None
+                try:
+                    token = await asyncio.to_thread(self._token)
+                    response = await http.request(
+                        method,
+                        poll_url,
+                        content=body,
+                        headers={"Authorization": f"Bearer {token}", **content_type},
+                    )
+                    if response.status_code != 200:
+                        failures += 1
+                        logger.warning(f"Poll request failed: {response.status_code}")
+                    else:
+                        failures = 0
+                        if self._apply_poll_response(
+                            response.content, operation_name, result
+                        ):
+                            break
+                except Exception as e:
+                    failures += 1
+                    logger.warning(f"Error checking operation status: {e}")
+
+                await asyncio.sleep(
+                    self._poll_delay(
+                        interval, failures, response, result.metadata.get("progress_percent")
+                    )
+                )
+                interval = self._next_poll_interval(interval, failures)
+
+            if output_path:
+                await self._asave_output(result, output_path, http)
+                await asyncio.to_thread(self._store_cached_result, cache_key, result)
+            return result
+
+        except Exception as e:
+            return self._record_failure(result, e)
+
+    async def generate_clips_async(
+        self,
+        specs: list[dict],
+        concurrency: Optional[int] = None,
+    ) -> list[GenerationResult]:
+        """Generate several clips concurrently.
+
+        Args:
+            specs: Keyword arguments for :meth:`agenerate_clip`, one dict per
+                clip.
+            concurrency: Maximum number of clips in flight at once. Defaults
+                to the client's ``max_concurrency``, which also caps it.
+
+        Returns:
+            One GenerationResult per spec, in the same order. Specs rejected
+            up front (e.g. an empty prompt) come back as FAILED results.
+        """
+        concurrency = concurrency or self._max_concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+        async with httpx.AsyncClient(limits=limits, timeout=self._httpx_timeout()) as http:
+
+            async def generate(spec: dict) -> GenerationResult:
+                async with semaphore:
+                    return await self.agenerate_clip(**spec, http=http)
+
+            outcomes = await asyncio.gather(
+                *(generate(spec) for spec in specs), return_exceptions=True
+            )
+
+        results = []
+        for spec, outcome in zip(specs, outcomes):
+            if isinstance(outcome, BaseException):
+                scene_id = spec.get("scene_id")
+                outcome = GenerationResult(
+                    operation_id=f"error-{scene_id or 'clip'}",
+                    status=GenerationStatus.FAILED,
+                    error_message=str(outcome),
+                    metadata={"scene_id": scene_id},
+                )
+            results.append(outcome)
+        return results
+
+    def generate_clips(
+        self,
+        specs: list[dict],
+        concurrency: Optional[int] = None,
+    ) -> list[GenerationResult]:
+        """Synchronous wrapper around :meth:`generate_clips_async`."""
+        return asyncio.run(self.generate_clips_async(specs, concurrency))
+
+    def _poll_operation(
+        self,
+        operation_name: str,
+        result: GenerationResult,
+    ) -> GenerationResult:
+        """Wait for an operation via the long-running operations API (legacy).
+
+        Polling is driven by google-api-core's ``Retry``, the machinery its
+        operation futures use: exponential backoff with jitter from
+        ``poll_interval`` up to ``max_poll_interval``, giving up after
+        ``max_poll_time``.
+
+        Args:
+            operation_name: The operation resource name to poll.
+            result: The GenerationResult to update.
 
-            client_options = {"api_endpoint": f"{self._location}-aiplatform.googleapis.com"}
-            client = JobServiceClient(client_options=client_options)
+        Returns:
+            Updated GenerationResult with final status.
+        """
+        from google.api_core import retry
 
-            # Check if this is a batch prediction job
-            # The actual status check depends on the Veo 3 API structure
-            return "SUCCEEDED"  # Placeholder for actual status check
+        client = self._operations_client()
 
+        def fetch_finished():
+            op = client.get_operation(name=operation_name)
+            if not op.done:
+                result.status = GenerationStatus.PROCESSING
+                raise _OperationRunning(operation_name)
+            return op
+
+        wait = retry.Retry(
+            predicate=retry.if_exception_type(
+                _OperationRunning, google_exceptions.ServiceUnavailable
+            ),
+            initial=self._poll_interval,
+            maximum=self._max_poll_interval,
+            multiplier=2.0,
+            timeout=self._max_poll_time,
+        )
+
+        try:
+            op = wait(fetch_finished)()
+        except google_exceptions.RetryError:
+            logger.warning(f"Operation {operation_name} timed out")
+            return self._finalize_error(
+                result, f"Operation timed out after {self._max_poll_time}s"
+            )
         except Exception as e:
-            logger.debug(f"Status check error: {e}")
-            return "RUNNING"
+            logger.error(f"Error checking operation status: {e}")
+            return self._finalize_error(result, str(e))
+
+        result.completed_at = datetime.now()
+        if not op.HasField("error"):
+            logger.info(f"Operation {operation_name} completed successfully")
+            result.status = GenerationStatus.COMPLETED
+        # google.rpc.Code.CANCELLED
+        elif op.error.code == 1:
+            logger.error(f"Operation {operation_name} cancelled")
+            result.status = GenerationStatus.CANCELLED
+        else:
+            logger.error(f"Operation {operation_name} failed: {op.error.message}")
+            result.status = GenerationStatus.FAILED
+            result.error_message = op.error.message
+        return result
+
+    def _operations_client(self):
+        """Return the long-running operations client for this region."""
+        return _get_operations_client(self._location)
 
     def poll_operation(self, operation_id: str) -> GenerationResult:
         """Poll an existing operation by ID.
@@ -638,14 +1435,7 @@ class VeoClient:
         """
         try:
             logger.info(f"Cancelling operation: {operation_id}")
-
-            from google.cloud.aiplatform_v1 import JobServiceClient
-
-            client_options = {"api_endpoint": f"{self._location}-aiplatform.googleapis.com"}
-            client = JobServiceClient(client_options=client_options)
-
-            # Cancel the operation
-            # Actual cancellation depends on operation type
+            self._operations_client().cancel_operation(name=operation_id)
             logger.info(f"Cancellation requested for {operation_id}")
             return True
 
@@ -653,22 +1443,118 @@ class VeoClient:
             logger.error(f"Failed to cancel operation: {e}")
             return False
 
-    def _download_from_gcs(self, gcs_uri: str, local_path: Path) -> None:
-        """Download a file from GCS to local path.
+    def _download_from_gcs_direct(self, gcs_uri: str, local_path: Path) -> None:
+        """Download a whole GCS object with a single authenticated GET.
+
+        Skips the storage client's metadata request and ranged reads, and
+        reuses the pooled session. Falls back to :meth:`_download_from_gcs`
+        if the direct request fails for any reason other than a missing
+        object.
 
         Args:
             gcs_uri: GCS URI (gs://bucket/path/to/file).
             local_path: Local path to save the file.
         """
-        # Parse GCS URI
-        if not gcs_uri.startswith("gs://"):
-            raise ValueError(f"Invalid GCS URI: {gcs_uri}")
+        url = _gcs_media_url(gcs_uri)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(local_path.name + ".tmp")
+        try:
+            with self._session.get(
+                url,
+                headers={"Authorization": f"Bearer {self._token()}"},
+                stream=True,
+                timeout=self.REQUEST_TIMEOUT,
+            ) as response:
+                if response.status_code == 404:
+                    raise google_exceptions.NotFound(f"File not found in GCS: {gcs_uri}")
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(_DOWNLOAD_BUFFER_SIZE):
+                        f.write(chunk)
+            os.replace(tmp_path, local_path)
+            logger.debug(f"Downloaded {gcs_uri} to {local_path}")
+        except google_exceptions.NotFound:
+            raise
+        except Exception as e:
+            logger.warning(f"Direct download failed: {e}. Falling back to storage client")
+            self._download_from_gcs(gcs_uri, local_path)
+
+    async def _adownload_from_gcs(
+        self, gcs_uri: str, local_path: Path, http: httpx.AsyncClient
+    ) -> None:
+        """Async counterpart of :meth:`_download_from_gcs_direct`.
+
+        Streams the object through ``http``; falls back to the storage
+        client in a worker thread if the direct request fails.
+        """
+        url = _gcs_media_url(gcs_uri)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(local_path.name + ".tmp")
+        try:
+            token = await asyncio.to_thread(self._token)
+            async with http.stream(
+                "GET", url, headers={"Authorization": f"Bearer {token}"}
+            ) as response:
+                if response.status_code == 404:
+                    raise google_exceptions.NotFound(f"File not found in GCS: {gcs_uri}")
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    # Disk writes go to a worker so a slow disk never stalls
+                    # the other generations on this loop
+                    async for chunk in response.aiter_bytes(_DOWNLOAD_BUFFER_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+            os.replace(tmp_path, local_path)
+            logger.debug(f"Downloaded {gcs_uri} to {local_path}")
+        except google_exceptions.NotFound:
+            raise
+        except Exception as e:
+            logger.warning(f"Direct download failed: {e}. Falling back to storage client")
+            await asyncio.to_thread(self._download_from_gcs, gcs_uri, local_path)
+
+    def _download_from_gcs_chunked(
+        self,
+        blob,
+        local_path: Path,
+        chunk_size: int = _GCS_CHUNK_SIZE,
+        concurrency: int = 4,
+    ) -> None:
+        """Download a large blob as parallel range requests.
+
+        Each range is fetched on a worker thread and written at its offset
+        with ``os.pwrite``, so at most ``concurrency`` chunks are held in
+        memory at once.
+
+        Args:
+            blob: A storage Blob with its ``size`` loaded.
+            local_path: File to write.
+            chunk_size: Bytes per range request.
+            concurrency: Maximum simultaneous range requests.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, blob.size)
 
-        uri_parts = gcs_uri[5:].split("/", 1)
-        if len(uri_parts) != 2:
-            raise ValueError(f"Invalid GCS URI format: {gcs_uri}")
+            def fetch(start: int) -> None:
+                end = min(start + chunk_size, blob.size) - 1
+                data = blob.download_as_bytes(start=start, end=end)
+                os.pwrite(fd, data, start)
 
-        bucket_name, blob_name = uri_parts
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                # list() re-raises the first failed range
+                list(executor.map(fetch, range(0, blob.size, chunk_size)))
+        finally:
+            os.close(fd)
+
+    def _download_from_gcs(self, gcs_uri: str, local_path: Path) -> None:
+        """Download a file from GCS to local path.
+
+        Args:
+            gcs_uri: GCS URI (gs://bucket/path/to/file).
+            local_path: Local path to save the file.
+        """
+        bucket_name, blob_name = _split_gcs_uri(gcs_uri)
 
         # Ensure local directory exists
         local_path.parent.mkdir(parents=True, exist_ok=True)
@@ -677,8 +1563,23 @@ class VeoClient:
         for attempt in range(self._max_retries):
             try:
                 bucket = self._storage_client.bucket(bucket_name)
-                blob = bucket.blob(blob_name)
-                blob.download_to_filename(str(local_path))
+                blob = bucket.get_blob(blob_name)
+                if blob is None:
+                    raise google_exceptions.NotFound(f"File not found in GCS: {gcs_uri}")
+                # Write to a temp file so a failed attempt never leaves a
+                # truncated clip behind
+                tmp_path = local_path.with_name(local_path.name + ".tmp")
+                if blob.size and blob.size > _GCS_CHUNK_SIZE:
+                    self._download_from_gcs_chunked(blob, tmp_path)
+                    os.replace(tmp_path, local_path)
+                    logger.debug(f"Downloaded {gcs_uri} to {local_path} in ranges")
+                    return
+
+                # A single streamed GET written straight to the file; the raw
+                # bytes are stored as-is (clips are never gzip-encoded)
+                with open(tmp_path, "wb") as dst:
+                    blob.download_to_file(dst, raw_download=True)
+                os.replace(tmp_path, local_path)
                 logger.debug(f"Downloaded {gcs_uri} to {local_path}")
                 return
 
@@ -686,9 +1587,16 @@ class VeoClient:
                 logger.error(f"File not found in GCS: {gcs_uri}")
                 raise
 
+            except _UNRECOVERABLE_DOWNLOAD_ERRORS as e:
+                # Retrying won't fix credentials or a bad request
+                logger.error(f"Download of {gcs_uri} failed: {e}")
+                raise
+
             except Exception as e:
-                delay = self._retry_delay * (2**attempt)
-                logger.warning(f"Download failed (attempt {attempt + 1}): {e}. Retrying in {delay}s...")
+                delay = self._retry_delay * (2**attempt) * random.uniform(1.0, 1.5)
+                logger.warning(
+                    f"Download failed (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s..."
+                )
                 if attempt == self._max_retries - 1:
                     raise
                 time.sleep(delay)
@@ -708,38 +1616,78 @@ class VeoClient:
         return []
 
 
+def _path_to_str(value):
+    """orjson fallback serializer for Path values."""
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_operation(result: GenerationResult) -> bytes:
+    """Encode one result as indented JSON for the metadata file."""
+    if orjson is not None:
+        # orjson walks the dataclass itself (skipping private fields) and
+        # renders enums and datetimes the same way as the fallback below;
+        # OPT_NON_STR_KEYS matches json's handling of non-string keys in
+        # caller-supplied metadata
+        return orjson.dumps(
+            result,
+            default=_path_to_str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    entry = {
+        "operation_id": result.operation_id,
+        "status": result.status.value,
+        "output_uri": result.output_uri,
+        "local_path": str(result.local_path) if result.local_path else None,
+        "error_message": result.error_message,
+        "started_at": result.started_at.isoformat() if result.started_at else None,
+        "completed_at": result.completed_at.isoformat() if result.completed_at else None,
+        "metadata": result.metadata,
+    }
+    return json.dumps(entry, indent=2).encode()
+
+
 def save_generation_metadata(
     results: list[GenerationResult],
     output_path: Path,
 ) -> None:
     """Save generation metadata to a JSON file.
 
+    Operations are encoded and written one at a time, so memory use does
+    not grow with the number of results.
+
     Args:
         results: List of generation results.
         output_path: Path to save the metadata JSON.
     """
-    metadata = {
+    counts = Counter(r.status for r in results)
+    header = json.dumps({
         "generated_at": datetime.now().isoformat(),
         "total_scenes": len(results),
-        "successful": sum(1 for r in results if r.status == GenerationStatus.COMPLETED),
-        "failed": sum(1 for r in results if r.status == GenerationStatus.FAILED),
-        "operations": [
-            {
-                "operation_id": r.operation_id,
-                "status": r.status.value,
-                "output_uri": r.output_uri,
-                "local_path": str(r.local_path) if r.local_path else None,
-                "error_message": r.error_message,
-                "started_at": r.started_at.isoformat() if r.started_at else None,
-                "completed_at": r.completed_at.isoformat() if r.completed_at else None,
-                "metadata": r.metadata,
-            }
-            for r in results
-        ],
-    }
+        "successful": counts[GenerationStatus.COMPLETED],
+        "failed": counts[GenerationStatus.FAILED],
+    }, indent=2)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    with open(output_path, "wb") as f:
+        # Splice the operations list into the header object
+        f.write(header[:-2].encode() + b',\n  "operations": [')
+        for i, result in enumerate(results):
+            f.write(b",\n    " if i else b"\n    ")
+            f.write(_encode_operation(result).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]\n}\n" if results else b"]\n}\n")
 
     logger.info(f"Saved generation metadata to {output_path}")
+
+
+async def asave_generation_metadata(
+    results: list[GenerationResult],
+    output_path: Path,
+) -> None:
+    """Async variant of :func:`save_generation_metadata`.
+
+    Serialising and writing run in a worker thread so the event loop keeps
+    serving in-flight generations.
+    """
+    await asyncio.to_thread(save_generation_metadata, results, output_path)
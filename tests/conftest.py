@@ -0,0 +1,43 @@
+"""Shared test fixtures."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the on-disk caches at a per-test directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("mvg.models.manifest._CACHE_DIR", cache_dir)
+    monkeypatch.setattr("mvg.services.veo._CACHE_DIR", cache_dir / "veo")
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def sample_clips(tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+    """Two small test clips with audio, 2.0s and 1.0s long."""
+    from moviepy.config import FFMPEG_BINARY
+
+    clip_dir = tmp_path_factory.mktemp("clips")
+    clips = []
+    for name, duration in (("a", 2.0), ("b", 1.0)):
+        clip_path = clip_dir / f"{name}.mp4"
+        try:
+            subprocess.run(
+                [
+                    FFMPEG_BINARY, "-v", "error", "-y",
+                    "-f", "lavfi", "-i", f"testsrc=size=64x48:rate=30:duration={duration}",
+                    "-f", "lavfi", "-i", f"sine=frequency=440:duration={duration}",
+                    "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac",
+                    str(clip_path),
+                ],
+                check=True,
+                capture_output=True,
+                timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            pytest.skip(f"ffmpeg cannot create test clips: {e}")
+        clips.append(clip_path)
+    return clips
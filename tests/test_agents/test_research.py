@@ -0,0 +1,128 @@
+"""Tests for the research agent's response parsing."""
+
+import json
+
+import pytest
+
+from mvg.agents import research
+from mvg.agents.research import ResearchAgent, _find_json_end
+
+SCENES = {
+    "scenes": [
+        {"id": "intro", "prompt": "A sunrise over {hills} [wide]", "duration": 4},
+        {"id": "end", "prompt": "Night \"falls\"", "duration": 6, "overlay_text": "Fin"},
+    ]
+}
+
+
+@pytest.fixture
+def agent() -> ResearchAgent:
+    # Parsing never touches the client
+    return ResearchAgent(client=object(), model="test-model")
+
+
+def _extracted(agent: ResearchAgent, text: str) -> str:
+    buf = text.encode()
+    start, end = agent._extract_json(buf)
+    return buf[start:end].decode()
+
+
+class TestExtractJson:
+    def test_bare_json_with_whitespace(self, agent: ResearchAgent) -> None:
+        body = json.dumps(SCENES)
+        assert _extracted(agent, f"\n  {body}\n") == body
+
+    def test_fenced_block(self, agent: ResearchAgent) -> None:
+        body = json.dumps(SCENES)
+        text = f"Here you go:\n```json\n{body}\n```\nEnjoy!"
+        assert json.loads(_extracted(agent, text)) == SCENES
+
+    def test_object_after_prose(self, agent: ResearchAgent) -> None:
+        body = json.dumps(SCENES)
+        assert _extracted(agent, f"Sure! {body} Hope that helps.") == body
+
+    def test_offsets_are_bytes(self, agent: ResearchAgent) -> None:
+        # Multi-byte prose before and inside the JSON shifts byte offsets
+        body = json.dumps({"scenes": [{"id": "é", "prompt": "café ☕"}]}, ensure_ascii=False)
+        text = f"Voilà — {body} — merci"
+        buf = text.encode()
+        start, end = agent._extract_json(buf)
+        assert buf[start:end] == body.encode()
+
+    def test_fenced_array_without_tag(self, agent: ResearchAgent) -> None:
+        body = json.dumps(SCENES["scenes"])
+        assert json.loads(_extracted(agent, f"Scenes:\n```\n{body}\n```")) == SCENES["scenes"]
+
+    def test_no_json_returns_whole_response(self, agent: ResearchAgent) -> None:
+        buf = b"no structure here"
+        assert agent._extract_json(buf) == (0, len(buf))
+
+
+class TestFindJsonEnd:
+    def test_skips_brackets_in_strings(self) -> None:
+        buf = b'x {"a": "}]\\" {", "b": [1, {"c": 2}]} tail'
+        end = _find_json_end(buf, 2)
+        assert json.loads(buf[2:end]) == {"a": '}]" {', "b": [1, {"c": 2}]}
+
+    def test_unclosed(self) -> None:
+        assert _find_json_end(b'{"a": [1, 2}', 0) == -1
+        assert _find_json_end(b'{"a": "open', 0) == -1
+
+
+class TestParseStream:
+    def _chunked(self, text: str, size: int):
+        return iter([text[i:i + size] for i in range(0, len(text), size)])
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+    def test_matches_buffered_parse(self, agent: ResearchAgent, size: int) -> None:
+        text = json.dumps(SCENES, indent=2)
+        expected = agent._parse_response(text, 10)
+        assert agent._parse_stream(self._chunked(text, size), 10) == expected
+
+    def test_bare_array(self, agent: ResearchAgent) -> None:
+        text = json.dumps(SCENES["scenes"])
+        scenes = agent._parse_stream(self._chunked(text, 5), 10)
+        assert [scene.id for scene in scenes] == ["intro", "end"]
+
+    def test_fenced_response_falls_back(self, agent: ResearchAgent) -> None:
+        text = f"```json\n{json.dumps(SCENES)}\n```"
+        scenes = agent._parse_stream(self._chunked(text, 3), 10)
+        assert [scene.id for scene in scenes] == ["intro", "end"]
+
+    def test_malformed_stream_raises(self, agent: ResearchAgent) -> None:
+        with pytest.raises(ValueError):
+            agent._parse_stream(self._chunked('{"scenes": [{"id": ', 4), 10)
+
+    def test_without_ijson(self, agent: ResearchAgent, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(research, "ijson", None)
+        text = json.dumps(SCENES)
+        assert agent._parse_stream(self._chunked(text, 3), 10) == agent._parse_response(text, 10)
+
+
+class TestParseResponse:
+    def test_scene_fields(self, agent: ResearchAgent) -> None:
+        scenes = agent._parse_response(json.dumps(SCENES), 20)
+        assert [scene.id for scene in scenes] == ["intro", "end"]
+        assert scenes[1].prompt == 'Night "falls"'
+        assert scenes[1].overlay_text == "Fin"
+        assert scenes[0].overlay_text is None
+
+    def test_durations_scaled_to_target(self, agent: ResearchAgent) -> None:
+        scenes = agent._parse_response(json.dumps(SCENES), 20)
+        assert [scene.duration for scene in scenes] == [8.0, 12.0]
+        assert sum(scene.duration for scene in scenes) == pytest.approx(20)
+
+    def test_null_prompt_stays_none(self, agent: ResearchAgent) -> None:
+        body = {"scenes": [{"id": "a", "prompt": None, "duration": 5}, {"duration": 5}]}
+        scenes = agent._parse_response(json.dumps(body), 10)
+        assert scenes[0].prompt is None
+        assert scenes[1].prompt == ""
+        assert scenes[1].id == "scene_2"
+
+    def test_invalid_json(self, agent: ResearchAgent) -> None:
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            agent._parse_response('{"scenes": [}', 10)
+
+    def test_missing_scenes_array(self, agent: ResearchAgent) -> None:
+        with pytest.raises(ValueError, match="scenes array"):
+            agent._parse_response('{"scenes": 3}', 10)
@@ -0,0 +1,50 @@
+"""Tests for ffmpeg-based joining and crossfades."""
+
+from pathlib import Path
+
+import pytest
+
+from mvg.editor.ffmpeg import _crossfade_filters, clip_starts, render_clips
+from mvg.editor.probe import probe
+
+
+def test_clip_starts() -> None:
+    assert clip_starts([2.0, 1.0, 3.5]) == [0.0, 2.0, 3.0, 6.5]
+    assert clip_starts([4.0]) == [0.0, 4.0]
+
+
+class TestCrossfadeFilters:
+    def test_length_matches_clips(self) -> None:
+        durations = [2.0, 1.0, 3.5]
+        *_, length = _crossfade_filters(durations, 0.5, with_audio=True)
+        assert length == pytest.approx(sum(durations))
+        assert length == pytest.approx(clip_starts(durations)[-1])
+
+    def test_fades_start_where_clips_end(self) -> None:
+        filters, video, audio, _ = _crossfade_filters([2.0, 1.0, 3.5], 0.5, with_audio=False)
+        xfades = [f for f in filters if "xfade" in f]
+        assert [f.split("offset=")[1].split("[")[0] for f in xfades] == ["2.000", "3.000"]
+        assert video == "x2"
+        assert audio is None
+        assert not any("apad" in f or "acrossfade" in f for f in filters)
+
+    def test_only_outgoing_clips_padded(self) -> None:
+        filters, _, audio, _ = _crossfade_filters([2.0, 1.0, 3.5], 0.5, with_audio=True)
+        assert [f for f in filters if "tpad" in f] == [
+            "[0:v]tpad=stop_mode=clone:stop_duration=0.500[p0]",
+            "[1:v]tpad=stop_mode=clone:stop_duration=0.500[p1]",
+        ]
+        assert sum("apad" in f for f in filters) == 2
+        assert filters[-1] == "[a1][2:a]acrossfade=d=0.500[a2]"
+        assert audio == "a2"
+
+
+@pytest.mark.parametrize("transition", [0.0, 0.5])
+def test_render_keeps_timeline_length(
+    sample_clips: list[Path], tmp_path: Path, transition: float
+) -> None:
+    output = render_clips(
+        sample_clips, tmp_path / "out.mp4", transition=transition, preset="ultrafast"
+    )
+    expected = sum(probe(clip).duration for clip in sample_clips)
+    assert probe(output).duration == pytest.approx(expected, abs=0.1)
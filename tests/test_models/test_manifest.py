@@ -0,0 +1,95 @@
+"""Tests for manifest loading and its JSON cache."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from mvg.models import manifest as manifest_module
+from mvg.models.manifest import Manifest
+
+MANIFEST_YAML = """\
+project_name: demo
+audio_file: music.mp3
+aspect_ratio: "16:9"
+scenes:
+  - id: intro
+    prompt: A sunrise
+    duration: 4
+    overlay_text: Hello
+  - id: outro
+    duration: 2.5
+    file: clips/outro.mp4
+"""
+
+
+@pytest.fixture
+def manifest_path(tmp_path: Path) -> Path:
+    path = tmp_path / "script.yaml"
+    path.write_text(MANIFEST_YAML)
+    return path
+
+
+def _cache_files(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.glob("*.json")) if cache_dir.exists() else []
+
+
+def test_round_trip_matches_validated(manifest_path: Path, isolated_caches: Path) -> None:
+    expected = Manifest.model_validate(yaml.safe_load(MANIFEST_YAML))
+
+    first = Manifest.from_yaml(manifest_path)
+    assert len(_cache_files(isolated_caches)) == 1
+    cached = Manifest.from_yaml(manifest_path)
+
+    assert first == expected
+    assert cached == expected
+    assert cached.scenes[1].prompt is None
+    assert cached.scenes[1].duration == 2.5
+
+
+def test_cache_hit_skips_yaml(
+    manifest_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    Manifest.from_yaml(manifest_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed on a cache hit")
+
+    monkeypatch.setattr(manifest_module.yaml, "load", fail)
+    assert Manifest.from_yaml(manifest_path).project_name == "demo"
+
+
+def test_edit_invalidates(manifest_path: Path, isolated_caches: Path) -> None:
+    Manifest.from_yaml(manifest_path)
+    manifest_path.write_text(MANIFEST_YAML.replace("project_name: demo", "project_name: edited"))
+
+    assert Manifest.from_yaml(manifest_path).project_name == "edited"
+    assert len(_cache_files(isolated_caches)) == 2
+
+
+def test_format_version_invalidates(
+    manifest_path: Path, isolated_caches: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    Manifest.from_yaml(manifest_path)
+    monkeypatch.setattr(manifest_module, "_CACHE_FORMAT", b"test")
+    Manifest.from_yaml(manifest_path)
+    assert len(_cache_files(isolated_caches)) == 2
+
+
+def test_corrupt_cache_rebuilt(manifest_path: Path, isolated_caches: Path) -> None:
+    Manifest.from_yaml(manifest_path)
+    (cache,) = _cache_files(isolated_caches)
+    cache.write_text("{not json")
+
+    assert Manifest.from_yaml(manifest_path).scenes[0].id == "intro"
+    assert Manifest.from_json_cache(cache).scenes[0].id == "intro"
+
+
+def test_unwritable_cache_dir(
+    manifest_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A file where the cache directory should be
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(manifest_module, "_CACHE_DIR", blocker / "cache")
+    assert Manifest.from_yaml(manifest_path).project_name == "demo"
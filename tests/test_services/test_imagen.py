@@ -0,0 +1,56 @@
+"""Tests for streamed Imagen response decoding."""
+
+import base64
+import io
+import json
+
+import pytest
+
+from mvg.services.imagen import _Base64Streamer
+
+IMAGE = bytes(range(256)) * 3 + b"tail"
+
+
+def _feed(body: bytes, size: int) -> _Base64Streamer:
+    streamer = _Base64Streamer(io.BytesIO())
+    for i in range(0, len(body), size):
+        streamer.feed(body[i:i + size])
+    return streamer
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 19, 20, 21, 64, 100_000])
+def test_decodes_across_chunk_boundaries(size: int) -> None:
+    body = json.dumps({
+        "predictions": [{
+            "mimeType": "image/png",
+            "bytesBase64Encoded": base64.b64encode(IMAGE).decode(),
+        }]
+    }).encode()
+    streamer = _feed(body, size)
+    assert streamer.done
+    assert streamer._out.getvalue() == IMAGE
+
+
+@pytest.mark.parametrize("size", [1, 3, 7])
+def test_escaped_slashes_and_spacing(size: int) -> None:
+    # JSON encoders may escape "/" as "\/" and pad around the colon
+    encoded = base64.b64encode(IMAGE).decode().replace("/", "\\/")
+    body = f'{{"bytesBase64Encoded" :  "{encoded}"}}'.encode()
+    streamer = _feed(body, size)
+    assert streamer._out.getvalue() == IMAGE
+
+
+def test_only_first_value_is_decoded() -> None:
+    first = base64.b64encode(b"first").decode()
+    second = base64.b64encode(b"second").decode()
+    body = json.dumps({
+        "predictions": [{"bytesBase64Encoded": first}, {"bytesBase64Encoded": second}]
+    }).encode()
+    streamer = _feed(body, 4)
+    assert streamer._out.getvalue() == b"first"
+
+
+def test_missing_value_writes_nothing() -> None:
+    streamer = _feed(b'{"predictions": []}', 3)
+    assert not streamer.done
+    assert streamer._out.getvalue() == b""
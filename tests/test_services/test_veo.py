@@ -0,0 +1,221 @@
+"""Tests for the Veo client's cache, metadata and poll handling."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from mvg.services import veo
+from mvg.services.veo import GenerationResult, GenerationStatus, VeoClient, save_generation_metadata
+
+
+@pytest.fixture
+def client() -> VeoClient:
+    # Skip __init__, which needs Google Cloud credentials
+    client = VeoClient.__new__(VeoClient)
+    client._model = "veo-test"
+    client._remote_cache = False
+    client._debug_save_responses = False
+    return client
+
+
+def _completed(local_path: Path) -> GenerationResult:
+    return GenerationResult(
+        operation_id="op-1",
+        status=GenerationStatus.COMPLETED,
+        local_path=local_path,
+        completed_at=datetime(2024, 1, 1, 12, 0),
+    )
+
+
+class TestCacheKey:
+    def test_stable(self, client: VeoClient) -> None:
+        args = ("a prompt", 8.0, "16:9", None)
+        assert client._cache_key(*args) == client._cache_key(*args)
+
+    def test_prompt_whitespace_ignored(self, client: VeoClient) -> None:
+        assert client._cache_key("a prompt", 8.0, "16:9", None) == client._cache_key(
+            "  a prompt\n", 8.0, "16:9", None
+        )
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("other prompt", 8.0, "16:9", None),
+            ("a prompt", 6.0, "16:9", None),
+            ("a prompt", 8.0, "9:16", None),
+            ("a prompt", 8.0, "16:9", "aW1hZ2U="),
+        ],
+    )
+    def test_each_field_changes_key(self, client: VeoClient, args: tuple) -> None:
+        assert client._cache_key(*args) != client._cache_key("a prompt", 8.0, "16:9", None)
+
+    def test_model_changes_key(self, client: VeoClient) -> None:
+        key = client._cache_key("a prompt", 8.0, "16:9", None)
+        client._model = "veo-other"
+        assert client._cache_key("a prompt", 8.0, "16:9", None) != key
+
+
+class TestLocalCache:
+    def test_hit_copies_to_new_output(self, client: VeoClient, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        client._store_local_cache("key", _completed(clip))
+
+        output = tmp_path / "out" / "scene_b.mp4"
+        result = client._cached_result("key", output, "b")
+        assert result is not None
+        assert result.status == GenerationStatus.COMPLETED
+        assert result.operation_id == "op-1"
+        assert result.metadata == {"scene_id": "b", "cache_hit": True}
+        assert output.read_bytes() == b"video"
+
+    def test_unknown_key_misses(self, client: VeoClient, tmp_path: Path) -> None:
+        assert client._cached_result("nope", tmp_path / "x.mp4", None) is None
+
+    def test_missing_file_misses(self, client: VeoClient, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        client._store_local_cache("key", _completed(clip))
+        clip.unlink()
+        assert client._cached_result("key", clip, "a") is None
+
+    def test_overwritten_file_misses(self, client: VeoClient, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        client._store_local_cache("key", _completed(clip))
+
+        # A later run for another prompt writes the same output path
+        clip.write_bytes(b"another video")
+        assert client._cached_result("key", clip, "a") is None
+
+    def test_touched_file_misses(self, client: VeoClient, tmp_path: Path) -> None:
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        client._store_local_cache("key", _completed(clip))
+
+        stat = clip.stat()
+        os.utime(clip, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert client._cached_result("key", clip, "a") is None
+
+    def test_legacy_entry_misses(
+        self, client: VeoClient, tmp_path: Path, isolated_caches: Path
+    ) -> None:
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        entry = isolated_caches / "veo" / "key.json"
+        entry.parent.mkdir(parents=True)
+        entry.write_text(json.dumps({"local_path": str(clip), "operation_id": "op-1"}))
+        assert client._cached_result("key", clip, "a") is None
+
+    def test_corrupt_entry_misses(
+        self, client: VeoClient, tmp_path: Path, isolated_caches: Path
+    ) -> None:
+        entry = isolated_caches / "veo" / "key.json"
+        entry.parent.mkdir(parents=True)
+        entry.write_bytes(b"{not json")
+        assert client._cached_result("key", tmp_path / "x.mp4", None) is None
+
+    def test_unwritable_cache_dir(
+        self, client: VeoClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        monkeypatch.setattr(veo, "_CACHE_DIR", blocker / "veo")
+        clip = tmp_path / "scene_a.mp4"
+        clip.write_bytes(b"video")
+        client._store_local_cache("key", _completed(clip))
+        assert client._cached_result("key", clip, "a") is None
+
+
+class TestSaveGenerationMetadata:
+    @pytest.fixture(params=["orjson", "json"])
+    def encoder(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+        if request.param == "json":
+            monkeypatch.setattr(veo, "orjson", None)
+        elif veo.orjson is None:
+            pytest.skip("orjson not installed")
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_valid_json(self, encoder: None, tmp_path: Path, count: int) -> None:
+        results = [
+            GenerationResult(
+                operation_id=f"op-{i}",
+                status=GenerationStatus.COMPLETED if i % 2 == 0 else GenerationStatus.FAILED,
+                local_path=tmp_path / f"scene_{i}.mp4",
+                error_message=None if i % 2 == 0 else "boom\n\"quoted\"",
+                started_at=datetime(2024, 1, 1, 12, 0),
+                metadata={"scene_id": f"s{i}", "prompt": "line one\nline two ☕"},
+            )
+            for i in range(count)
+        ]
+        path = tmp_path / "meta" / "generation_metadata.json"
+        save_generation_metadata(results, path)
+
+        data = json.loads(path.read_text())
+        assert data["total_scenes"] == count
+        assert data["successful"] == (count + 1) // 2
+        assert data["failed"] == count // 2
+        assert [op["operation_id"] for op in data["operations"]] == [
+            f"op-{i}" for i in range(count)
+        ]
+        for i, op in enumerate(data["operations"]):
+            assert op["local_path"] == str(tmp_path / f"scene_{i}.mp4")
+            assert op["started_at"] == "2024-01-01T12:00:00"
+            assert op["metadata"]["prompt"] == "line one\nline two ☕"
+            assert "_video_b64" not in op
+
+
+class TestApplyPollResponse:
+    def _apply(self, client: VeoClient, raw: bytes) -> tuple[bool, GenerationResult]:
+        result = GenerationResult(operation_id="op", status=GenerationStatus.STARTED)
+        return client._apply_poll_response(raw, "operations/op", result), result
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"name": "operations/op"}',
+            b'{"name": "operations/op", "done": false}',
+            b'{"name": "operations/op", "done" :\n  false}',
+            b'{"name": "operations/op", "metadata": {"done": true}}',
+            b'{"name": "operations/op", "done": false, "metadata": {"done": true}}',
+        ],
+    )
+    def test_running(self, client: VeoClient, raw: bytes) -> None:
+        done, result = self._apply(client, raw)
+        assert not done
+        assert result.status == GenerationStatus.PROCESSING
+
+    def test_progress_recorded(self, client: VeoClient) -> None:
+        _, result = self._apply(client, b'{"metadata": {"progressPercent": 42}}')
+        assert result.metadata["progress_percent"] == 42
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"done": true, "response": {"videos": [{"gcsUri": "gs://b/v.mp4"}]}}',
+            b'{"done":true,"response":{"videos":[{"gcsUri":"gs://b/v.mp4"}]}}',
+            b'{"done" : true, "response": {"videos": [{"gcsUri": "gs://b/v.mp4"}]}}',
+            b'{"done":\n  true, "response": {"videos": [{"gcsUri": "gs://b/v.mp4"}]}}',
+        ],
+    )
+    def test_completed(self, client: VeoClient, raw: bytes) -> None:
+        done, result = self._apply(client, raw)
+        assert done
+        assert result.status == GenerationStatus.COMPLETED
+        assert result.output_uri == "gs://b/v.mp4"
+
+    def test_inline_video(self, client: VeoClient) -> None:
+        raw = b'{"done": true, "response": {"videos": [{"bytesBase64Encoded": "AAAA"}]}}'
+        done, result = self._apply(client, raw)
+        assert done
+        assert result._video_b64 == "AAAA"
+        assert result.metadata["mime_type"] == "video/mp4"
+
+    def test_failed(self, client: VeoClient) -> None:
+        done, result = self._apply(client, b'{"done": true, "error": {"message": "quota"}}')
+        assert done
+        assert result.status == GenerationStatus.FAILED
+        assert result.error_message == "quota"